@@ -0,0 +1,175 @@
+"""
+Benchmark: ARB rule engine throughput as the number of rules grows
+
+Parses a synthetic repository once, then checks every tree with rulesets of
+increasing size. Synthetic rules are variations of the four ast_patterns
+types (assignment, route_decorator, call, missing_error_handling). Each
+ruleset is checked by the node-type-indexed engine and by a naive engine
+that offers every node to every pattern, and both must report the same
+violations. ARB-SEC-015 from rules.yaml must flag only the real routes of
+a fixture that also holds @mock.patch tests.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_arb_rules [--files 200] [--file-kb 32]
+"""
+
+import argparse
+import ast
+import random
+import time
+from typing import Any, Dict, List
+
+from intelligentscan.benchmarks.bench_parallel_scan import build_module
+from intelligentscan.scanners.arb_rule_engine import ARBRuleEngine, FileContext, FUNCTION_NODES, TRY_NODES
+from intelligentscan.utils.config_loader import load_rules_config
+
+
+RULE_COUNTS = [4, 16, 64, 256]
+
+# Route handlers and look-alike decorators; ARB-SEC-015 must flag exactly the
+# functions named open_*
+ROUTE_FIXTURE = """
+import unittest
+import unittest.mock
+from unittest import mock as m
+from unittest import mock
+
+@app.route("/items")
+def open_items(): pass
+
+@router.get(path="/items/{item_id}")
+async def open_item(item_id): pass
+
+@app.patch("/items/{item_id}")
+def open_patch_item(item_id): pass
+
+@app.post("/login")
+@auth_required
+def login(): pass
+
+@mock.patch("os.getcwd")
+def test_getcwd(getcwd): pass
+
+@unittest.mock.patch("os.listdir")
+def test_listdir(listdir): pass
+
+@m.patch.object(unittest.TestCase, "run")
+def test_run(run): pass
+
+@mock.patch("/tmp/looks/like/a/path")
+def test_path_like(target): pass
+
+@cache.get(key)
+def cached(): pass
+"""
+
+
+def synthetic_rules(count: int) -> Dict[str, Dict[str, Any]]:
+    """Build count ARB rules cycling through the supported pattern types"""
+    rules = {}
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            spec = {"type": "assignment", "variable_names": [f"secret_{index}", "password"], "value_type": "string_literal"}
+        elif kind == 1:
+            spec = {"type": "route_decorator", "missing_decorator": [f"auth_{index}"]}
+        elif kind == 2:
+            spec = {"type": "call", "function_names": [f"driver_{index}.connect", "os.system"]}
+        else:
+            spec = {"type": "missing_error_handling", "min_statements": 3 + index % 5}
+
+        rules[f"ARB-BENCH-{index:03d}"] = {
+            "title": f"Synthetic rule {index}",
+            "category": ["security", "performance", "architecture", "code_quality"][kind],
+            "severity": "medium",
+            "pattern_matching": {"ast_patterns": [spec]},
+        }
+    return rules
+
+
+class NaiveEngine(ARBRuleEngine):
+    """Reference engine that tries every pattern on every node"""
+
+    def check_tree(self, tree: ast.AST, rel_path: str) -> List[Dict[str, Any]]:
+        ctx = FileContext(rel_path)
+        self._visit(tree, ctx)
+        ctx.violations.sort(key=lambda violation: violation["line"])
+        return ctx.violations
+
+    def _visit(self, node: ast.AST, ctx: FileContext):
+        if isinstance(node, FUNCTION_NODES):
+            ctx.functions.append([False])
+        elif isinstance(node, TRY_NODES) and ctx.functions:
+            ctx.functions[-1][0] = True
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            self._record_imports(node, ctx)
+
+        for pattern in self.patterns:
+            if isinstance(node, pattern.ENTER_TYPES):
+                pattern.enter(node, ctx)
+
+        for child in ast.iter_child_nodes(node):
+            self._visit(child, ctx)
+
+        for pattern in self.patterns:
+            if isinstance(node, pattern.LEAVE_TYPES):
+                pattern.leave(node, ctx)
+        if isinstance(node, FUNCTION_NODES):
+            ctx.functions.pop()
+
+
+def check_route_decorators():
+    """ARB-SEC-015 flags route handlers but not mock.patch or other look-alikes"""
+    rule_id = "ARB-SEC-015"
+    rules = {rule_id: load_rules_config()["arb_rules"][rule_id]}
+    violations = ARBRuleEngine(rules).check_tree(ast.parse(ROUTE_FIXTURE), "routes.py")
+    flagged = sorted(violation["description"].split("'")[1] for violation in violations)
+    expected = ["open_item", "open_items", "open_patch_item"]
+    if flagged != expected:
+        raise SystemExit(f"FAIL: {rule_id} flagged {flagged}, expected {expected}")
+    print(f"{rule_id}: {len(flagged)} route handlers flagged, mock.patch tests ignored\n")
+
+
+def run(engine: ARBRuleEngine, trees) -> tuple:
+    """Check every tree; return (seconds, violations)"""
+    started = time.perf_counter()
+    violations = []
+    for rel_path, tree in trees:
+        violations.extend(engine.check_tree(tree, rel_path))
+    return time.perf_counter() - started, violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200, help="Number of synthetic files")
+    parser.add_argument("--file-kb", type=int, default=32, help="Size of each file in KB")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    trees = [
+        (f"module_{index:05d}.py", ast.parse(build_module(rng, args.file_kb * 1024)))
+        for index in range(args.files)
+    ]
+
+    check_route_decorators()
+
+    print("=== ARB Rule Engine Throughput ===")
+    print(f"{args.files} files x {args.file_kb} KB (parsed once, not timed)\n")
+    print(f"{'rules':>6} {'indexed':>12} {'naive':>12}  violations")
+
+    for rule_count in RULE_COUNTS:
+        rules = synthetic_rules(rule_count)
+        indexed_seconds, indexed = run(ARBRuleEngine(rules), trees)
+        naive_seconds, naive = run(NaiveEngine(rules), trees)
+
+        if indexed != naive:
+            raise SystemExit(f"{rule_count} rules: indexed and naive engines disagree")
+
+        print(
+            f"{rule_count:>6} {args.files / indexed_seconds:8.0f} f/s {args.files / naive_seconds:8.0f} f/s"
+            f"  {len(indexed)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: single-pass cyclomatic complexity on deeply nested functions
+
+Builds a pathological Python file of functions nested --depth levels deep,
+each with a few branches, and compares PythonASTAnalyzer against the original
+approach of re-walking every function body with ast.walk (quadratic in the
+nesting depth).
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_ast_complexity [--depth 90] [--branches 20]
+"""
+
+import argparse
+import ast
+import sys
+import time
+
+from intelligentscan.scanners.ast_analyzer import PythonASTAnalyzer
+
+
+DEPTHS = [10, 25, 50, 90]
+
+# Python's tokenizer allows at most 100 indentation levels
+MAX_DEPTH = 98
+
+
+def build_nested_source(depth: int, branches: int) -> str:
+    """Build functions nested depth levels deep, each with `branches` if statements"""
+    lines = []
+    for level in range(depth):
+        indent = "    " * level
+        lines.append(f"{indent}def level_{level}(value):")
+        lines.append(f'{indent}    """Level {level}"""')
+        for branch in range(branches):
+            lines.append(f"{indent}    if value == {branch}:")
+            lines.append(f"{indent}        value += 1")
+    lines.append("    " * depth + "return value")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_complexities(tree: ast.AST) -> list:
+    """The original per-function ast.walk complexity, for comparison"""
+    results = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            complexity = 1
+            for child in ast.walk(node):
+                if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
+                    complexity += 1
+                elif isinstance(child, ast.BoolOp):
+                    complexity += len(child.values) - 1
+            results.append(complexity)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depth", type=int, default=90, help=f"Deepest nesting level to measure (max {MAX_DEPTH})")
+    parser.add_argument("--branches", type=int, default=20, help="if statements per function")
+    args = parser.parse_args()
+    args.depth = min(args.depth, MAX_DEPTH)
+
+    # The visitor recurses a few frames per nesting level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.depth * 20))
+
+    print("=== Cyclomatic Complexity Benchmark ===")
+    print(f"{'depth':>6} {'legacy walk':>12} {'visitor':>10} {'speedup':>8}")
+
+    for depth in sorted(set(DEPTHS + [args.depth])):
+        if depth > args.depth:
+            continue
+
+        source = build_nested_source(depth, args.branches)
+        tree = ast.parse(source)
+
+        started = time.perf_counter()
+        legacy = legacy_complexities(tree)
+        legacy_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        analyzer = PythonASTAnalyzer("nested.py", source)
+        analyzer.visit(tree)
+        visitor_seconds = time.perf_counter() - started
+
+        # Same decision points in this file, so the outermost complexity must agree
+        reported = [v for v in analyzer.violations if v.violation_type == "high_complexity"]
+        if reported and f"({legacy[0]})" not in reported[0].description:
+            raise SystemExit(f"complexity mismatch at depth {depth}")
+
+        print(f"{depth:>6} {legacy_seconds:>11.3f}s {visitor_seconds:>9.3f}s {legacy_seconds / visitor_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
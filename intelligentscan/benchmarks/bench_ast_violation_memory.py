@@ -0,0 +1,93 @@
+"""
+Memory benchmark: compact ASTViolation records vs eagerly stored snippets
+
+Writes a large Python file dense in single-letter names (one poor_naming
+violation per binding), analyzes it with analyze_file_ast, and measures with
+tracemalloc the memory retained by the violations. The "before" figure
+rebuilds the same violations the way they used to be stored: a regular
+dataclass holding its own copy of a 5-line code snippet.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_ast_violation_memory [--functions 5000]
+"""
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from intelligentscan.scanners.ast_analyzer import analyze_file_ast
+
+
+FUNCTION_TEMPLATE = '''
+def compute_{index}(a, b, c):
+    """Combine three values"""
+    d = a + b
+    e = d * c
+    f = e - a
+    g = f + d
+    return g
+'''
+
+
+@dataclass
+class EagerViolation:
+    """The previous ASTViolation layout: a dict-backed dataclass with its own snippet"""
+    file_path: str
+    line_number: int
+    violation_type: str
+    description: str
+    severity: str
+    code_snippet: str
+    function_name: Optional[str] = None
+    class_name: Optional[str] = None
+    reference_count: Optional[int] = None
+
+
+def to_eager(violation) -> EagerViolation:
+    """Rebuild a violation the old way: snippet rendered up front, description formatted per violation"""
+    fields = violation.to_dict(include_snippet=True)
+    fields["description"] = fields["description"].encode("utf-8").decode("utf-8")
+    return EagerViolation(**fields)
+
+
+def retained_bytes(build) -> tuple:
+    """Run build() and return (its result, bytes still allocated afterwards)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=5000, help="Functions in the synthetic file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "dense.py"
+        path.write_text("".join(FUNCTION_TEMPLATE.format(index=index) for index in range(args.functions)))
+
+        eager, eager_bytes = retained_bytes(lambda: [to_eager(violation) for violation in analyze_file_ast(str(path))])
+
+        compact, compact_bytes = retained_bytes(lambda: analyze_file_ast(str(path)))
+
+        # Rendering on demand must give the same snippets
+        if [violation.code_snippet for violation in compact] != [violation.code_snippet for violation in eager]:
+            raise SystemExit("snippets differ")
+
+    print("=== ASTViolation Memory ===")
+    print(f"Violations      : {len(compact)}")
+    print(f"Eager (before)  : {eager_bytes / 1024 / 1024:7.2f} MB  ({eager_bytes / len(compact):.0f} B/violation)")
+    print(f"Compact (after) : {compact_bytes / 1024 / 1024:7.2f} MB  ({compact_bytes / len(compact):.0f} B/violation)")
+    print(f"Reduction       : {eager_bytes / compact_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Stress check: concurrent scan tool calls never lose a session
+
+Fires --calls concurrent tool calls (a mix of scan_vulnerabilities,
+check_arb_compliance, scan_ai_readiness and start_scan) at the server through
+an in-memory MCP client, waits for the background scans, then checks that
+every call got its own scan ID and that every session, with its results and
+findings, can be read back. Exits non-zero on any lost or mixed-up session.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_concurrent_sessions [--calls 1000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from fastmcp import Client
+
+from intelligentscan.server import main as server
+from intelligentscan.utils.pagination import FINDING_LISTS
+from intelligentscan.utils.session_store import SessionStore
+
+
+# (tool, extra arguments, scan type of the session it creates)
+CALLS = [
+    ("scan_vulnerabilities", {}, "vulnerability"),
+    ("check_arb_compliance", {}, "arb_compliance"),
+    ("scan_ai_readiness", {}, "ai_readiness"),
+    ("start_scan", {"scan_type": "vulnerability"}, "vulnerability"),
+]
+
+MODULE = '''
+password = "hunter{index}"
+
+
+def handler_{index}(request):
+    return request
+'''
+
+
+async def call(client: Client, tool: str, arguments: dict) -> dict:
+    """Call a tool and decode its JSON response"""
+    result = await client.call_tool(tool, arguments)
+    return json.loads(result.content[0].text)
+
+
+async def stress(repo_path: str, call_count: int) -> list:
+    """Fire every call at once and check what the server kept"""
+    failures = []
+
+    async with Client(server.mcp) as client:
+        calls = [CALLS[index % len(CALLS)] for index in range(call_count)]
+        responses = await asyncio.gather(*(
+            call(client, tool, {"repo_path": repo_path, **arguments}) for tool, arguments, _ in calls
+        ))
+
+        scan_ids = [response.get("scan_id") for response in responses]
+        if None in scan_ids:
+            failures.append(f"{scan_ids.count(None)} calls returned no scan ID")
+        if len(set(scan_ids)) != len(scan_ids):
+            failures.append(f"{len(scan_ids) - len(set(scan_ids))} scan IDs were handed out twice")
+
+        for (tool, _, scan_type), response in zip(calls, responses):
+            scan_id = response.get("scan_id")
+            if scan_id is None:
+                continue
+
+            status = await call(client, "get_scan_status", {"scan_id": scan_id})
+            while status.get("status") == "running":
+                await asyncio.sleep(0.05)
+                status = await call(client, "get_scan_status", {"scan_id": scan_id})
+
+            session = server.session_store.get(scan_id)
+            if session is None:
+                failures.append(f"{scan_id}: session lost")
+            elif status.get("status") != "completed" or list(session.results) != [scan_type]:
+                failures.append(f"{scan_id}: status {status.get('status')}, results {list(session.results)}")
+            else:
+                stored = session.results[scan_type][FINDING_LISTS[scan_type]]
+                page = await call(client, "get_findings", {"scan_id": scan_id, "page_size": 1000})
+                if page.get("total_findings") != len(stored) or page.get("next_cursor") is not None:
+                    failures.append(f"{scan_id}: get_findings returned {page}")
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000, help="Number of concurrent tool calls")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the synthetic files and sessions out of the user's cache
+        os.environ["INTELLIGENTSCAN_CACHE_DIR"] = cache_dir
+        server.session_store = SessionStore.from_settings(server.ScanSession.from_record)
+        for index in range(4):
+            (Path(temp_dir) / f"module_{index}.py").write_text(MODULE.format(index=index))
+
+        started = time.perf_counter()
+        failures = asyncio.run(stress(temp_dir, args.calls))
+        seconds = time.perf_counter() - started
+        store_stats = server.session_store.memory_stats()
+
+    print("=== Concurrent Sessions ===")
+    print(f"Tool calls        : {args.calls} concurrent, finished in {seconds:.1f}s")
+    print(f"Sessions stored   : {store_stats['sessions_stored']}")
+
+    for failure in failures[:20]:
+        print(f"  {failure}")
+    if failures or store_stats["sessions_stored"] != args.calls:
+        raise SystemExit(f"FAIL: {len(failures)} problems")
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
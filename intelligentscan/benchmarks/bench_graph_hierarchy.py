@@ -0,0 +1,94 @@
+"""
+Benchmark: level-of-detail knowledge graph queries at scale
+
+Aggregates --findings synthetic vulnerability findings into the directory
+hierarchy and times the queries graph://knowledge-graph/{scan_id} serves
+(root tree, expanding one directory, top-N hottest files), reporting the
+size of each response next to the size of the one-node-per-finding
+graph_json_v1 graph. Exits non-zero if the histograms do not add up or the
+hotspots differ from a brute-force ranking.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_graph_hierarchy [--findings 500000]
+"""
+
+import argparse
+import json
+import random
+import time
+from collections import defaultdict
+
+from intelligentscan.utils.graph_hierarchy import SEVERITY_LEVELS, build_hierarchy
+from intelligentscan.utils.knowledge_graph import KnowledgeGraphBuilder
+
+
+FINDINGS_PER_FILE = 25
+FILES_PER_DIRECTORY = 40
+DIRECTORIES_PER_PACKAGE = 10
+
+
+def synthetic_findings(finding_count: int) -> list:
+    """Vulnerability findings spread over a three-level directory tree"""
+    rng = random.Random(9)
+    findings = []
+    for index in range(finding_count):
+        file_index = index // FINDINGS_PER_FILE
+        directory = file_index // FILES_PER_DIRECTORY
+        package = directory // DIRECTORIES_PER_PACKAGE
+        findings.append({
+            "type": "hardcoded_secret",
+            "description": "Hardcoded secret",
+            "severity": rng.choices(SEVERITY_LEVELS[:4], weights=(1, 4, 10, 20))[0],
+            "file": f"src/package_{package}/module_{directory}/file_{file_index}.py",
+            "line": rng.randrange(1, 2000),
+        })
+    return findings
+
+
+def timed(label: str, function):
+    """Run function, print its duration and response size, and return its result"""
+    started = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - started
+    size_kb = len(json.dumps(result)) / 1024
+    print(f"  {label:<30} {seconds * 1000:9.1f} ms {size_kb:10.1f} KB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=500000, help="Number of findings")
+    parser.add_argument("--top", type=int, default=20, help="Hotspot files to list")
+    args = parser.parse_args()
+
+    findings = synthetic_findings(args.findings)
+    print("=== Graph Hierarchy ===")
+    print(f"{args.findings} findings in {(args.findings + FINDINGS_PER_FILE - 1) // FINDINGS_PER_FILE} files\n")
+    print(f"  {'query':<30} {'time':>12} {'response':>13}")
+
+    started = time.perf_counter()
+    hierarchy = build_hierarchy([findings], "repo")
+    print(f"  {'build hierarchy':<30} {(time.perf_counter() - started) * 1000:9.1f} ms "
+          f"{hierarchy.node_count:>8} nodes")
+
+    root = timed("tree: root, depth 2", lambda: hierarchy.expand("", 2))
+    timed("tree: src/package_0, depth 1", lambda: hierarchy.expand("src/package_0", 1))
+    hotspots = timed(f"hotspots: top {args.top}", lambda: hierarchy.hottest_files(args.top))
+    timed("full graph_json_v1 (before)", lambda: KnowledgeGraphBuilder().build_from_scan_results(
+        {"vulnerabilities_found": findings}
+    ))
+
+    # The histograms must account for every finding, and the hotspots must match a brute-force ranking
+    if root["findings"] != len(findings) or sum(root["severity"].values()) != len(findings):
+        raise SystemExit("FAIL: root histogram does not add up to the findings")
+    per_file = defaultdict(lambda: [0] * len(SEVERITY_LEVELS))
+    for finding in findings:
+        per_file[finding["file"]][SEVERITY_LEVELS.index(finding["severity"])] += 1
+    expected = sorted(sorted(per_file), key=lambda path: per_file[path], reverse=True)[:args.top]
+    if [item["path"] for item in hotspots] != expected:
+        raise SystemExit("FAIL: hotspots differ from the brute-force ranking")
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark: merging scans into a unified knowledge graph of 1M nodes
+
+Merges a vulnerability scan with --findings synthetic findings (about one
+node per finding) into a unified graph, then times merging an ARB scan and
+an AI-readiness scan of the same files into it, replacing the ARB scan with
+a newer one, and rebuilding the whole graph from scratch for comparison.
+Before that, a small run checks that merging and replacing give the same
+graph as building the final combination from scratch; exits non-zero if not.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_graph_merge [--findings 960000]
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+from collections import Counter
+from typing import Any, Dict
+
+from intelligentscan.utils.knowledge_graph import KnowledgeGraphBuilder
+
+
+SEVERITIES = ["critical", "high", "medium", "low"]
+FINDINGS_PER_FILE = 25
+CATEGORIES = ["security", "performance", "maintainability"]
+
+
+def file_path(index: int) -> str:
+    return f"src/package_{index // 200}/module_{index}.py"
+
+
+def vulnerability_results(rng: random.Random, finding_count: int) -> Dict[str, Any]:
+    return {"vulnerabilities_found": [
+        {
+            "type": "hardcoded_secret",
+            "description": "Hardcoded secret",
+            "severity": rng.choice(SEVERITIES),
+            "file": file_path(index // FINDINGS_PER_FILE),
+            "line": rng.randrange(1, 2000),
+            "remediation": "Move the secret to a vault",
+        }
+        for index in range(finding_count)
+    ]}
+
+
+def arb_results(rng: random.Random, file_count: int, violation_count: int) -> Dict[str, Any]:
+    by_category = {category: [] for category in CATEGORIES}
+    for _ in range(violation_count):
+        category = rng.choice(CATEGORIES)
+        by_category[category].append({
+            "rule_id": f"ARB-{category[:3].upper()}-00{rng.randrange(1, 6)}",
+            "rule_title": "Rule",
+            "file": file_path(rng.randrange(file_count)),
+            "line": rng.randrange(1, 2000),
+            "description": "Violation",
+        })
+    return {
+        "compliance_score": 60,
+        "violations_found": [v for violations in by_category.values() for v in violations],
+        "violations_by_category": by_category,
+    }
+
+
+def readiness_results(rng: random.Random, file_count: int, area_count: int) -> Dict[str, Any]:
+    return {
+        "ai_readiness_score": 71.5,
+        "low_confidence_areas": [
+            {
+                "file": file_path(index),
+                "confidence": round(rng.random() * 0.7, 2),
+                "issues": [{"type": "poor_naming", "line": 3, "description": "Unclear names"}],
+            }
+            for index in rng.sample(range(file_count), min(area_count, file_count))
+        ],
+    }
+
+
+def canonical(graph: Dict[str, Any]):
+    """The graph with node ids replaced by node contents, so insertion order does not matter"""
+    nodes = {
+        node["id"]: (node["type"], node["label"], node["color"], json.dumps(node["metadata"], sort_keys=True))
+        for node in graph["nodes"]
+    }
+    edges = Counter((nodes[e["source"]], nodes[e["target"]], e["type"], e["label"]) for e in graph["edges"])
+    return Counter(nodes.values()), edges, graph["statistics"]
+
+
+def check_merge_equals_rebuild():
+    """Merging and replacing scans must give the same graph as a fresh build"""
+    rng = random.Random(1)
+    vulnerability = vulnerability_results(rng, 5000)
+    file_count = 5000 // FINDINGS_PER_FILE
+    old_arb, new_arb = arb_results(rng, file_count, 300), arb_results(rng, file_count, 250)
+    readiness = readiness_results(rng, file_count, 50)
+
+    merged = KnowledgeGraphBuilder()
+    merged.merge_scan_results("vulnerability", vulnerability, "vuln")
+    merged.merge_scan_results("arb_compliance", old_arb, "arb_1")
+    merged.merge_scan_results("ai_readiness", readiness, "ai")
+    merged.merge_scan_results("arb_compliance", new_arb, "arb_2")
+
+    fresh = KnowledgeGraphBuilder()
+    fresh.merge_scan_results("vulnerability", vulnerability, "vuln")
+    fresh.merge_scan_results("ai_readiness", readiness, "ai")
+    fresh.merge_scan_results("arb_compliance", new_arb, "arb_2")
+
+    if canonical(merged.to_dict()) != canonical(fresh.to_dict()):
+        raise SystemExit("FAIL: merged graph differs from a graph built from scratch")
+
+
+def timed(label: str, builder: KnowledgeGraphBuilder, function) -> float:
+    """Run function, print its duration and the graph size after it"""
+    gc.collect()
+    started = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - started
+    print(f"  {label:<38} {seconds:8.3f} s {builder.graph.node_count:>10} nodes")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=960000, help="Vulnerability findings")
+    parser.add_argument("--violations", type=int, default=20000, help="ARB violations per ARB scan")
+    parser.add_argument("--areas", type=int, default=1000, help="AI-readiness low-confidence files")
+    args = parser.parse_args()
+
+    check_merge_equals_rebuild()
+
+    rng = random.Random(7)
+    file_count = (args.findings + FINDINGS_PER_FILE - 1) // FINDINGS_PER_FILE
+    vulnerability = vulnerability_results(rng, args.findings)
+    old_arb = arb_results(rng, file_count, args.violations)
+    new_arb = arb_results(rng, file_count, args.violations)
+    readiness = readiness_results(rng, file_count, args.areas)
+
+    print("=== Unified Knowledge Graph Merge ===")
+    print(f"{args.findings} findings in {file_count} files, {args.violations} ARB violations, "
+          f"{args.areas} AI-readiness areas\n")
+
+    builder = KnowledgeGraphBuilder()
+    timed("merge vulnerability scan (empty graph)", builder,
+          lambda: builder.merge_scan_results("vulnerability", vulnerability, "vuln"))
+    timed("merge ARB scan", builder, lambda: builder.merge_scan_results("arb_compliance", old_arb, "arb_1"))
+    timed("merge AI-readiness scan", builder, lambda: builder.merge_scan_results("ai_readiness", readiness, "ai"))
+    timed("replace ARB scan with a newer one", builder,
+          lambda: builder.merge_scan_results("arb_compliance", new_arb, "arb_2"))
+
+    def rebuild():
+        fresh = KnowledgeGraphBuilder()
+        fresh.merge_scan_results("vulnerability", vulnerability, "vuln")
+        fresh.merge_scan_results("ai_readiness", readiness, "ai")
+        fresh.merge_scan_results("arb_compliance", new_arb, "arb_2")
+
+    timed("rebuild all three from scratch", builder, rebuild)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: import graph build, cycle detection and incremental update at scale
+
+Generates the raw imports of a synthetic repository (packages of modules that
+only import earlier modules, plus a few back edges that create cycles), then
+times resolving them into a graph, finding the strongly connected components,
+persisting the graph, loading it back and rebuilding after a small change.
+The cycles found are checked against networkx.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_import_graph [--modules 50000] [--imports 8]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import networkx as nx
+
+from intelligentscan.scanners.import_graph import ImportGraph, strongly_connected_components
+
+
+MODULES_PER_PACKAGE = 100
+
+
+def synthetic_imports(rng: random.Random, index: int, module_count: int, import_count: int, back_edge: bool):
+    """Raw imports of module number index"""
+    imports = [(1, 0, "os", None), (2, 0, "typing", None)]
+    line = 3
+    package_start = index - index % MODULES_PER_PACKAGE
+    for _ in range(import_count):
+        target = None
+        if back_edge and index + 1 < module_count:
+            target = rng.randrange(index + 1, min(module_count, index + 10))
+            back_edge = False
+        elif index > package_start and rng.random() < 0.5:
+            # Half the imports stay within the package, mostly of close neighbours
+            target = max(package_start, index - 1 - int(rng.expovariate(0.3)))
+        elif index:
+            target = rng.randrange(0, index)
+        if target is None:
+            continue
+
+        package, module = divmod(target, MODULES_PER_PACKAGE)
+        style = rng.random()
+        if style < 0.4:
+            imports.append((line, 0, f"pkg_{package}.mod_{module}", None))
+        elif style < 0.8:
+            imports.append((line, 0, f"pkg_{package}", [f"mod_{module}"]))
+        elif package == index // MODULES_PER_PACKAGE:
+            imports.append((line, 1, f"mod_{module}", ["helper"]))
+        else:
+            imports.append((line, 0, f"pkg_{package}.mod_{module}", ["helper", "Other"]))
+        line += 1
+    return imports
+
+
+def fill(graph: ImportGraph, module_count: int, import_count: int, cycle_count: int):
+    """Record the synthetic repository's files in the graph"""
+    rng = random.Random(11)
+    back_edges = set(rng.sample(range(module_count), cycle_count))
+
+    for index in range(module_count):
+        package, module = divmod(index, MODULES_PER_PACKAGE)
+        rel_path = f"pkg_{package}/mod_{module}.py"
+        graph.set_imports(rel_path, 100, 1, synthetic_imports(rng, index, module_count, import_count, index in back_edges))
+    for package in range((module_count + MODULES_PER_PACKAGE - 1) // MODULES_PER_PACKAGE):
+        graph.set_imports(f"pkg_{package}/__init__.py", 0, 1, [])
+
+
+def timed(label: str, function):
+    """Run function, print its duration and return its result"""
+    started = time.perf_counter()
+    result = function()
+    print(f"  {label:<28} {time.perf_counter() - started:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modules", type=int, default=50000, help="Number of modules")
+    parser.add_argument("--imports", type=int, default=8, help="Imports per module")
+    parser.add_argument("--cycles", type=int, default=200, help="Back edges inserted")
+    args = parser.parse_args()
+
+    print("=== Import Graph ===")
+    print(f"{args.modules} modules, {args.imports} imports each, {args.cycles} back edges\n")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store_path = Path(temp_dir) / "import_graph.sqlite3"
+
+        graph = ImportGraph(temp_dir, store_path)
+        fill(graph, args.modules, args.imports, args.cycles)
+
+        timed("resolve imports", graph.build)
+        print(f"  {'':<28} {len(graph.modules)} modules, {graph.edge_count} edges")
+        components = timed("strongly connected comps", lambda: strongly_connected_components(graph.adjacency))
+        cycles = timed("cycles + example paths", graph.cycles)
+        print(f"  {'':<28} {len(cycles)} cycles, largest {max((len(c.members) for c in cycles), default=0)} modules")
+        timed("save (full)", graph.save)
+
+        reloaded = ImportGraph(temp_dir, store_path)
+        timed("load", reloaded.load)
+
+        # One file changes: only its row is rewritten, the rest is rebuilt from memory
+        changed = reloaded.files["pkg_0/mod_5.py"]
+        reloaded.set_imports("pkg_0/mod_5.py", changed[0] + 1, 2, changed[2][:-1])
+        timed("save (1 file changed)", reloaded.save)
+        timed("rebuild after change", reloaded.build)
+
+        expected = nx.DiGraph()
+        expected.add_nodes_from(range(len(graph.modules)))
+        expected.add_edges_from((source, target) for source, edges in enumerate(graph.adjacency) for target in edges)
+        reference = timed("networkx SCC (reference)", lambda: list(nx.strongly_connected_components(expected)))
+        if {frozenset(c) for c in components} != {frozenset(c) for c in reference}:
+            raise SystemExit("Tarjan components differ from networkx")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark: knowledge graph build and serialization at scale
+
+Builds the vulnerability knowledge graph of --findings synthetic findings
+with the compact backend and with the previous networkx-backed builder, and
+reports build time, graph_json_v1 conversion time and the memory held by the
+graph. Exits non-zero if the two produce different graph_json_v1 output.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_knowledge_graph [--findings 500000]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Dict
+
+import networkx as nx
+
+from intelligentscan.utils.knowledge_graph import KnowledgeGraphBuilder
+
+
+SEVERITIES = ["critical", "high", "medium", "low"]
+TYPES = ["hardcoded_secret", "sql_injection", "command_injection", "weak_crypto", "path_traversal"]
+FINDINGS_PER_FILE = 25
+
+
+class NetworkxGraphBuilder(KnowledgeGraphBuilder):
+    """The builder as it was before the compact backend (reference)"""
+
+    def build_from_scan_results(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
+        self.graph = nx.DiGraph()
+        self.node_counter = 0
+        self._build_vulnerability_graph(scan_results)
+        return self._graph_to_dict()
+
+    def _add_node(self, label: str, node_type: str, color: str, metadata: Dict[str, Any]) -> str:
+        node_id = f"node_{self.node_counter}"
+        self.node_counter += 1
+        self.graph.add_node(node_id, label=label, type=node_type, color=color, **metadata)
+        return node_id
+
+    def _file_node(self, file_path: str, color: str, metadata: Dict[str, Any]) -> str:
+        return self._add_node(self._shorten_path(file_path), "file", color, {"full_path": file_path, **metadata})
+
+    def _add_edge(self, source: str, target: str, edge_type: str, label: str):
+        self.graph.add_edge(source, target, type=edge_type, label=label)
+
+    def _graph_to_dict(self) -> Dict[str, Any]:
+        nodes = []
+        for node_id, node_data in self.graph.nodes(data=True):
+            nodes.append({
+                "id": node_id,
+                "label": node_data.get("label", ""),
+                "type": node_data.get("type", ""),
+                "color": node_data.get("color", "gray"),
+                "metadata": {k: v for k, v in node_data.items() if k not in ["label", "type", "color"]}
+            })
+        edges = []
+        for source, target, edge_data in self.graph.edges(data=True):
+            edges.append({
+                "source": source,
+                "target": target,
+                "type": edge_data.get("type", ""),
+                "label": edge_data.get("label", "")
+            })
+        stats = {
+            "node_count": len(nodes),
+            "edge_count": len(edges),
+            "red_nodes": len([n for n in nodes if n["color"] == "red"]),
+            "green_nodes": len([n for n in nodes if n["color"] == "green"]),
+            "yellow_nodes": len([n for n in nodes if n["color"] == "yellow"])
+        }
+        return {"nodes": nodes, "edges": edges, "statistics": stats, "format": "graph_json_v1"}
+
+
+def synthetic_results(finding_count: int) -> Dict[str, Any]:
+    """Vulnerability scan results with finding_count findings"""
+    rng = random.Random(5)
+    findings = []
+    for index in range(finding_count):
+        vuln_type = rng.choice(TYPES)
+        findings.append({
+            "type": vuln_type,
+            "description": f"Possible {vuln_type.replace('_', ' ')}",
+            "severity": rng.choice(SEVERITIES),
+            "file": f"src/package_{index // 5000}/module_{index // FINDINGS_PER_FILE}.py",
+            "line": rng.randrange(1, 2000),
+            "remediation": f"Fix the {vuln_type.replace('_', ' ')}",
+        })
+    return {"vulnerabilities_found": findings}
+
+
+def measure(builder_class, scan_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the graph and convert it, recording time, then memory"""
+    gc.collect()
+    builder = builder_class()
+    started = time.perf_counter()
+    builder.build_from_scan_results(scan_results)
+    total_seconds = time.perf_counter() - started
+
+    # build_from_scan_results ends with the conversion; time it on its own
+    convert_started = time.perf_counter()
+    builder._graph_to_dict()
+    convert_seconds = time.perf_counter() - convert_started
+
+    # Second, traced run (tracemalloc slows it down, so it is not timed)
+    gc.collect()
+    tracemalloc.start()
+    builder = builder_class()
+    graph_dict = builder.build_from_scan_results(scan_results)
+    del graph_dict
+    gc.collect()
+    # What stays allocated once the output is dropped is the builder's graph
+    graph_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "builder": builder,
+        "build_seconds": total_seconds - convert_seconds,
+        "convert_seconds": convert_seconds,
+        "graph_mb": graph_bytes / 1024 / 1024,
+        "peak_mb": peak_bytes / 1024 / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=500000, help="Number of findings")
+    args = parser.parse_args()
+
+    scan_results = synthetic_results(args.findings)
+    print("=== Knowledge Graph ===")
+    print(f"{args.findings} findings in {args.findings // FINDINGS_PER_FILE} files\n")
+    print(f"  {'backend':<10} {'build':>9} {'to dict':>9} {'graph held':>12} {'peak':>10}")
+
+    rows = {}
+    for name, builder_class in (("networkx", NetworkxGraphBuilder), ("compact", KnowledgeGraphBuilder)):
+        row = rows[name] = measure(builder_class, scan_results)
+        print(f"  {name:<10} {row['build_seconds']:8.2f}s {row['convert_seconds']:8.2f}s "
+              f"{row['graph_mb']:10.1f}MB {row['peak_mb']:8.1f}MB")
+
+    # Both must produce the same graph_json_v1 document
+    if rows["compact"]["builder"]._graph_to_dict() != rows["networkx"]["builder"]._graph_to_dict():
+        raise SystemExit("FAIL: compact graph_json_v1 output differs from networkx")
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Check: scan tool responses stay small however many findings a scan has
+
+Writes a synthetic repository with --findings hardcoded secrets, runs
+scan_vulnerabilities through an in-memory MCP client (with a progress
+handler) and pages through every finding with get_findings. Reports the
+size of the tool response, of the largest page and of the full findings
+list a single response used to carry. Exits non-zero if the tool response
+or the largest get_findings page grows past --budget-kb, or paging does not
+return every finding exactly once.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_mcp_response_size [--findings 100000] [--budget-kb 256]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from fastmcp import Client
+
+from intelligentscan.server import main as server
+from intelligentscan.utils.session_store import SessionStore
+
+
+FINDINGS_PER_FILE = 50
+
+
+def write_repository(root: Path, finding_count: int):
+    """Write files of FINDINGS_PER_FILE hardcoded passwords each"""
+    for index in range((finding_count + FINDINGS_PER_FILE - 1) // FINDINGS_PER_FILE):
+        lines = [f'password = "hunter{index}x{line}"' for line in range(FINDINGS_PER_FILE)]
+        (root / f"settings_{index:05d}.py").write_text("\n".join(lines) + "\n")
+
+
+def json_kb(value) -> float:
+    """Size of value serialized as JSON, in KB"""
+    return len(json.dumps(value)) / 1024
+
+
+async def measure(repo_path: str, page_size: int) -> dict:
+    """Scan through an MCP client, then page through every finding"""
+    progress_events = []
+
+    async def on_progress(progress, total, message):
+        progress_events.append(progress)
+
+    async with Client(server.mcp, progress_handler=on_progress) as client:
+        started = time.perf_counter()
+        result = await client.call_tool("scan_vulnerabilities", {"repo_path": repo_path})
+        scan_seconds = time.perf_counter() - started
+        response = json.loads(result.content[0].text)
+        if "error" in response:
+            raise SystemExit(response["error"])
+
+        scan_id = response["scan_id"]
+        seen = [(f["file"], f["line"]) for f in response["vulnerabilities"]]
+        largest_page = 0.0
+        cursor = response["next_cursor"]
+        pages = 1
+
+        started = time.perf_counter()
+        while cursor:
+            result = await client.call_tool("get_findings", {
+                "scan_id": scan_id, "cursor": cursor, "page_size": page_size
+            })
+            page = json.loads(result.content[0].text)
+            largest_page = max(largest_page, len(result.content[0].text) / 1024)
+            seen.extend((f["file"], f["line"]) for f in page["findings"])
+            cursor = page["next_cursor"]
+            pages += 1
+        paging_seconds = time.perf_counter() - started
+
+    stored = server.session_store.get(scan_id).results["vulnerability"]["vulnerabilities_found"]
+    return {
+        "response_kb": json_kb(response),
+        "full_kb": json_kb(stored),
+        "largest_page_kb": largest_page,
+        "total": response["summary"]["total_vulnerabilities"],
+        "seen": seen,
+        "pages": pages,
+        "progress_events": len(progress_events),
+        "scan_seconds": scan_seconds,
+        "paging_seconds": paging_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=100000, help="Number of synthetic findings")
+    parser.add_argument("--page-size", type=int, default=1000, help="get_findings page size")
+    parser.add_argument("--budget-kb", type=int, default=256, help="Allowed tool response and page size in KB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the synthetic files and sessions out of the user's cache
+        os.environ["INTELLIGENTSCAN_CACHE_DIR"] = cache_dir
+        server.session_store = SessionStore.from_settings(server.ScanSession.from_record)
+        write_repository(Path(temp_dir), args.findings)
+        stats = asyncio.run(measure(temp_dir, args.page_size))
+
+    print("=== MCP Response Size ===")
+    print(f"Findings          : {stats['total']} (scan {stats['scan_seconds']:.2f}s, "
+          f"{stats['progress_events']} progress notifications)")
+    print(f"All findings      : {stats['full_kb']:10.0f} KB in one response before paging")
+    print(f"Tool response     : {stats['response_kb']:10.1f} KB (budget {args.budget_kb} KB)")
+    print(f"Largest page      : {stats['largest_page_kb']:10.1f} KB (page size {args.page_size})")
+    print(f"Paging            : {stats['pages']} pages in {stats['paging_seconds']:.2f}s")
+
+    if len(stats["seen"]) != stats["total"] or len(set(stats["seen"])) != stats["total"]:
+        raise SystemExit(f"FAIL: paging returned {len(stats['seen'])} findings, expected {stats['total']} distinct")
+    if stats["response_kb"] > args.budget_kb:
+        raise SystemExit("FAIL: the scan tool response exceeded the size budget")
+    if stats["largest_page_kb"] > args.budget_kb:
+        raise SystemExit("FAIL: a get_findings page exceeded the size budget")
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
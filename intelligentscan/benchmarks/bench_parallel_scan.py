@@ -0,0 +1,94 @@
+"""
+Benchmark: process-pool scaling of VulnerabilityScanner and analyze_directory_ast
+
+Builds a synthetic repository in a temporary directory and scans it with
+1, 2, 4 and 8 workers, checking that every run returns identical results.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_parallel_scan [--files 2000] [--file-kb 32]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from intelligentscan.benchmarks.bench_pattern_matcher import HIT_LINES
+from intelligentscan.scanners.vulnerability_scanner import VulnerabilityScanner
+from intelligentscan.scanners.ast_analyzer import analyze_directory_ast
+
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+FUNCTION_TEMPLATE = """
+def handle_{index}(request, items, limit):
+    total = 0
+    for item in items:
+        if item.active and item.price > limit:
+            total += item.price
+        elif item.discount:
+            total -= item.discount
+    {hit}
+    return total
+"""
+
+
+def build_module(rng: random.Random, size_bytes: int) -> str:
+    """Build one syntactically valid synthetic Python module of roughly size_bytes"""
+    functions = []
+    total = 0
+    while total < size_bytes:
+        hit = rng.choice(HIT_LINES) if rng.random() < 0.05 else "pass"
+        function = FUNCTION_TEMPLATE.format(index=len(functions), hit=hit)
+        functions.append(function)
+        total += len(function)
+    return "".join(functions)
+
+
+def build_repo(root: Path, file_count: int, file_kb: int):
+    """Write a synthetic repository of Python files spread over packages"""
+    rng = random.Random(7)
+    for index in range(file_count):
+        package = root / f"pkg_{index % 50:02d}"
+        package.mkdir(exist_ok=True)
+        (package / f"module_{index:05d}.py").write_text(build_module(rng, file_kb * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=2000, help="Number of synthetic files")
+    parser.add_argument("--file-kb", type=int, default=32, help="Size of each file in KB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        build_repo(Path(temp_dir), args.files, args.file_kb)
+
+        print("=== Parallel Scan Benchmark ===")
+        print(f"Repository: {args.files} files x {args.file_kb} KB, {os.cpu_count()} CPUs available")
+
+        baseline = {}
+        for label, run in [
+            ("vulnerability", lambda workers: asyncio.run(
+                VulnerabilityScanner(temp_dir).scan(max_workers=workers, use_cache=False))["vulnerabilities_found"]),
+            ("ast", lambda workers: analyze_directory_ast(temp_dir, max_workers=workers, use_cache=False)),
+        ]:
+            print(f"\n{label}:")
+            for workers in WORKER_COUNTS:
+                started = time.perf_counter()
+                results = run(workers)
+                elapsed = time.perf_counter() - started
+
+                if workers == 1:
+                    baseline[label] = (elapsed, results)
+                elif results != baseline[label][1]:
+                    raise SystemExit(f"{label} results differ at {workers} workers")
+
+                speedup = baseline[label][0] / elapsed
+                print(f"  {workers} workers: {elapsed:7.2f}s  {speedup:5.2f}x  ({len(results)} findings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: rendering Markdown and HTML reports of 200k findings
+
+Streams the Markdown and HTML reports of a synthetic vulnerability session
+with --findings findings to files with ReportGenerator.write, timing an
+untraced run and measuring the peak Python memory of a second, traced run.
+Peak memory must stay bounded (not grow with the report), so it is compared
+with the report size. Checks that the Markdown table and the HTML pager data
+hold every finding, worst severity first, and that the HTML report renders
+only one page of rows as markup; exits non-zero if not.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_report_rendering [--findings 200000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+
+from intelligentscan.benchmarks.bench_report_serialization import SyntheticSession
+from intelligentscan.utils.graph_hierarchy import SEVERITY_LEVELS
+from intelligentscan.utils.report_generator import HTML_PAGE_SIZE, ReportGenerator
+
+
+# Peak memory while writing, as a share of the report size, above which it is not bounded
+MAX_PEAK_SHARE = 0.25
+
+
+def check_markdown(path: str, finding_count: int):
+    severities = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("| ") and line.count("|") == 6 and line.split("|")[1].strip() in SEVERITY_LEVELS:
+                severities.append(SEVERITY_LEVELS.index(line.split("|")[1].strip()))
+    if len(severities) != finding_count:
+        raise SystemExit(f"FAIL: Markdown table has {len(severities)} of {finding_count} findings")
+    if severities != sorted(severities):
+        raise SystemExit("FAIL: Markdown findings are not ordered worst severity first")
+
+
+def check_html(path: str, finding_count: int):
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+    data = re.search(r'<script type="application/json" class="finding-data">(.*?)</script>', page, re.S)
+    rows = json.loads(data.group(1))
+    if len(rows) != finding_count:
+        raise SystemExit(f"FAIL: HTML pager data has {len(rows)} of {finding_count} findings")
+    ranks = [SEVERITY_LEVELS.index(row[0]) for row in rows]
+    if ranks != sorted(ranks):
+        raise SystemExit("FAIL: HTML findings are not ordered worst severity first")
+    markup_rows = page.count('<tr class="sev-') - len(SEVERITY_LEVELS)  # minus the breakdown table
+    if markup_rows != min(finding_count, HTML_PAGE_SIZE):
+        raise SystemExit(f"FAIL: HTML report renders {markup_rows} rows as markup, expected one page")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=200000, help="Vulnerability findings")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Reports are written to the reports directory inside the cache directory
+        os.environ["INTELLIGENTSCAN_CACHE_DIR"] = cache_dir
+        run(args.findings)
+    print("PASS")
+
+
+def run(finding_count: int):
+    session = SyntheticSession(finding_count)
+    generator = ReportGenerator()
+
+    print("=== Markdown / HTML Report Rendering ===")
+    print(f"{finding_count} findings\n")
+    print(f"  {'':<10} {'time':>9} {'peak memory':>12} {'size':>10}")
+    for output_format, check in (("markdown", check_markdown), ("html", check_html)):
+        name = f"report.{output_format}"
+
+        gc.collect()
+        started = time.perf_counter()
+        generator.write(session, output_format, name, overwrite=True)
+        seconds = time.perf_counter() - started
+
+        gc.collect()
+        tracemalloc.start()
+        path, size = generator.write(session, output_format, name, overwrite=True)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"  {output_format:<10} {seconds:7.2f} s {peak / 1024 / 1024:9.1f} MB {size / 1024 / 1024:7.1f} MB")
+        check(path, finding_count)
+        if peak > MAX_PEAK_SHARE * size:
+            raise SystemExit(f"FAIL: {output_format} peak memory {peak} bytes is not bounded (report {size} bytes)")
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
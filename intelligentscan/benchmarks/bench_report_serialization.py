@@ -0,0 +1,138 @@
+"""
+Benchmark: serializing a 100 MB+ scan report
+
+Builds a synthetic vulnerability session with --findings findings (about
+450 bytes of JSON each) and compares json.dumps(indent=2), the previous
+report path, with ReportGenerator.generate (streaming encoder to a string)
+and ReportGenerator.write (streamed to a file as JSON, and as MessagePack
+when msgpack is installed). Times are measured without tracing; peak
+Python memory is measured in a second, traced run of each. Every output is
+decoded and compared with the session; exits non-zero if any differs.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_report_serialization [--findings 250000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from intelligentscan.utils import streaming
+from intelligentscan.utils.report_generator import ReportGenerator
+
+
+SEVERITIES = ["critical", "high", "medium", "low"]
+
+
+class SyntheticSession:
+    """Just enough of a scan session for ReportGenerator"""
+
+    def __init__(self, finding_count: int):
+        rng = random.Random(3)
+        self.scan_id = "vuln_20250110_143022_512093"
+        self.findings = [
+            {
+                "type": "hardcoded_secret",
+                "severity": rng.choice(SEVERITIES),
+                "file": f"src/package_{index // 5000}/module_{index // 25}.py",
+                "line": rng.randrange(1, 2000),
+                "description": "Hardcoded API key or secret detected in source code",
+                "code_snippet": f'api_key = "sk_live_{rng.getrandbits(64):016x}"  # TODO: move to vault',
+                "matched_text": f"sk_live_{rng.getrandbits(64):016x}",
+                "remediation": "Move the secret to environment variables or a secrets vault",
+                "confidence": round(rng.random(), 2),
+            }
+            for index in range(finding_count)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scan_id": self.scan_id,
+            "repo_path": "/repos/example",
+            "status": "completed",
+            "start_time": "2025-01-10T14:30:22.512093",
+            "duration_seconds": 42.0,
+            "results": {"vulnerability": {
+                "total_vulnerabilities": len(self.findings),
+                "vulnerabilities_found": self.findings,
+            }},
+            "knowledge_graph": None,
+        }
+
+
+def measure(function: Callable[[], Any]):
+    """Seconds of an untraced run, then peak traced memory in MB of a second run"""
+    gc.collect()
+    started = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=250000, help="Vulnerability findings")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Reports are written to the reports directory inside the cache directory
+        os.environ["INTELLIGENTSCAN_CACHE_DIR"] = cache_dir
+        run(args.findings)
+    print("PASS")
+
+
+def run(finding_count: int):
+    session = SyntheticSession(finding_count)
+    expected = session.to_dict()
+    generator = ReportGenerator()
+
+    cases = [
+        ("json.dumps(indent=2) string", lambda: json.dumps(session.to_dict(), indent=2)),
+        ("generate() string", lambda: generator.generate(session, "json")),
+        ("write() json file", lambda: generator.write(session, "json", "report.json", overwrite=True)),
+    ]
+    if streaming.msgpack is not None:
+        cases.append((
+            "write() msgpack file", lambda: generator.write(session, "msgpack", "report.msgpack", overwrite=True)
+        ))
+
+    print("=== Report Serialization ===")
+    print(f"{finding_count} findings, encoder: {'orjson' if streaming.orjson is not None else 'json'}\n")
+    print(f"  {'':<30} {'time':>9} {'peak memory':>12} {'size':>10}")
+    for label, function in cases:
+        seconds, peak_mb = measure(function)
+        output = function()
+        size = output[1] if isinstance(output, tuple) else len(output.encode("utf-8"))
+        print(f"  {label:<30} {seconds:7.2f} s {peak_mb:9.1f} MB {size / 1024 / 1024:7.1f} MB")
+
+        if isinstance(output, str):
+            decoded = json.loads(output)
+        elif label.endswith("msgpack file"):
+            with open(output[0], "rb") as f:
+                decoded = streaming.msgpack.unpackb(f.read())
+        else:
+            with open(output[0], encoding="utf-8") as f:
+                decoded = json.load(f)
+        decoded.pop("duration_seconds")
+        if decoded != {key: value for key, value in expected.items() if key != "duration_seconds"}:
+            raise SystemExit(f"FAIL: {label} does not decode to the session")
+        del output, decoded
+
+    if streaming.msgpack is None:
+        print("  (msgpack not installed; MessagePack output skipped)")
+
+
+if __name__ == "__main__":
+    main()
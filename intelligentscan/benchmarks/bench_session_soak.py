@@ -0,0 +1,125 @@
+"""
+Soak check: server memory stays flat over thousands of scans
+
+Runs --scans scans (cycling vulnerability, ARB and AI-readiness) of a small
+synthetic repository through the server's scan tools, with a session store
+limited to --budget-mb. Every tenth scan also pages through the findings of a
+random earlier, usually evicted, session. Resident memory is sampled after
+the warm-up tenth of the run and at the end. Exits non-zero if it grew by
+more than --max-growth-mb or any session cannot be read back.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_session_soak [--scans 10000] [--budget-mb 16]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import random
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from intelligentscan.server import main as server
+from intelligentscan.utils.session_store import SESSION_FILE_NAME, SessionStore
+
+
+SCAN_TOOLS = [server.scan_vulnerabilities, server.check_arb_compliance, server.scan_ai_readiness]
+
+MODULE = '''
+import os
+
+password = "hunter{index}"
+
+
+def handler_{index}(request, value):
+    total = 0
+    for item in request.items:
+        if item > value:
+            total += item
+    os.system("echo " + str(total))
+    return total
+'''
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MB (Linux)"""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+
+
+async def soak(repo_path: str, scan_count: int) -> dict:
+    """Run the scans and sample memory"""
+    rng = random.Random(3)
+    warmup = max(1, scan_count // 10)
+    baseline_rss = None
+    started = time.perf_counter()
+
+    scan_ids = []
+
+    for index in range(scan_count):
+        response = await SCAN_TOOLS[index % len(SCAN_TOOLS)](repo_path)
+        if response.get("status") != "completed":
+            raise SystemExit(f"Scan {index} failed: {response.get('error')}")
+        scan_ids.append(response["scan_id"])
+
+        if index % 10 == 9:
+            earlier = rng.choice(scan_ids)
+            page = await server.get_findings(earlier, page_size=20)
+            if "error" in page:
+                raise SystemExit(f"Could not read back {earlier}: {page['error']}")
+
+        if index + 1 == warmup:
+            gc.collect()
+            baseline_rss = rss_mb()
+
+    gc.collect()
+    if len(set(scan_ids)) != scan_count:
+        raise SystemExit(f"FAIL: {scan_count - len(set(scan_ids))} scan IDs were reused")
+    return {
+        "baseline_rss": baseline_rss,
+        "final_rss": rss_mb(),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scans", type=int, default=10000, help="Number of scans")
+    parser.add_argument("--budget-mb", type=float, default=16, help="Session store memory budget in MB")
+    parser.add_argument("--max-growth-mb", type=float, default=32, help="Allowed RSS growth after warm-up in MB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the synthetic files and sessions out of the user's cache
+        os.environ["INTELLIGENTSCAN_CACHE_DIR"] = cache_dir
+        server.session_store = SessionStore(
+            server.ScanSession.from_record, Path(cache_dir) / SESSION_FILE_NAME, memory_budget_mb=args.budget_mb
+        )
+        for index in range(8):
+            (Path(temp_dir) / f"module_{index}.py").write_text(MODULE.format(index=index))
+
+        stats = asyncio.run(soak(temp_dir, args.scans))
+        store_stats = server.session_store.memory_stats()
+
+    growth = stats["final_rss"] - stats["baseline_rss"]
+    print("=== Session Store Soak ===")
+    print(f"Scans             : {args.scans} in {stats['seconds']:.1f}s")
+    print(f"Sessions stored   : {store_stats['sessions_stored']} ({store_stats['stored_bytes'] / 1024 / 1024:.1f} MB on disk)")
+    print(f"Sessions in memory: {store_stats['sessions_in_memory']} "
+          f"({store_stats['memory_bytes'] / 1024 / 1024:.1f} MB of {args.budget_mb:g} MB budget)")
+    print(f"Evicted / reloaded: {store_stats['evicted']} / {store_stats['reloaded']}")
+    print(f"RSS after warm-up : {stats['baseline_rss']:.1f} MB")
+    print(f"RSS at end        : {stats['final_rss']:.1f} MB (+{growth:.1f} MB, budget {args.max_growth_mb:g} MB)")
+
+    if store_stats["sessions_stored"] != args.scans:
+        raise SystemExit(f"FAIL: {store_stats['sessions_stored']} sessions stored, expected {args.scans}")
+    if growth > args.max_growth_mb:
+        raise SystemExit("FAIL: resident memory kept growing")
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
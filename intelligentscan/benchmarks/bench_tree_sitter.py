@@ -0,0 +1,128 @@
+"""
+Benchmark: AST analysis throughput per language, with and without parser pooling
+
+Writes synthetic Python, Java and JavaScript files and analyzes each set with
+analyze_file_ast, reporting files per second. For the tree-sitter languages
+the run is repeated building a fresh parser (and grammar) for every file, to
+show what the per-process parser pool saves.
+
+Usage:
+    python -m intelligentscan.benchmarks.bench_tree_sitter [--files 300] [--functions 40]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from tree_sitter import Language, Parser
+
+from intelligentscan.benchmarks.bench_parallel_scan import FUNCTION_TEMPLATE as PYTHON_FUNCTION
+from intelligentscan.scanners import tree_sitter_analyzer
+from intelligentscan.scanners.ast_analyzer import analyze_file_ast
+
+
+JAVA_FUNCTION = """
+    /** Sum the active items */
+    public int handle{index}(Request request, List<Item> items, int limit) {{
+        int total = 0;
+        for (Item item : items) {{
+            if (item.active && item.price > limit) {{
+                total += item.price;
+            }} else if (item.discount > 0) {{
+                total -= item.discount;
+            }}
+        }}
+        return total;
+    }}
+"""
+
+JAVASCRIPT_FUNCTION = """
+/** Sum the active items */
+export function handle{index}(request, items, limit) {{
+  let total = 0;
+  for (const item of items) {{
+    if (item.active && item.price > limit) {{
+      total += item.price;
+    }} else if (item.discount) {{
+      total -= item.discount;
+    }}
+  }}
+  return total;
+}}
+"""
+
+LANGUAGES = [
+    ("python", ".py", lambda body: body, PYTHON_FUNCTION.replace("{hit}", "pass")),
+    ("java", ".java", lambda body: f"public class Handlers {{\n{body}}}\n", JAVA_FUNCTION),
+    ("javascript", ".js", lambda body: body, JAVASCRIPT_FUNCTION),
+]
+
+
+class UnpooledParsers:
+    """Stand-in for the parser pool that builds a new grammar and parser every time"""
+
+    stats = {}
+
+    def language(self, name):
+        return tree_sitter_analyzer.ParserPool().language(name)
+
+    def parser(self, name):
+        class _Fresh:
+            def __enter__(self):
+                module_name, function_name = tree_sitter_analyzer.GRAMMARS[name]
+                module = __import__(module_name)
+                return Parser(Language(getattr(module, function_name)()))
+
+            def __exit__(self, *exc_info):
+                return False
+
+        return _Fresh()
+
+
+def run(paths) -> tuple:
+    """Analyze every path; return (seconds, violation count)"""
+    started = time.perf_counter()
+    violations = sum(len(analyze_file_ast(str(path))) for path in paths)
+    return time.perf_counter() - started, violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=300, help="Files per language")
+    parser.add_argument("--functions", type=int, default=40, help="Functions per file")
+    args = parser.parse_args()
+
+    print("=== AST Analysis Throughput ===")
+    print(f"{args.files} files per language, {args.functions} functions each\n")
+    print(f"{'language':<12} {'pooled':>12} {'unpooled':>12}  violations")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for language, extension, wrap, template in LANGUAGES:
+            body = "".join(template.format(index=index) for index in range(args.functions))
+            paths = []
+            for index in range(args.files):
+                path = Path(temp_dir) / f"{language}_{index:04d}{extension}"
+                path.write_text(wrap(body))
+                paths.append(path)
+
+            pooled_seconds, violations = run(paths)
+            pooled = f"{args.files / pooled_seconds:8.0f} f/s"
+
+            unpooled = "-"
+            if language != "python":
+                pool = tree_sitter_analyzer.PARSER_POOL
+                tree_sitter_analyzer.PARSER_POOL = UnpooledParsers()
+                try:
+                    unpooled_seconds, unpooled_violations = run(paths)
+                finally:
+                    tree_sitter_analyzer.PARSER_POOL = pool
+                if unpooled_violations != violations:
+                    raise SystemExit(f"{language}: pooled and unpooled results differ")
+                unpooled = f"{args.files / unpooled_seconds:8.0f} f/s"
+
+            print(f"{language:<12} {pooled:>12} {unpooled:>12}  {violations}")
+
+
+if __name__ == "__main__":
+    main()
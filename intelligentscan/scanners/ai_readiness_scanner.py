@@ -1,11 +1,506 @@
 """
 AI-Readiness Scanner for IntelligentScan
 Determines how well AI tools can understand and work with code
+
+Each Python file gets a confidence between 0 and 1: every enabled rule in
+ai_readiness_rules lowers it by its confidence_impact, scaled by the share of
+the file's definitions the rule flags. The repository score is the mean file
+confidence weighted by definitions.
+
+Per-file confidences are kept in a readiness index together with running
+totals, so the repository score is updated in constant time when a file
+changes. The index is persisted in the cache directory when caching is
+enabled, and files whose size and mtime are unchanged are not read again.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import ast
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Set, Tuple
 from pathlib import Path
 from datetime import datetime
+from functools import partial
+
+from intelligentscan.scanners.ast_analyzer import AST_ANALYZER_VERSION, ASTViolation, PythonASTAnalyzer
+from intelligentscan.scanners.file_walker import RepositoryWalker, name_skip_reason, content_skip_reason
+from intelligentscan.scanners.parallel import (
+    MIN_FILES_FOR_PARALLEL, ProgressCallback, resolve_worker_count, shard, map_shards, shard_progress
+)
+from intelligentscan.scanners.parsed_files import ParsedFile
+from intelligentscan.utils.config_loader import get_settings, load_rules_config
+from intelligentscan.utils.scan_cache import DEFAULT_CACHE_DIR, hash_ruleset
+
+
+# Bump whenever file confidences change for the same source (invalidates the index)
+SCANNER_VERSION = "ai_readiness/1"
+
+INDEX_FILE_NAME = "ai_readiness.sqlite3"
+
+# Files the readiness checks apply to
+AI_READINESS_FILE_PATTERNS = ["*.py"]
+
+# Files below this confidence are listed in low_confidence_areas
+LOW_CONFIDENCE_THRESHOLD = 0.7
+MAX_LOW_CONFIDENCE_AREAS = 100
+MAX_ISSUES_PER_AREA = 20
+
+# Index rows written per transaction; the shared index file's write lock is
+# only held for one batch at a time
+COMMIT_BATCH_FILES = 256
+
+# Analyzer violation type -> ai_readiness_rules entry it counts toward
+VIOLATION_RULES = {
+    "missing_docstring": "missing_docstrings",
+    "poor_naming": "poor_naming",
+    "high_complexity": "high_complexity",
+    "inconsistent_style": "inconsistent_style",
+    "missing_type_hints": "missing_type_hints",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS readiness_files (
+    repo TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    confidence REAL NOT NULL,
+    weight INTEGER NOT NULL,
+    issue_counts TEXT NOT NULL,
+    issues TEXT,
+    PRIMARY KEY (repo, path)
+);
+CREATE INDEX IF NOT EXISTS readiness_files_confidence ON readiness_files (repo, confidence);
+CREATE TABLE IF NOT EXISTS readiness_totals (
+    repo TEXT PRIMARY KEY,
+    ruleset TEXT NOT NULL,
+    weighted_confidence REAL NOT NULL,
+    weight INTEGER NOT NULL,
+    files INTEGER NOT NULL,
+    rule_totals TEXT NOT NULL
+);
+"""
+
+
+class ReadinessAnalyzer(PythonASTAnalyzer):
+    """
+    PythonASTAnalyzer that also counts definitions and checks type hints
+
+    The counts are the denominators of the per-rule shares in file_confidence.
+    """
+
+    def __init__(self, file_path: str, source_code: str, line_index=None, check_type_hints: bool = True):
+        super().__init__(file_path, source_code, line_index)
+        self.check_type_hints = check_type_hints
+        self.functions = 0
+        self.classes = 0
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        """Count the function and check its signature before the usual checks"""
+        self._check_signature(node)
+        super().visit_FunctionDef(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        """Count the async function and check its signature"""
+        self._check_signature(node)
+        super().visit_AsyncFunctionDef(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        """Count the class"""
+        self.classes += 1
+        super().visit_ClassDef(node)
+
+    def _check_signature(self, node: ast.AST):
+        """Report a function whose parameters or return value are not annotated"""
+        self.functions += 1
+        if not self.check_type_hints:
+            return
+
+        args = node.args
+        params = args.posonlyargs + args.args
+        # self / cls of methods are never annotated
+        if params and self.current_class is not None and params[0].arg in ("self", "cls"):
+            params = params[1:]
+        params = params + args.kwonlyargs + [arg for arg in (args.vararg, args.kwarg) if arg is not None]
+
+        missing_return = node.returns is None and node.name != "__init__"
+        if missing_return or any(param.annotation is None for param in params):
+            self.violations.append(ASTViolation(
+                file_path=self.file_path,
+                line_number=node.lineno,
+                violation_type="missing_type_hints",
+                description=f"Function '{node.name}' lacks type hints",
+                severity="low",
+                source=self.source,
+                function_name=node.name,
+                class_name=self.current_class
+            ))
+
+
+def mixed_indentation_line(text: str) -> Optional[int]:
+    """
+    Find the first line indented differently from the file's first indented line
+
+    Returns:
+        1-based line number, or None if the file uses only tabs or only spaces
+    """
+    style = None
+    for line_number, line in enumerate(text.split('\n'), 1):
+        first = line[:1]
+        if first not in (' ', '\t') or not line.strip():
+            continue
+        if style is None:
+            style = first
+        elif first != style:
+            return line_number
+    return None
+
+
+class FileReadiness:
+    """Confidence of one file and the issues behind it"""
+
+    __slots__ = ("rel_path", "size", "mtime_ns", "confidence", "weight", "issue_counts", "issues")
+
+    def __init__(
+        self,
+        rel_path: str,
+        size: int,
+        mtime_ns: int,
+        confidence: float,
+        weight: int,
+        issue_counts: Dict[str, int],
+        issues: Optional[List[Dict[str, Any]]] = None
+    ):
+        self.rel_path = rel_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.confidence = confidence
+        self.weight = weight
+        self.issue_counts = issue_counts
+        # Kept for low-confidence files only
+        self.issues = issues
+
+
+def file_confidence(
+    rule_configs: Dict[str, Dict[str, Any]],
+    issue_counts: Dict[str, int],
+    functions: int,
+    classes: int
+) -> float:
+    """
+    Score one file from 0 to 1
+
+    Each rule lowers the confidence by its confidence_impact times the share
+    of the file's definitions it flags (capped at 1): functions for type
+    hints and complexity, functions and classes for docstrings and naming,
+    the whole file for style.
+
+    Args:
+        rule_configs: Enabled ai_readiness_rules
+        issue_counts: Issues found per rule
+        functions: Functions defined in the file
+        classes: Classes defined in the file
+
+    Returns:
+        Confidence rounded to 3 decimals
+    """
+    units = {
+        "missing_docstrings": functions + classes,
+        "poor_naming": functions + classes,
+        "high_complexity": functions,
+        "missing_type_hints": functions,
+        "inconsistent_style": 1,
+    }
+
+    confidence = 1.0
+    for rule, count in issue_counts.items():
+        share = min(1.0, count / max(1, units.get(rule, 1)))
+        confidence += rule_configs[rule].get("confidence_impact", 0.0) * share
+
+    return round(max(0.0, confidence), 3)
+
+
+def analyze_readiness(
+    parsed: ParsedFile,
+    rule_configs: Dict[str, Dict[str, Any]],
+    stat: os.stat_result
+) -> FileReadiness:
+    """
+    Analyze one Python file for AI-readiness
+
+    Raises:
+        SyntaxError: If the file does not parse
+    """
+    analyzer = ReadinessAnalyzer(
+        str(parsed.path), parsed.text, parsed.line_index,
+        check_type_hints="missing_type_hints" in rule_configs
+    )
+    if "high_complexity" in rule_configs:
+        analyzer.complexity_threshold = rule_configs["high_complexity"].get("threshold", analyzer.complexity_threshold)
+    analyzer.visit(parsed.tree)
+
+    violations = analyzer.violations
+    if "inconsistent_style" in rule_configs:
+        line_number = mixed_indentation_line(parsed.text)
+        if line_number is not None:
+            violations.append(ASTViolation(
+                file_path=analyzer.file_path,
+                line_number=line_number,
+                violation_type="inconsistent_style",
+                description="Indentation mixes tabs and spaces",
+                severity="low"
+            ))
+
+    issue_counts: Dict[str, int] = {}
+    issues = []
+    for violation in violations:
+        rule = VIOLATION_RULES.get(violation.violation_type)
+        if rule not in rule_configs:
+            continue
+        issue_counts[rule] = issue_counts.get(rule, 0) + 1
+        issues.append({"type": violation.violation_type, "line": violation.line_number, "description": violation.description})
+
+    confidence = file_confidence(rule_configs, issue_counts, analyzer.functions, analyzer.classes)
+    if confidence >= LOW_CONFIDENCE_THRESHOLD:
+        issues = None
+    else:
+        issues.sort(key=lambda issue: issue["line"])
+        del issues[MAX_ISSUES_PER_AREA:]
+
+    return FileReadiness(
+        parsed.rel_path, stat.st_size, stat.st_mtime_ns, confidence,
+        max(1, analyzer.functions + analyzer.classes), issue_counts, issues
+    )
+
+
+class ReadinessIndex:
+    """
+    Per-file confidences of one repository plus running totals
+
+    Backed by SQLite: a file in the cache directory when caching is enabled,
+    otherwise an in-memory database that lasts for one scan. update() and
+    remove() are buffered and written COMMIT_BATCH_FILES at a time, each batch
+    in one short transaction that adjusts the stored totals by the files' old
+    and new contributions, so the repository score never needs a pass over all
+    files and concurrent scans sharing the index file stay consistent.
+    """
+
+    def __init__(self, repo_path: str, ruleset_hash: str, store_path: Optional[Path] = None):
+        """
+        Args:
+            repo_path: Repository root
+            ruleset_hash: Hash of the rules and scanner version; a different
+                          hash discards what was stored for the repository
+            store_path: SQLite file to persist to, or None for in-memory only
+        """
+        self.repo = str(Path(repo_path).resolve())
+        self.ruleset_hash = ruleset_hash
+        # Changes not written yet: (relative path, new confidence or None to remove)
+        self.pending: List[Tuple[str, Optional[FileReadiness]]] = []
+
+        if store_path is not None:
+            store_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; writes are grouped by _transaction()
+        self.conn = sqlite3.connect(
+            str(store_path) if store_path is not None else ":memory:", timeout=30, isolation_level=None
+        )
+        if store_path is not None:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+        with self._transaction():
+            self._stored_totals()
+
+    @classmethod
+    def from_settings(cls, repo_path: str, ruleset_hash: str, enabled: Optional[bool] = None) -> "ReadinessIndex":
+        """
+        Open the repository's index, persisted if settings.enable_caching is on
+
+        Args:
+            repo_path: Repository root
+            ruleset_hash: Hash of the rules and scanner version
+            enabled: Override settings.enable_caching
+        """
+        settings = get_settings()
+        if enabled is None:
+            enabled = settings.get("enable_caching", False)
+        if not enabled:
+            return cls(repo_path, ruleset_hash)
+
+        cache_dir = Path(settings.get("cache_dir") or os.environ.get("INTELLIGENTSCAN_CACHE_DIR", DEFAULT_CACHE_DIR))
+        return cls(repo_path, ruleset_hash, cache_dir / INDEX_FILE_NAME)
+
+    def is_current(self, rel_path: str, stat: os.stat_result) -> bool:
+        """True if rel_path's stored confidence is for its current size and mtime"""
+        row = self.conn.execute(
+            "SELECT size, mtime_ns FROM readiness_files WHERE repo = ? AND path = ?", (self.repo, rel_path)
+        ).fetchone()
+        return row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns
+
+    def update(self, readiness: FileReadiness):
+        """Store a file's confidence, replacing its previous one in the totals"""
+        self.pending.append((readiness.rel_path, readiness))
+        if len(self.pending) >= COMMIT_BATCH_FILES:
+            self.commit()
+
+    def remove(self, rel_path: str):
+        """Drop a file (deleted, or no longer analyzable) from the index"""
+        self.pending.append((rel_path, None))
+        if len(self.pending) >= COMMIT_BATCH_FILES:
+            self.commit()
+
+    def retain(self, rel_paths: Set[str]):
+        """Drop every file not in rel_paths"""
+        self.commit()
+        stored = [path for (path,) in self.conn.execute(
+            "SELECT path FROM readiness_files WHERE repo = ?", (self.repo,)
+        )]
+        for path in stored:
+            if path not in rel_paths:
+                self.remove(path)
+        self.commit()
+
+    def commit(self):
+        """Write the pending changes and adjust the stored totals in one transaction"""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+
+        with self._transaction():
+            # Totals are re-read under the write lock, so concurrent scans add up
+            weighted_confidence, weight, files, rule_totals = self._stored_totals()
+            for rel_path, readiness in pending:
+                row = self.conn.execute(
+                    "SELECT confidence, weight, issue_counts FROM readiness_files WHERE repo = ? AND path = ?",
+                    (self.repo, rel_path)
+                ).fetchone()
+                if row is not None:
+                    self.conn.execute(
+                        "DELETE FROM readiness_files WHERE repo = ? AND path = ?", (self.repo, rel_path)
+                    )
+                    weighted_confidence -= row[0] * row[1]
+                    weight -= row[1]
+                    files -= 1
+                    for rule, count in json.loads(row[2]).items():
+                        totals = rule_totals.get(rule)
+                        if totals is None:
+                            continue
+                        totals[0] -= 1
+                        totals[1] -= count
+                        if totals[0] <= 0:
+                            del rule_totals[rule]
+
+                if readiness is None:
+                    continue
+                self.conn.execute(
+                    "INSERT INTO readiness_files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.repo, readiness.rel_path, readiness.size, readiness.mtime_ns,
+                        readiness.confidence, readiness.weight, json.dumps(readiness.issue_counts),
+                        json.dumps(readiness.issues) if readiness.issues is not None else None
+                    )
+                )
+                weighted_confidence += readiness.confidence * readiness.weight
+                weight += readiness.weight
+                files += 1
+                for rule, count in readiness.issue_counts.items():
+                    totals = rule_totals.setdefault(rule, [0, 0])
+                    totals[0] += 1
+                    totals[1] += count
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO readiness_totals VALUES (?, ?, ?, ?, ?, ?)",
+                (self.repo, self.ruleset_hash, weighted_confidence, weight, files, json.dumps(rule_totals))
+            )
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction that takes the database's write lock up front"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _stored_totals(self) -> Tuple[float, int, int, Dict[str, List[int]]]:
+        """
+        Stored (weighted confidence, weight, files, rule -> [files affected, occurrences])
+
+        Called inside a transaction; rows stored under another ruleset are
+        discarded and the totals start from zero.
+        """
+        row = self.conn.execute(
+            "SELECT ruleset, weighted_confidence, weight, files, rule_totals FROM readiness_totals WHERE repo = ?",
+            (self.repo,)
+        ).fetchone()
+        if row is not None and row[0] == self.ruleset_hash:
+            return row[1], row[2], row[3], json.loads(row[4])
+
+        self.conn.execute("DELETE FROM readiness_files WHERE repo = ?", (self.repo,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO readiness_totals VALUES (?, ?, 0.0, 0, 0, '{}')", (self.repo, self.ruleset_hash)
+        )
+        return 0.0, 0, 0, {}
+
+    def totals(self) -> Tuple[float, int, int, Dict[str, List[int]]]:
+        """Stored totals once the pending changes are written (see _stored_totals)"""
+        self.commit()
+        row = self.conn.execute(
+            "SELECT weighted_confidence, weight, files, rule_totals FROM readiness_totals "
+            "WHERE repo = ? AND ruleset = ?",
+            (self.repo, self.ruleset_hash)
+        ).fetchone()
+        if row is None:
+            return 0.0, 0, 0, {}
+        return row[0], row[1], row[2], json.loads(row[3])
+
+    @property
+    def score(self) -> float:
+        """Repository score from 0 to 100 (100.0 when no file is indexed)"""
+        weighted_confidence, weight, _, _ = self.totals()
+        if weight <= 0:
+            return 100.0
+        return round(100.0 * weighted_confidence / weight, 1)
+
+    @property
+    def files(self) -> int:
+        """Number of files in the index"""
+        return self.totals()[2]
+
+    @property
+    def rule_totals(self) -> Dict[str, List[int]]:
+        """rule -> [files affected, occurrences]"""
+        return self.totals()[3]
+
+    def lowest(self, limit: int = MAX_LOW_CONFIDENCE_AREAS) -> List[Dict[str, Any]]:
+        """The least confident files below LOW_CONFIDENCE_THRESHOLD, lowest first"""
+        self.commit()
+        rows = self.conn.execute(
+            "SELECT path, confidence, issue_counts, issues FROM readiness_files "
+            "WHERE repo = ? AND confidence < ? ORDER BY confidence, path LIMIT ?",
+            (self.repo, LOW_CONFIDENCE_THRESHOLD, limit)
+        )
+        return [
+            {
+                "file": path,
+                "confidence": confidence,
+                "issue_counts": json.loads(issue_counts),
+                "issues": json.loads(issues) if issues else [],
+            }
+            for path, confidence, issue_counts, issues in rows
+        ]
+
+    def close(self):
+        """Commit and close the database"""
+        try:
+            self.commit()
+        finally:
+            self.conn.close()
 
 
 class AIReadinessScanner:
@@ -17,23 +512,272 @@ class AIReadinessScanner:
     def __init__(self, repo_path: str):
         self.repo_path = Path(repo_path)
         self.low_confidence_areas = []
+        self.skipped_files = []
+        self.parse_errors = []
+        self.files_analyzed = 0
+        self.walker = None
+        self.progress = None
 
-    async def scan(self, include_suggestions: bool = True) -> Dict[str, Any]:
+        settings = get_settings()
+        self.max_file_bytes = settings.get("max_file_size_kb", 1024) * 1024
+
+    async def scan(
+        self,
+        include_suggestions: bool = True,
+        max_workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Perform AI-readiness scan without blocking the event loop (see scan_sync)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.scan_sync, include_suggestions, max_workers, progress=progress)
+        )
+
+    def scan_sync(
+        self,
+        include_suggestions: bool = True,
+        max_workers: Optional[int] = None,
+        use_index: Optional[bool] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """
         Perform AI-readiness scan
 
+        Walks the repository once; files already in the readiness index with
+        the same size and mtime are not read, every other file is analyzed and
+        its confidence replaces the old one in the index.
+
         Args:
             include_suggestions: Whether to include improvement suggestions
+            max_workers: Worker processes to shard files across, or None to follow
+                         settings.parallel_scanning / settings.max_workers
+            use_index: Persist the readiness index between scans, or None to
+                       follow settings.enable_caching
+            progress: Called with (files analyzed, total files or None) as the
+                      scan advances; files the index skips are not counted
 
         Returns:
             AI-readiness results
         """
-        # TODO: Implement full AI-readiness scanning
-        # For now, return placeholder results
+        start_time = datetime.now()
+        self.progress = progress
+        self.skipped_files = []
+        self.parse_errors = []
+        self.files_analyzed = 0
+
+        rule_configs = self._enabled_rules()
+        index = ReadinessIndex.from_settings(
+            str(self.repo_path), hash_ruleset(rule_configs, SCANNER_VERSION, AST_ANALYZER_VERSION), use_index
+        )
+
+        self.walker = RepositoryWalker(self.repo_path, {"ai_readiness": AI_READINESS_FILE_PATTERNS})
+        worker_count = resolve_worker_count(max_workers)
+
+        try:
+            seen: Set[str] = set()
+            stale = self._stale_entries(index, seen)
+
+            if worker_count > 1:
+                stale = list(stale)
+            if worker_count > 1 and len(stale) >= MIN_FILES_FOR_PARALLEL:
+                worker = partial(_analyze_shard, str(self.repo_path), rule_configs)
+                shards = shard(stale, worker_count)
+                for shard_result in map_shards(worker, shards, worker_count, shard_progress(progress, len(stale))):
+                    self._apply(index, seen, shard_result["outcomes"])
+                    self.files_analyzed += shard_result["files_analyzed"]
+                    self.skipped_files.extend(shard_result["skipped_files"])
+                    self.parse_errors.extend(shard_result["parse_errors"])
+                    self.walker.stats.files_read += shard_result["files_read"]
+                    self.walker.stats.bytes_read += shard_result["bytes_read"]
+            else:
+                # One streaming pass: each file is folded into the index as soon as it is analyzed
+                worker_count = 1
+                self._apply(index, seen, self._analyze_entries(stale, rule_configs))
+
+            index.retain(seen)
+            self.low_confidence_areas = index.lowest()
+
+            results = {
+                "ai_readiness_score": index.score,
+                "total_files_analyzed": index.files,
+                "files_reanalyzed": self.files_analyzed,
+                "low_confidence_areas": self.low_confidence_areas,
+                "suggestions": self._suggestions(rule_configs, index) if include_suggestions else None,
+                "rules_applied": sorted(rule_configs),
+                "scan_metadata": {
+                    "start_time": start_time.isoformat(),
+                    "duration_seconds": (datetime.now() - start_time).total_seconds(),
+                    "io_stats": self.walker.stats.to_dict(),
+                    "skipped_files": self.skipped_files,
+                    "parse_errors": self.parse_errors,
+                    "workers": worker_count
+                }
+            }
+        finally:
+            index.close()
+
+        return results
+
+    def update_file(self, rel_path: str, use_index: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Re-analyze one changed (or deleted) file and update the repository score
+
+        Only that file is read; the score comes from the index totals.
+
+        Args:
+            rel_path: Path of the file relative to the repository
+            use_index: Use the persisted readiness index, or None to follow
+                       settings.enable_caching
+
+        Returns:
+            The file's confidence (None if it no longer exists or cannot be
+            scored) and the updated repository score
+        """
+        rule_configs = self._enabled_rules()
+        index = ReadinessIndex.from_settings(
+            str(self.repo_path), hash_ruleset(rule_configs, SCANNER_VERSION, AST_ANALYZER_VERSION), use_index
+        )
+        self.walker = RepositoryWalker(self.repo_path, {"ai_readiness": AI_READINESS_FILE_PATTERNS})
+
+        try:
+            confidence = None
+            entries = list(self.walker.walk_paths([rel_path]))
+            for outcome in self._analyze_entries(entries, rule_configs):
+                if isinstance(outcome, FileReadiness):
+                    index.update(outcome)
+                    confidence = outcome.confidence
+            if confidence is None:
+                index.remove(rel_path)
+
+            return {
+                "file": rel_path,
+                "confidence": confidence,
+                "ai_readiness_score": index.score,
+                "total_files_analyzed": index.files,
+            }
+        finally:
+            index.close()
 
+    @staticmethod
+    def _apply(index: "ReadinessIndex", seen: Set[str], outcomes: Iterable[Any]):
+        """Fold analysis outcomes into the index; a bare path means the file could not be scored"""
+        for outcome in outcomes:
+            if isinstance(outcome, FileReadiness):
+                index.update(outcome)
+            else:
+                index.remove(outcome)
+                seen.discard(outcome)
+
+    def _enabled_rules(self) -> Dict[str, Dict[str, Any]]:
+        """Get the enabled ai_readiness_rules that apply to Python"""
+        rules = load_rules_config().get("ai_readiness_rules", {}) or {}
         return {
-            "ai_readiness_score": 75,  # Placeholder
-            "total_files_analyzed": 0,
-            "low_confidence_areas": [],
-            "suggestions": [] if include_suggestions else None
+            name: config for name, config in rules.items()
+            if config.get("enabled", True)
+            and "python" in config.get("applicable_languages", ["python"])
         }
+
+    def _stale_entries(self, index: ReadinessIndex, seen: Set[str]) -> Iterable[Tuple[Path, str, Tuple[str, ...]]]:
+        """Yield the walked files the index has no current confidence for, adding every file to seen"""
+        for entry in self.walker.walk():
+            file_path, rel_path, _ = entry
+            seen.add(rel_path)
+            try:
+                if index.is_current(rel_path, file_path.stat()):
+                    continue
+            except OSError:
+                continue
+            yield entry
+
+    def _analyze_entries(
+        self,
+        entries: Iterable[Tuple[Path, str, Tuple[str, ...]]],
+        rule_configs: Dict[str, Dict[str, Any]]
+    ) -> Iterator[Any]:
+        """
+        Analyze each (path, relative path, rules) entry
+
+        Yields:
+            FileReadiness of each analyzed file, or the relative path of a file
+            that could not be scored (skipped or not parseable)
+        """
+        total = len(entries) if isinstance(entries, list) else None
+        for done, (file_path, rel_path, _) in enumerate(entries, 1):
+            if self.progress is not None:
+                self.progress(done, total)
+            try:
+                stat = file_path.stat()
+                reason = name_skip_reason(file_path.name)
+                if reason is None and stat.st_size > self.max_file_bytes:
+                    reason = "max_file_size"
+
+                parsed = None
+                if reason is None:
+                    parsed = ParsedFile(file_path, rel_path, self.walker)
+                    reason = content_skip_reason(parsed.data)
+
+                if reason is not None:
+                    self.skipped_files.append({"file": rel_path, "reason": reason, "size_bytes": stat.st_size})
+                    yield rel_path
+                    continue
+
+                readiness = analyze_readiness(parsed, rule_configs, stat)
+                self.files_analyzed += 1
+
+            except SyntaxError as e:
+                self.parse_errors.append({"file": rel_path, "line": e.lineno or 0, "error": str(e)})
+                yield rel_path
+                continue
+
+            except Exception as e:
+                # Log error but continue scanning
+                print(f"Error analyzing {file_path}: {str(e)}")
+                yield rel_path
+                continue
+
+            yield readiness
+
+    def _suggestions(self, rule_configs: Dict[str, Dict[str, Any]], index: ReadinessIndex) -> List[Dict[str, Any]]:
+        """One suggestion per rule with findings, largest expected gain first"""
+        suggestions = []
+        for rule, (files_affected, occurrences) in index.rule_totals.items():
+            config = rule_configs.get(rule)
+            if config is None or files_affected <= 0:
+                continue
+            suggestions.append({
+                "rule": rule,
+                "description": config.get("description", ""),
+                "suggestion": config.get("suggestion", ""),
+                "severity": config.get("severity", "low"),
+                "confidence_impact": config.get("confidence_impact", 0.0),
+                "files_affected": files_affected,
+                "occurrences": occurrences,
+            })
+
+        suggestions.sort(key=lambda item: (item["confidence_impact"] * item["files_affected"], item["rule"]))
+        return suggestions
+
+
+def _analyze_shard(
+    repo_path: str,
+    rule_configs: Dict[str, Dict[str, Any]],
+    entries: List[Tuple[Path, str, Tuple[str, ...]]]
+) -> Dict[str, Any]:
+    """
+    Analyze one shard of files inside a worker process
+
+    Returns:
+        Outcomes in entry order (see AIReadinessScanner._analyze_entries) plus counters
+    """
+    scanner = AIReadinessScanner(repo_path)
+    scanner.walker = RepositoryWalker(scanner.repo_path, {})
+    outcomes = list(scanner._analyze_entries(entries, rule_configs))
+
+    return {
+        "outcomes": outcomes,
+        "files_analyzed": scanner.files_analyzed,
+        "skipped_files": scanner.skipped_files,
+        "parse_errors": scanner.parse_errors,
+        "files_read": scanner.walker.stats.files_read,
+        "bytes_read": scanner.walker.stats.bytes_read,
+    }
@@ -0,0 +1,501 @@
+"""
+ARB Rule Engine for IntelligentScan
+Compiles the declarative ast_patterns of the ARB rules in rules.yaml once per
+process into matchers indexed by AST node type. Each file's tree is walked
+once, and every node is only offered to the patterns registered for its type,
+so adding rules does not add work for nodes they cannot match.
+
+Pattern types (the "type" key of an ast_patterns entry):
+    assignment              String literal assigned to a variable whose name
+                            contains one of variable_names
+    route_decorator         Web route handler (e.g. @app.get("/items")) without
+                            any of the decorators in missing_decorator
+    call                    Call to one of function_names (dotted names,
+                            resolved through the file's imports)
+    missing_error_handling  Function of at least min_statements statements
+                            without a try block
+    import_cycle            Module that is part of a circular import; checked
+                            once per scan against the repository's import graph
+
+Rules are currently evaluated against Python files only.
+"""
+
+import ast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from intelligentscan.scanners.import_graph import ImportGraph
+from intelligentscan.utils.scan_cache import hash_ruleset
+
+
+# Node types that open a function for the engine's function tracking
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+TRY_NODES = (ast.Try, ast.TryStar) if hasattr(ast, "TryStar") else (ast.Try,)
+
+# Attribute names that make a decorator a web route (@app.route, @router.get, ...)
+DEFAULT_ROUTE_DECORATORS = ["route", "get", "post", "put", "patch", "delete", "api_route", "websocket"]
+
+# Modules whose decorators share those names but never declare routes (@mock.patch)
+NON_ROUTE_MODULES = ("mock", "unittest.mock")
+
+# Severity weights used by compliance_score
+SEVERITY_WEIGHTS = {"critical": 1.0, "high": 0.75, "medium": 0.5, "low": 0.25}
+
+
+def dotted_name(node: ast.AST) -> Optional[str]:
+    """Get "a.b.c" for a Name/Attribute chain, or None for anything else"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+class ARBRule:
+    """Metadata of one ARB rule, copied into each of its violations"""
+
+    __slots__ = ("rule_id", "title", "category", "severity", "description", "remediation")
+
+    def __init__(self, rule_id: str, config: Dict[str, Any]):
+        self.rule_id = rule_id
+        self.title = config.get("title", rule_id)
+        self.category = config.get("category", "other")
+        self.severity = config.get("severity", "medium")
+        self.description = config.get("description", "")
+        self.remediation = config.get("remediation", "")
+
+
+def make_violation(rule: ARBRule, rel_path: str, line: int, detail: str) -> Dict[str, Any]:
+    """Build the violation record for rule at a file and line"""
+    return {
+        "rule_id": rule.rule_id,
+        "rule_title": rule.title,
+        "category": rule.category,
+        "severity": rule.severity,
+        "file": rel_path,
+        "line": line,
+        "description": detail,
+        "remediation": rule.remediation,
+    }
+
+
+class FileContext:
+    """Per-file state kept by the engine while walking one tree"""
+
+    __slots__ = ("rel_path", "violations", "imports", "functions")
+
+    def __init__(self, rel_path: str):
+        self.rel_path = rel_path
+        self.violations: List[Dict[str, Any]] = []
+        # Local name -> fully qualified name, from import statements seen so far
+        self.imports: Dict[str, str] = {}
+        # One [handles_errors] flag per enclosing function
+        self.functions: List[List[bool]] = []
+
+    def report(self, rule: ARBRule, node: ast.AST, detail: str):
+        """Record a violation of rule at node"""
+        self.violations.append(make_violation(rule, self.rel_path, getattr(node, "lineno", 0), detail))
+
+
+class NodePattern:
+    """
+    One compiled ast_patterns entry
+
+    Subclasses list the node types they inspect; the engine calls enter() for
+    ENTER_TYPES on the way down and leave() for LEAVE_TYPES once a node's
+    subtree has been walked. Patterns hold no per-file state, so one compiled
+    engine can serve concurrent scans.
+    """
+
+    ENTER_TYPES: Tuple[Type[ast.AST], ...] = ()
+    LEAVE_TYPES: Tuple[Type[ast.AST], ...] = ()
+    # Engine bookkeeping the pattern relies on
+    NEEDS_IMPORTS = False
+    NEEDS_FUNCTIONS = False
+
+    def __init__(self, rule: ARBRule, spec: Dict[str, Any]):
+        self.rule = rule
+
+    def enter(self, node: ast.AST, ctx: FileContext):
+        """Inspect a node before its children"""
+
+    def leave(self, node: ast.AST, ctx: FileContext):
+        """Inspect a node after its children"""
+
+
+class AssignmentPattern(NodePattern):
+    """String literal assigned to a variable with a credential-like name"""
+
+    ENTER_TYPES = (ast.Assign, ast.AnnAssign)
+
+    def __init__(self, rule: ARBRule, spec: Dict[str, Any]):
+        super().__init__(rule, spec)
+        self.variable_names = [name.lower() for name in spec.get("variable_names", [])]
+        self.value_type = spec.get("value_type", "string_literal")
+
+    def enter(self, node: ast.AST, ctx: FileContext):
+        value = node.value
+        if self.value_type == "string_literal" and not (
+            isinstance(value, ast.Constant) and isinstance(value.value, str)
+        ):
+            return
+
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        for target in targets:
+            if isinstance(target, ast.Name):
+                name = target.id
+            elif isinstance(target, ast.Attribute):
+                name = target.attr
+            else:
+                continue
+
+            if any(keyword in name.lower() for keyword in self.variable_names):
+                ctx.report(self.rule, node, f"String literal assigned to '{name}'")
+
+
+class RouteDecoratorPattern(NodePattern):
+    """Route handler without any of the required decorators"""
+
+    ENTER_TYPES = FUNCTION_NODES
+    NEEDS_IMPORTS = True
+
+    def __init__(self, rule: ARBRule, spec: Dict[str, Any]):
+        super().__init__(rule, spec)
+        self.required = set(spec.get("missing_decorator", []))
+        self.route_decorators = set(spec.get("route_decorators", DEFAULT_ROUTE_DECORATORS))
+
+    def enter(self, node: ast.AST, ctx: FileContext):
+        is_route = False
+        names = set()
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            name = dotted_name(target)
+            if name is None:
+                continue
+            names.add(name.rsplit(".", 1)[-1])
+            if not is_route and isinstance(decorator, ast.Call) and isinstance(target, ast.Attribute):
+                is_route = self._is_route(decorator, name, ctx)
+
+        if is_route and not names & self.required:
+            ctx.report(
+                self.rule, node,
+                f"Route handler '{node.name}' has no {' / '.join(sorted(self.required))} decorator"
+            )
+
+    def _is_route(self, decorator: ast.Call, name: str, ctx: FileContext) -> bool:
+        """Whether @<receiver>.<attr>(...) declares a route: @app.get("/path") and friends"""
+        receiver, _, attr = name.rpartition(".")
+        if attr not in self.route_decorators:
+            return False
+
+        # Resolve the receiver through the file's imports (from unittest import mock)
+        head, _, rest = receiver.partition(".")
+        qualified = ctx.imports.get(head, head) + ("." + rest if rest else "")
+        if qualified in NON_ROUTE_MODULES:
+            return False
+
+        # Routes are declared with a path; @mock.patch("os.getcwd") and friends are not
+        path = decorator.args[0] if decorator.args else next(
+            (keyword.value for keyword in decorator.keywords if keyword.arg in ("path", "rule")), None
+        )
+        return isinstance(path, ast.Constant) and isinstance(path.value, str) and path.value.startswith("/")
+
+
+class CallPattern(NodePattern):
+    """Call to one of a set of functions"""
+
+    ENTER_TYPES = (ast.Call,)
+    NEEDS_IMPORTS = True
+
+    def __init__(self, rule: ARBRule, spec: Dict[str, Any]):
+        super().__init__(rule, spec)
+        self.function_names = set(spec.get("function_names", []))
+        # Last component of every name, for a cheap first check
+        self.last_parts = {name.rsplit(".", 1)[-1] for name in self.function_names}
+
+    def enter(self, node: ast.AST, ctx: FileContext):
+        func = node.func
+        last = func.attr if isinstance(func, ast.Attribute) else func.id if isinstance(func, ast.Name) else None
+        if last not in self.last_parts:
+            return
+
+        name = dotted_name(func)
+        if name is None:
+            return
+
+        # Resolve the leading name through the file's imports (import psycopg2 as pg)
+        head, _, rest = name.partition(".")
+        qualified = ctx.imports.get(head, head) + ("." + rest if rest else "")
+
+        if qualified in self.function_names:
+            ctx.report(self.rule, node, f"Direct call to '{qualified}'")
+
+
+class MissingErrorHandlingPattern(NodePattern):
+    """Function without any try block"""
+
+    LEAVE_TYPES = FUNCTION_NODES
+    NEEDS_FUNCTIONS = True
+
+    def __init__(self, rule: ARBRule, spec: Dict[str, Any]):
+        super().__init__(rule, spec)
+        self.min_statements = spec.get("min_statements", 1)
+        self.exempt_prefixes = tuple(spec.get("exempt_prefixes", []))
+
+    def leave(self, node: ast.AST, ctx: FileContext):
+        handles_errors = ctx.functions[-1][0]
+        if handles_errors or len(node.body) < self.min_statements:
+            return
+        if self.exempt_prefixes and node.name.startswith(self.exempt_prefixes):
+            return
+        ctx.report(self.rule, node, f"Function '{node.name}' has no error handling")
+
+
+class ImportCyclePattern:
+    """Module that is part of a circular import (checked against the whole repository)"""
+
+    def __init__(self, rule: ARBRule, spec: Dict[str, Any]):
+        self.rule = rule
+
+    def check_graph(self, graph: ImportGraph) -> List[Dict[str, Any]]:
+        """
+        Report every module of every import cycle
+
+        Each module is reported at its first import of another module in the
+        same cycle, with one shortest example cycle per strongly connected
+        component.
+        """
+        violations = []
+        for cycle in graph.cycles():
+            example = [graph.modules[member] for member in cycle.example]
+            members = set(cycle.members)
+
+            for member in cycle.members:
+                line, target = min(
+                    (line, target) for target, line in graph.adjacency[member].items() if target in members
+                )
+                violation = make_violation(
+                    self.rule, graph.paths[member], line,
+                    f"Module '{graph.modules[member]}' imports '{graph.modules[target]}' and is part of "
+                    f"an import cycle of {len(cycle.members)} modules"
+                )
+                violation["cycle"] = example
+                violations.append(violation)
+
+        return violations
+
+
+# ast_patterns "type" -> pattern class
+PATTERN_TYPES: Dict[str, Callable[[ARBRule, Dict[str, Any]], NodePattern]] = {
+    "assignment": AssignmentPattern,
+    "route_decorator": RouteDecoratorPattern,
+    "call": CallPattern,
+    "missing_error_handling": MissingErrorHandlingPattern,
+}
+
+# ast_patterns "type" -> pattern checked once per scan against the import graph
+REPOSITORY_PATTERN_TYPES: Dict[str, Callable[[ARBRule, Dict[str, Any]], ImportCyclePattern]] = {
+    "import_cycle": ImportCyclePattern,
+}
+
+
+class ARBRuleEngine:
+    """
+    ARB rules compiled into node-type-indexed matchers
+
+    Build through get_arb_engine() so each ruleset is compiled once per process.
+    """
+
+    def __init__(self, rule_configs: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            rule_configs: ARB rule id -> rule config from rules.yaml
+        """
+        self.rules: Dict[str, ARBRule] = {}
+        # Rules with nothing the engine can evaluate, and why
+        self.rules_not_evaluated: Dict[str, str] = {}
+        self.patterns: List[NodePattern] = []
+        self.repository_patterns: List[ImportCyclePattern] = []
+
+        for rule_id, config in rule_configs.items():
+            languages = config.get("applicable_languages")
+            if languages and "python" not in languages:
+                self.rules_not_evaluated[rule_id] = "no python support"
+                continue
+
+            rule = ARBRule(rule_id, config)
+            specs = config.get("pattern_matching", {}).get("ast_patterns", [])
+            compiled = [PATTERN_TYPES[spec["type"]](rule, spec) for spec in specs if spec.get("type") in PATTERN_TYPES]
+            repository = [
+                REPOSITORY_PATTERN_TYPES[spec["type"]](rule, spec)
+                for spec in specs if spec.get("type") in REPOSITORY_PATTERN_TYPES
+            ]
+            if not compiled and not repository:
+                self.rules_not_evaluated[rule_id] = "no supported ast_patterns"
+                continue
+
+            self.rules[rule_id] = rule
+            self.patterns.extend(compiled)
+            self.repository_patterns.extend(repository)
+
+        self.enter_index: Dict[Type[ast.AST], List[NodePattern]] = {}
+        self.leave_index: Dict[Type[ast.AST], List[NodePattern]] = {}
+        for pattern in self.patterns:
+            for node_type in pattern.ENTER_TYPES:
+                self.enter_index.setdefault(node_type, []).append(pattern)
+            for node_type in pattern.LEAVE_TYPES:
+                self.leave_index.setdefault(node_type, []).append(pattern)
+
+        self.track_imports = any(pattern.NEEDS_IMPORTS for pattern in self.patterns)
+        self.track_functions = any(pattern.NEEDS_FUNCTIONS for pattern in self.patterns)
+
+        # Node types whose leave step does something
+        self._leave_types = set(self.leave_index)
+        if self.track_functions:
+            self._leave_types.update(FUNCTION_NODES)
+
+    def check_tree(self, tree: ast.AST, rel_path: str) -> List[Dict[str, Any]]:
+        """
+        Check one file's syntax tree against every compiled rule
+
+        Args:
+            tree: Parsed module
+            rel_path: Path of the file relative to the repository
+
+        Returns:
+            Violations ordered by line
+        """
+        ctx = FileContext(rel_path)
+        enter_index = self.enter_index
+        leave_index = self.leave_index
+        leave_types = self._leave_types
+
+        # Iterative depth-first walk; None marks "leave the node below it"
+        stack: List[Optional[ast.AST]] = [tree]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                node = stack.pop()
+                for pattern in leave_index.get(type(node), ()):
+                    pattern.leave(node, ctx)
+                if self.track_functions and isinstance(node, FUNCTION_NODES):
+                    ctx.functions.pop()
+                continue
+
+            node_type = type(node)
+            if self.track_functions:
+                if node_type in FUNCTION_NODES:
+                    ctx.functions.append([False])
+                elif node_type in TRY_NODES and ctx.functions:
+                    ctx.functions[-1][0] = True
+            if self.track_imports and node_type in (ast.Import, ast.ImportFrom):
+                self._record_imports(node, ctx)
+
+            for pattern in enter_index.get(node_type, ()):
+                pattern.enter(node, ctx)
+
+            if node_type in leave_types:
+                stack.append(node)
+                stack.append(None)
+
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            stack.extend(children)
+
+        # Leave-time checks report after the nodes inside them
+        ctx.violations.sort(key=lambda violation: violation["line"])
+        return ctx.violations
+
+    @property
+    def needs_import_graph(self) -> bool:
+        """True if some rule is checked against the repository's import graph"""
+        return bool(self.repository_patterns)
+
+    @property
+    def repository_rule_ids(self) -> Set[str]:
+        """Rules whose violations depend on the whole repository rather than one file"""
+        return {pattern.rule.rule_id for pattern in self.repository_patterns}
+
+    def check_repository(self, graph: ImportGraph) -> List[Dict[str, Any]]:
+        """
+        Check the repository-level rules
+
+        Args:
+            graph: Built import graph of the repository
+
+        Returns:
+            Violations ordered by file and line
+        """
+        violations = []
+        for pattern in self.repository_patterns:
+            violations.extend(pattern.check_graph(graph))
+        violations.sort(key=lambda violation: (violation["file"], violation["line"]))
+        return violations
+
+    @staticmethod
+    def _record_imports(node: ast.AST, ctx: FileContext):
+        """Remember what the names bound by an import statement refer to"""
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    ctx.imports[alias.asname] = alias.name
+                else:
+                    # import a.b binds "a"
+                    head = alias.name.split(".", 1)[0]
+                    ctx.imports[head] = head
+        elif node.module and not node.level:
+            for alias in node.names:
+                ctx.imports[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+
+
+def compliance_score(violations: List[Dict[str, Any]], files_checked: int) -> float:
+    """
+    Score compliance from 0 to 100
+
+    Each checked file without violations counts fully; a file with violations
+    loses the weight of its worst severity (critical 1.0 ... low 0.25).
+
+    Args:
+        violations: Violations found
+        files_checked: Number of files checked
+
+    Returns:
+        Percentage, 100.0 when no files were checked
+    """
+    if files_checked <= 0:
+        return 100.0
+
+    worst: Dict[str, float] = {}
+    for violation in violations:
+        weight = SEVERITY_WEIGHTS.get(violation.get("severity"), 0.5)
+        file_path = violation.get("file")
+        if weight > worst.get(file_path, 0.0):
+            worst[file_path] = weight
+
+    return round(100.0 * (1 - sum(worst.values()) / max(files_checked, len(worst))), 1)
+
+
+# Process-wide cache so each ruleset is compiled once per scanner process
+_ENGINE_CACHE: Dict[str, ARBRuleEngine] = {}
+
+
+def get_arb_engine(rule_configs: Dict[str, Dict[str, Any]]) -> ARBRuleEngine:
+    """
+    Get the process-wide ARBRuleEngine for a set of ARB rules
+
+    Args:
+        rule_configs: ARB rule id -> rule config
+
+    Returns:
+        Shared ARBRuleEngine instance
+    """
+    signature = hash_ruleset(rule_configs)
+
+    engine = _ENGINE_CACHE.get(signature)
+    if engine is None:
+        engine = ARBRuleEngine(rule_configs)
+        _ENGINE_CACHE[signature] = engine
+
+    return engine
@@ -7,36 +7,285 @@ Supports Python, Java, JavaScript (can be extended to other languages)
 import ast
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Union
+from dataclasses import dataclass, field
+from functools import partial
 
+from intelligentscan.scanners.parallel import (
+    MIN_FILES_FOR_PARALLEL, resolve_worker_count, shard, map_shards
+)
+from intelligentscan.scanners.line_index import LineIndex
+from intelligentscan.scanners.parsed_files import ParsedFile, SourceLines
+from intelligentscan.utils.scan_cache import ScanResultCache
 
-@dataclass
+
+# Bump whenever violations change for the same source (invalidates the cache)
+AST_ANALYZER_VERSION = "ast/6"
+
+# Functions with a higher cyclomatic complexity are reported as high_complexity
+HIGH_COMPLEXITY_THRESHOLD = 10
+
+# Files an AST analyzer exists for (all but *.py through tree-sitter)
+AST_FILE_PATTERNS = ["*.py", "*.java", "*.js", "*.jsx", "*.mjs", "*.cjs", "*.ts", "*.tsx"]
+
+# Nodes that each add one path through a function
+_BRANCH_NODES = (
+    ast.If, ast.IfExp, ast.While, ast.For, ast.AsyncFor,
+    ast.ExceptHandler, ast.Assert, ast.match_case
+)
+
+
+def _decision_points(node: ast.AST) -> int:
+    """Count the decision points a single node adds to its function's complexity"""
+    if isinstance(node, _BRANCH_NODES):
+        return 1
+    if isinstance(node, ast.BoolOp):
+        return len(node.values) - 1
+    if isinstance(node, ast.comprehension):
+        # The loop itself plus each filter
+        return 1 + len(node.ifs)
+    if isinstance(node, ast.Try):
+        # Handlers are counted on their own; "else" is one more path
+        return 1 if node.orelse else 0
+    return 0
+
+
+# Single-letter names conventional enough not to report
+_CONVENTIONAL_SHORT_NAMES = frozenset(['i', 'j', 'k', 'x', 'y', 'z', '_', '$'])
+
+
+def _is_poor_name(name: Optional[str]) -> bool:
+    """Check if a bound name is a single letter without a conventional meaning"""
+    return name is not None and len(name) == 1 and name not in _CONVENTIONAL_SHORT_NAMES
+
+
+def _target_names(target: ast.AST) -> Set[str]:
+    """Names bound by an assignment target (including tuple unpacking)"""
+    return {
+        node.id for node in ast.walk(target)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+    }
+
+
+class _Scope:
+    """Single-letter names bound and referenced in one Python scope"""
+
+    __slots__ = ("kind", "bindings", "free", "loop_targets", "declared")
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        # name -> [first line, references, function name, class name]
+        self.bindings: Dict[str, list] = {}
+        # Same layout, for names referenced here but not bound here (so far)
+        self.free: Dict[str, list] = {}
+        # Loop and comprehension variables, which are never reported
+        self.loop_targets: Set[str] = set()
+        # name -> "global" / "nonlocal"
+        self.declared: Dict[str, str] = {}
+
+
+@dataclass(slots=True)
 class ASTViolation:
-    """Represents a violation found via AST analysis"""
+    """
+    Represents a violation found via AST analysis
+
+    Large files produce tens of thousands of these, so the record is compact:
+    the code snippet is not stored but rendered from the file's shared line
+    table when code_snippet is read.
+    """
     file_path: str
     line_number: int
     violation_type: str
     description: str
     severity: str
-    code_snippet: str
     function_name: Optional[str] = None
     class_name: Optional[str] = None
+    reference_count: Optional[int] = None
+    source: Optional[SourceLines] = field(default=None, repr=False, compare=False)
 
+    @property
+    def code_snippet(self) -> str:
+        """Code around the violation (rendered on demand)"""
+        if self.source is None:
+            return ""
+        return self.source.snippet(self.line_number)
+
+    def to_dict(self, include_snippet: bool = False) -> Dict[str, Any]:
+        """
+        Convert violation to dictionary
+
+        Args:
+            include_snippet: Render and include code_snippet
 
-class PythonASTAnalyzer(ast.NodeVisitor):
+        Returns:
+            Plain dictionary (accepted back by ASTViolation(**d) without the snippet)
+        """
+        result = {
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "violation_type": self.violation_type,
+            "description": self.description,
+            "severity": self.severity,
+            "function_name": self.function_name,
+            "class_name": self.class_name,
+        }
+        if self.reference_count is not None:
+            result["reference_count"] = self.reference_count
+        if include_snippet:
+            result["code_snippet"] = self.code_snippet
+        return result
+
+
+class BaseASTAnalyzer:
     """
-    AST analyzer for Python code
-    Detects violations that require semantic understanding
+    State and checks shared by the language-specific AST analyzers
+
+    Tracks the enclosing function and class, complexity counters and the
+    scopes used to report each poorly named binding once.
     """
 
-    def __init__(self, file_path: str, source_code: str):
+    # Scope kinds whose bindings are not visible to nested scopes
+    HIDDEN_SCOPE_KINDS = frozenset()
+
+    def __init__(self, file_path: str, source: SourceLines):
         self.file_path = file_path
-        self.source_code = source_code
-        self.lines = source_code.split('\n')
+        # One line table per file, shared by every violation for snippets
+        self.source = source
         self.violations: List[ASTViolation] = []
         self.current_function = None
         self.current_class = None
+        self.complexity_threshold = HIGH_COMPLEXITY_THRESHOLD
+        # Complexity counters of the functions enclosing the node being visited
+        self._complexity: List[int] = []
+        # Repeated description strings are stored once per file
+        self._texts: Dict[str, str] = {}
+        # Scopes enclosing the node being visited, module first
+        self._scopes: List[_Scope] = []
+
+    def _shared_text(self, text: str) -> str:
+        """Return the file's single copy of a description string"""
+        return self._texts.setdefault(text, text)
+
+    def _report_complexity(self, function_name: str, line_number: int, complexity_slot: int):
+        """Pop a function's complexity counter and report it if too high"""
+        complexity = self._complexity.pop()
+
+        # Nested functions are part of the enclosing function's complexity too
+        if self._complexity:
+            self._complexity[-1] += complexity - 1
+
+        # Check for overly complex functions (cyclomatic complexity); reported
+        # ahead of the violations found inside the function
+        if complexity > self.complexity_threshold:
+            self.violations.insert(complexity_slot, ASTViolation(
+                file_path=self.file_path,
+                line_number=line_number,
+                violation_type="high_complexity",
+                description=f"Function '{function_name}' has high complexity ({complexity}) - hard for AI to understand",
+                severity="medium",
+                source=self.source,
+                function_name=function_name,
+                class_name=self.current_class
+            ))
+
+    def _open_scope(self, kind: str):
+        """Enter a new scope"""
+        self._scopes.append(_Scope(kind))
+
+    def _record_name(self, name: str, line_number: int, bound: bool):
+        """Count one occurrence of a single-letter name in the current scope"""
+        scope = self._scopes[-1]
+        table = scope.bindings if bound and name not in scope.declared else scope.free
+
+        entry = table.get(name)
+        if entry is None:
+            table[name] = [line_number, 1, self.current_function, self.current_class]
+        else:
+            entry[1] += 1
+
+    def _close_scope(self):
+        """Leave a scope, resolving its references and reporting its bindings"""
+        scope = self._scopes.pop()
+
+        for name, entry in scope.free.items():
+            binding = scope.bindings.get(name)
+            if binding is not None:
+                binding[1] += entry[1]
+            elif self._scopes:
+                self._add_free(self._resolution_scope(scope, name), name, entry)
+            else:
+                # Never bound in the file (e.g. star imports): report at first use
+                scope.bindings[name] = entry
+
+        for name, (line_number, count, function_name, class_name) in sorted(
+            scope.bindings.items(), key=lambda item: item[1][0]
+        ):
+            if name in scope.loop_targets:
+                continue
+            self.violations.append(ASTViolation(
+                file_path=self.file_path,
+                line_number=line_number,
+                violation_type="poor_naming",
+                description=self._shared_text(
+                    f"Single-letter variable '{name}' reduces code clarity "
+                    f"({count} reference{'s' if count != 1 else ''})"
+                ),
+                severity="low",
+                source=self.source,
+                function_name=function_name,
+                class_name=class_name,
+                reference_count=count
+            ))
+
+    def _resolution_scope(self, scope: _Scope, name: str) -> _Scope:
+        """Find the enclosing scope a free name of a closed scope resolves in"""
+        if scope.declared.get(name) == "global":
+            return self._scopes[0]
+
+        for candidate in reversed(self._scopes):
+            if candidate.kind not in self.HIDDEN_SCOPE_KINDS:
+                return candidate
+        return self._scopes[0]
+
+    @staticmethod
+    def _add_free(scope: _Scope, name: str, entry: list):
+        """Merge references to a name into a scope's unresolved references"""
+        existing = scope.free.get(name)
+        if existing is None:
+            scope.free[name] = entry
+            return
+
+        existing[1] += entry[1]
+        if entry[0] < existing[0]:
+            existing[0], existing[2], existing[3] = entry[0], entry[2], entry[3]
+
+
+class PythonASTAnalyzer(BaseASTAnalyzer, ast.NodeVisitor):
+    """
+    AST analyzer for Python code
+    Detects violations that require semantic understanding
+    """
+
+    # Class bodies are not visible to the functions and comprehensions nested in them
+    HIDDEN_SCOPE_KINDS = frozenset(["class"])
+
+    def __init__(self, file_path: str, source_code: str, line_index: Optional[LineIndex] = None):
+        super().__init__(
+            file_path, SourceLines(file_path, line_index if line_index is not None else LineIndex(source_code))
+        )
+        self.source_code = source_code
+
+    def visit(self, node: ast.AST):
+        """Visit a node, counting its decision points toward the enclosing function"""
+        if self._complexity:
+            self._complexity[-1] += _decision_points(node)
+        return super().visit(node)
+
+    def visit_Module(self, node: ast.Module):
+        """Visit the module, reporting its poorly named bindings at the end"""
+        self._open_scope("module")
+        self.generic_visit(node)
+        self._close_scope()
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
         """Visit function definitions"""
@@ -52,29 +301,31 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                 violation_type="missing_docstring",
                 description=f"Function '{node.name}' lacks docstring - reduces AI understanding",
                 severity="low",
-                code_snippet=self._get_code_snippet(node.lineno),
+                source=self.source,
                 function_name=node.name,
                 class_name=self.current_class
             ))
 
-        # Check for overly complex functions (cyclomatic complexity)
-        complexity = self._calculate_complexity(node)
-        if complexity > 10:
-            self.violations.append(ASTViolation(
-                file_path=self.file_path,
-                line_number=node.lineno,
-                violation_type="high_complexity",
-                description=f"Function '{node.name}' has high complexity ({complexity}) - hard for AI to understand",
-                severity="medium",
-                code_snippet=self._get_code_snippet(node.lineno),
-                function_name=node.name,
-                class_name=self.current_class
-            ))
+        # Continue visiting child nodes, counting decision points on the way
+        complexity_slot = len(self.violations)
+        self._complexity.append(1)
+        self._visit_function_scope(node)
+        self._report_complexity(node.name, node.lineno, complexity_slot)
 
-        # Continue visiting child nodes
-        self.generic_visit(node)
         self.current_function = old_function
 
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        """Visit async function definitions (scoping only)"""
+        self._visit_function_scope(node)
+
+    def visit_Lambda(self, node: ast.Lambda):
+        """Visit lambdas, which have their own scope"""
+        self.visit(node.args)
+        self._open_scope("function")
+        self._bind_arguments(node.args)
+        self.visit(node.body)
+        self._close_scope()
+
     def visit_ClassDef(self, node: ast.ClassDef):
         """Visit class definitions"""
         old_class = self.current_class
@@ -88,13 +339,54 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                 violation_type="missing_docstring",
                 description=f"Class '{node.name}' lacks docstring",
                 severity="low",
-                code_snippet=self._get_code_snippet(node.lineno),
+                source=self.source,
                 class_name=node.name
             ))
 
+        self._open_scope("class")
         self.generic_visit(node)
+        self._close_scope()
         self.current_class = old_class
 
+    def visit_For(self, node: ast.For):
+        """Visit for loops; their loop variables are not reported"""
+        self._scopes[-1].loop_targets.update(_target_names(node.target))
+        self.generic_visit(node)
+
+    visit_AsyncFor = visit_For
+
+    def visit_ListComp(self, node: ast.AST):
+        """Visit comprehensions, which have their own scope"""
+        self._open_scope("comprehension")
+        for generator in node.generators:
+            self._scopes[-1].loop_targets.update(_target_names(generator.target))
+        self.generic_visit(node)
+        self._close_scope()
+
+    visit_SetComp = visit_DictComp = visit_GeneratorExp = visit_ListComp
+
+    def visit_Global(self, node: ast.Global):
+        """Visit global declarations"""
+        for name in node.names:
+            self._scopes[-1].declared[name] = "global"
+
+    def visit_Nonlocal(self, node: ast.Nonlocal):
+        """Visit nonlocal declarations"""
+        for name in node.names:
+            self._scopes[-1].declared[name] = "nonlocal"
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler):
+        """Visit except clauses, which may bind the exception to a name"""
+        if _is_poor_name(node.name):
+            self._record_name(node.name, node.lineno, bound=True)
+        self.generic_visit(node)
+
+    def visit_alias(self, node: ast.alias):
+        """Visit import aliases"""
+        name = node.asname or node.name.split('.')[0]
+        if _is_poor_name(name):
+            self._record_name(name, node.lineno, bound=True)
+
     def visit_Assign(self, node: ast.Assign):
         """Visit assignment statements"""
         # Check for hardcoded credentials (more precise than regex)
@@ -113,7 +405,7 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                             violation_type="hardcoded_credential",
                             description=f"Hardcoded credential in variable '{target.id}'",
                             severity="critical",
-                            code_snippet=self._get_code_snippet(node.lineno),
+                            source=self.source,
                             function_name=self.current_function,
                             class_name=self.current_class
                         ))
@@ -134,7 +426,7 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                     violation_type="dangerous_function",
                     description=f"Use of dangerous function '{func_name}' - code injection risk",
                     severity="high",
-                    code_snippet=self._get_code_snippet(node.lineno),
+                    source=self.source,
                     function_name=self.current_function,
                     class_name=self.current_class
                 ))
@@ -150,7 +442,7 @@ class PythonASTAnalyzer(ast.NodeVisitor):
                         violation_type="sql_injection",
                         description="SQL query uses string concatenation - injection risk",
                         severity="high",
-                        code_snippet=self._get_code_snippet(node.lineno),
+                        source=self.source,
                         function_name=self.current_function,
                         class_name=self.current_class
                     ))
@@ -159,39 +451,13 @@ class PythonASTAnalyzer(ast.NodeVisitor):
 
     def visit_Name(self, node: ast.Name):
         """Visit name references"""
-        # Check for single-letter variable names (reduces AI understanding)
-        if len(node.id) == 1 and node.id not in ['i', 'j', 'k', 'x', 'y', 'z', '_']:
-            # Only flag if not in a loop or comprehension
-            if not self._is_in_loop_context(node):
-                self.violations.append(ASTViolation(
-                    file_path=self.file_path,
-                    line_number=node.lineno,
-                    violation_type="poor_naming",
-                    description=f"Single-letter variable '{node.id}' reduces code clarity",
-                    severity="low",
-                    code_snippet=self._get_code_snippet(node.lineno),
-                    function_name=self.current_function,
-                    class_name=self.current_class
-                ))
+        # Single-letter names reduce AI understanding; each binding is
+        # reported once, when its scope has been fully visited
+        if _is_poor_name(node.id):
+            self._record_name(node.id, node.lineno, bound=not isinstance(node.ctx, ast.Load))
 
         self.generic_visit(node)
 
-    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """
-        Calculate cyclomatic complexity of a function
-        Complexity = number of decision points + 1
-        """
-        complexity = 1
-
-        for child in ast.walk(node):
-            # Count decision points
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-
-        return complexity
-
     def _contains_string_concat(self, node: ast.AST) -> bool:
         """Check if node contains string concatenation"""
         if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
@@ -203,30 +469,45 @@ class PythonASTAnalyzer(ast.NodeVisitor):
 
         return False
 
-    def _is_in_loop_context(self, node: ast.AST) -> bool:
-        """Check if node is in a loop context (simplified check)"""
-        # This is a simplified check - in a full implementation,
-        # we'd track the context properly
-        return False
+    def _visit_function_scope(self, node: ast.AST):
+        """Visit a function's children, with its parameters and body in a new scope"""
+        # Defaults and annotations are evaluated in the enclosing scope
+        self.visit(node.args)
+        self._open_scope("function")
+        self._bind_arguments(node.args)
+        for statement in node.body:
+            self.visit(statement)
+        self._close_scope()
 
-    def _get_code_snippet(self, line_number: int, context_lines: int = 2) -> str:
-        """Get code snippet around a line number"""
-        start = max(0, line_number - context_lines - 1)
-        end = min(len(self.lines), line_number + context_lines)
-        return '\n'.join(self.lines[start:end])
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if node.returns is not None:
+            self.visit(node.returns)
+
+    def _bind_arguments(self, args: ast.arguments):
+        """Record a function's parameters as bindings of the current scope"""
+        for arg in args.posonlyargs + args.args + [args.vararg] + args.kwonlyargs + [args.kwarg]:
+            if arg is not None and _is_poor_name(arg.arg):
+                self._record_name(arg.arg, arg.lineno, bound=True)
 
 
 class ASTAnalyzerFactory:
     """Factory to create appropriate AST analyzer based on file type"""
 
     @staticmethod
-    def create_analyzer(file_path: str, source_code: str) -> Optional[PythonASTAnalyzer]:
+    def create_analyzer(
+        file_path: str,
+        source_code: Union[str, bytes],
+        line_index: Optional[LineIndex] = None
+    ) -> Optional[BaseASTAnalyzer]:
         """
         Create appropriate AST analyzer based on file extension
 
         Args:
             file_path: Path to the source file
-            source_code: Content of the file
+            source_code: Content of the file (text for Python, raw bytes for
+                         the tree-sitter languages)
+            line_index: Line table already built for the content, if available
 
         Returns:
             Analyzer instance or None if file type not supported
@@ -234,38 +515,69 @@ class ASTAnalyzerFactory:
         extension = Path(file_path).suffix.lower()
 
         if extension == '.py':
-            return PythonASTAnalyzer(file_path, source_code)
-        # TODO: Add JavaASTAnalyzer, JavaScriptASTAnalyzer, etc.
-        else:
+            return PythonASTAnalyzer(file_path, source_code, line_index)
+
+        # Java, JavaScript and TypeScript need the optional tree-sitter packages
+        try:
+            from intelligentscan.scanners.tree_sitter_analyzer import create_tree_sitter_analyzer
+        except ImportError:
             return None
+        return create_tree_sitter_analyzer(file_path, source_code)
 
 
-def analyze_file_ast(file_path: str) -> List[ASTViolation]:
+def analyze_file_ast(
+    file_path: str,
+    cache: Optional[ScanResultCache] = None,
+    parsed: Optional[ParsedFile] = None
+) -> List[ASTViolation]:
     """
     Analyze a single file using AST
 
     Args:
         file_path: Path to file to analyze
+        cache: Optional result cache; unchanged files are not re-parsed
+        parsed: The file's entry in a ParsedFileStore, so its content and
+                tree are shared with other analyses of the same scan
 
     Returns:
         List of violations found
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
+        if parsed is None:
+            parsed = ParsedFile(Path(file_path))
+
+        if cache is not None:
+            return _analyze_file_cached(file_path, cache, parsed)
+
+        return _analyze_parsed(file_path, parsed)
+
+    except Exception as e:
+        # Other errors - skip file
+        print(f"Error analyzing {file_path}: {str(e)}")
+        return []
 
-        analyzer = ASTAnalyzerFactory.create_analyzer(file_path, source_code)
+
+def _analyze_parsed(file_path: str, parsed: ParsedFile) -> List[ASTViolation]:
+    """Analyze a file through its (possibly shared) parsed content"""
+    try:
+        # Only Python needs the decoded text; tree-sitter parses the raw bytes
+        if Path(file_path).suffix.lower() == '.py':
+            analyzer = ASTAnalyzerFactory.create_analyzer(file_path, parsed.text, parsed.line_index)
+        else:
+            analyzer = ASTAnalyzerFactory.create_analyzer(file_path, parsed.data)
 
         if not analyzer:
             return []  # File type not supported
 
-        # Parse and analyze
+        # Analyze the tree (parsed at most once per scan)
         if isinstance(analyzer, PythonASTAnalyzer):
-            tree = ast.parse(source_code)
-            analyzer.visit(tree)
+            analyzer.visit(parsed.tree)
+
+            # Violations outlive the parsed file; snippets are reloaded if rendered
+            analyzer.source.unload()
             return analyzer.violations
 
-        return []
+        return analyzer.analyze()
 
     except SyntaxError as e:
         # File has syntax errors - this itself is a violation
@@ -274,40 +586,96 @@ def analyze_file_ast(file_path: str) -> List[ASTViolation]:
             line_number=e.lineno or 0,
             violation_type="syntax_error",
             description=f"Syntax error: {str(e)}",
-            severity="high",
-            code_snippet=""
+            severity="high"
         )]
-    except Exception as e:
-        # Other errors - skip file
-        print(f"Error analyzing {file_path}: {str(e)}")
-        return []
 
 
-def analyze_directory_ast(directory: str, file_pattern: str = "*.py") -> List[ASTViolation]:
+def _analyze_file_cached(file_path: str, cache: ScanResultCache, parsed: ParsedFile) -> List[ASTViolation]:
+    """Analyze a file, reusing cached violations when its content has been seen before"""
+    # The analyzer is chosen by extension, so it is part of the key
+    ruleset_hash = f"ast:{Path(file_path).suffix.lower()}"
+    stat = os.stat(file_path)
+
+    # Unchanged size/mtime: the content hash is known without reading the file
+    known_hash = cache.known_hash(file_path, stat)
+    payload = cache.get(known_hash, ruleset_hash, AST_ANALYZER_VERSION) if known_hash else None
+    content_hash = known_hash
+
+    # Only look up again if the content differs from the known hash that missed
+    if payload is None and parsed.content_hash != known_hash:
+        content_hash = parsed.content_hash
+        cache.remember_hash(file_path, stat, content_hash)
+        payload = cache.get(content_hash, ruleset_hash, AST_ANALYZER_VERSION)
+
+    if payload is None:
+        violations = _analyze_parsed(file_path, parsed)
+        cache.put(content_hash, ruleset_hash, AST_ANALYZER_VERSION, [v.to_dict() for v in violations])
+        return violations
+
+    source = SourceLines(file_path)
+    return [ASTViolation(**dict(item, file_path=file_path), source=source) for item in payload]
+
+
+def analyze_directory_ast(
+    directory: str,
+    file_pattern: str = "*.py",
+    max_workers: Optional[int] = None,
+    use_cache: Optional[bool] = None
+) -> List[ASTViolation]:
     """
     Analyze all files in a directory using AST
 
     Args:
         directory: Directory to scan
         file_pattern: Glob pattern for files to analyze
+        max_workers: Worker processes to shard files across, or None to follow
+                     settings.parallel_scanning / settings.max_workers
+        use_cache: Reuse violations for unchanged files, or None to follow
+                   settings.enable_caching
 
     Returns:
-        List of all violations found
+        List of all violations found, in path order
     """
-    all_violations = []
     directory_path = Path(directory)
 
-    for file_path in directory_path.rglob(file_pattern):
+    file_paths = sorted(
+        str(file_path) for file_path in directory_path.rglob(file_pattern)
         # Skip common directories
-        if any(skip in str(file_path) for skip in ['.git', 'venv', 'node_modules', '__pycache__']):
-            continue
+        if not any(skip in str(file_path) for skip in ['.git', 'venv', 'node_modules', '__pycache__'])
+    )
 
-        violations = analyze_file_ast(str(file_path))
+    cache = ScanResultCache.from_settings(use_cache)
+    worker = partial(_analyze_shard, cache=cache)
+
+    worker_count = resolve_worker_count(max_workers)
+    if worker_count > 1 and len(file_paths) >= MIN_FILES_FOR_PARALLEL:
+        shard_results = map_shards(worker, shard(file_paths, worker_count), worker_count)
+    else:
+        shard_results = [worker(file_paths)]
+
+    if cache is not None:
+        cache.enforce_limits()
+        cache.close()
+
+    all_violations = []
+    for violations in shard_results:
         all_violations.extend(violations)
 
     return all_violations
 
 
+def _analyze_shard(file_paths: List[str], cache: Optional[ScanResultCache] = None) -> List[ASTViolation]:
+    """Analyze one shard of files (runs inside a worker process when parallel)"""
+    violations = []
+    for file_path in file_paths:
+        violations.extend(analyze_file_ast(file_path, cache))
+
+    if cache is not None:
+        cache.flush()
+
+    return violations
+
+
 # Example usage
 if __name__ == "__main__":
     # Test AST analyzer on a sample Python file
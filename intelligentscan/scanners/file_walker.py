@@ -0,0 +1,317 @@
+"""
+Repository File Walker for IntelligentScan
+Walks a repository tree exactly once and routes every file to the rules
+whose file patterns match it, so each file is read a single time no matter
+how many rules apply to it.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass, asdict
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Iterable, Iterator, Tuple, Optional
+
+
+# Directories that are never worth scanning
+DEFAULT_SKIP_PATTERNS = [
+    ".git/", "node_modules/", "venv/", "env/", "__pycache__/",
+    ".pytest_cache/", "build/", "dist/", ".next/", "target/",
+    "vendor/", ".idea/", ".vscode/"
+]
+
+# Generated files whose names say they are not worth scanning
+LOCKFILE_NAMES = {
+    "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml",
+    "poetry.lock", "Pipfile.lock", "Cargo.lock", "composer.lock", "Gemfile.lock", "go.sum"
+}
+MINIFIED_SUFFIXES = (".min.js", ".min.mjs", ".min.css", "-min.js", ".bundle.js")
+
+# Content sniffing looks at this many leading bytes
+SNIFF_BYTES = 8192
+
+# Sniffed text averaging longer lines than this is treated as minified
+MINIFIED_AVG_LINE_LENGTH = 500
+
+# Oversized files are decoded in chunks of this many bytes...
+CHUNK_BYTES = 4 * 1024 * 1024
+
+# ...plus this much context on each side, so a match (or its snippet lines)
+# crossing a chunk boundary is still seen whole
+OVERLAP_BYTES = 64 * 1024
+
+
+def decode_text(data: bytes) -> str:
+    """Decode file bytes the way text-mode open(errors='ignore') would"""
+    text = data.decode('utf-8', errors='ignore')
+
+    # Match the universal-newline behaviour of text-mode open()
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    return text
+
+
+def name_skip_reason(file_name: str) -> Optional[str]:
+    """
+    Check whether a file's name marks it as generated
+
+    Returns:
+        "lockfile" or "minified", or None if the file should be scanned
+    """
+    if file_name in LOCKFILE_NAMES:
+        return "lockfile"
+    if file_name.endswith(MINIFIED_SUFFIXES):
+        return "minified"
+    return None
+
+
+def content_skip_reason(data: bytes) -> Optional[str]:
+    """
+    Sniff the first SNIFF_BYTES of a file for binary or minified content
+
+    Returns:
+        "binary" (NUL bytes) or "minified" (very long lines), or None if the
+        file looks like ordinary text
+    """
+    head = data[:SNIFF_BYTES]
+
+    if b"\0" in head:
+        return "binary"
+
+    # Short files are cheap to scan whatever their shape
+    if len(head) >= SNIFF_BYTES // 4 and len(head) / (head.count(b"\n") + 1) > MINIFIED_AVG_LINE_LENGTH:
+        return "minified"
+
+    return None
+
+
+def _safe_cut(data, pos: int, lower: int) -> int:
+    """
+    Move a cut position back so it splits neither a line nor a character
+
+    Prefers the position just after the last newline in [lower, pos); lines
+    with no newline are cut before a UTF-8 lead byte and never inside "\r\n".
+    """
+    if pos >= len(data):
+        return len(data)
+
+    newline = data.rfind(b"\n", lower, pos)
+    if newline != -1:
+        return newline + 1
+
+    cut = pos
+    while cut > lower and (data[cut] & 0xC0 == 0x80 or data[cut - 1] == 0x0D):
+        cut -= 1
+    return cut if cut > lower else pos
+
+
+@dataclass
+class TextWindow:
+    """A decoded slice of an oversized file"""
+    text: str
+    first_line: int  # Line number of text[0] in the file
+    report_start: int  # text[report_start:report_end] is the chunk this window owns;
+    report_end: int  # the rest is overlap shared with the neighbouring windows
+
+
+@dataclass
+class WalkStats:
+    """I/O counters collected while walking a repository"""
+    files_walked: int = 0
+    files_matched: int = 0
+    files_read: int = 0
+    bytes_read: int = 0
+    files_streamed: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert counters to dictionary"""
+        return asdict(self)
+
+
+class RepositoryWalker:
+    """
+    Single-pass walker that maps files to the rules interested in them
+
+    Rules are described by their file patterns (e.g. "*.py", "pom.xml").
+    Exact names and simple "*.ext" patterns are resolved with dictionary
+    lookups; anything else falls back to fnmatch.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        rule_file_patterns: Dict[str, List[str]],
+        skip_patterns: Optional[List[str]] = None
+    ):
+        self.repo_path = Path(repo_path)
+        self.skip_patterns = skip_patterns if skip_patterns is not None else DEFAULT_SKIP_PATTERNS
+        self.stats = WalkStats()
+
+        # Preserve rule order so results stay deterministic
+        self._rule_order = {rule: index for index, rule in enumerate(rule_file_patterns)}
+        self._by_name: Dict[str, List[str]] = {}
+        self._by_extension: Dict[str, List[str]] = {}
+        self._globs: List[Tuple[str, str]] = []
+
+        for rule, patterns in rule_file_patterns.items():
+            for pattern in patterns:
+                if not any(char in pattern for char in "*?["):
+                    self._by_name.setdefault(pattern, []).append(rule)
+                elif pattern.startswith("*.") and not any(char in pattern[2:] for char in "*?[."):
+                    self._by_extension.setdefault(pattern[1:], []).append(rule)
+                else:
+                    self._globs.append((pattern, rule))
+
+    def walk(self) -> Iterator[Tuple[Path, str, Tuple[str, ...]]]:
+        """
+        Walk the repository once
+
+        Yields:
+            (absolute path, path relative to repo, rules that apply to the file)
+        """
+        for dir_path, dir_names, file_names in os.walk(self.repo_path):
+            rel_dir = os.path.relpath(dir_path, self.repo_path)
+            rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+            # Prune skipped directories so their contents are never listed
+            dir_names[:] = sorted(
+                name for name in dir_names
+                if not self._should_skip_path(f"{rel_dir}{name}/")
+            )
+
+            for file_name in sorted(file_names):
+                self.stats.files_walked += 1
+
+                rules = self.rules_for(file_name)
+                if not rules:
+                    continue
+
+                rel_path = f"{rel_dir}{file_name}"
+                if self._should_skip_path(rel_path):
+                    continue
+
+                self.stats.files_matched += 1
+                yield Path(dir_path) / file_name, rel_path, rules
+
+    def walk_paths(self, rel_paths: Iterable[str]) -> Iterator[Tuple[Path, str, Tuple[str, ...]]]:
+        """
+        Route an explicit set of repo-relative paths instead of walking the tree
+
+        Paths that no longer exist, are skipped, or match no rule are dropped.
+
+        Yields:
+            (absolute path, path relative to repo, rules that apply to the file)
+        """
+        for rel_path in sorted(rel_paths):
+            file_path = self.repo_path / rel_path
+            if not file_path.is_file():
+                continue
+
+            self.stats.files_walked += 1
+
+            rules = self.rules_for(file_path.name)
+            if not rules or self._should_skip_path(rel_path):
+                continue
+
+            self.stats.files_matched += 1
+            yield file_path, rel_path, rules
+
+    def rules_for(self, file_name: str) -> Tuple[str, ...]:
+        """Get the rules whose file patterns match a file name"""
+        rules = set(self._by_name.get(file_name, ()))
+        rules.update(self._by_extension.get(os.path.splitext(file_name)[1], ()))
+        for pattern, rule in self._globs:
+            if fnmatchcase(file_name, pattern):
+                rules.add(rule)
+
+        return tuple(sorted(rules, key=self._rule_order.__getitem__))
+
+    def read_bytes(self, file_path: Path) -> bytes:
+        """Read a file's raw bytes once, recording I/O counters"""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        self.stats.files_read += 1
+        self.stats.bytes_read += len(data)
+
+        return data
+
+    def read_head(self, file_path: Path) -> bytes:
+        """Read the first SNIFF_BYTES of a file, recording I/O counters"""
+        with open(file_path, 'rb') as f:
+            data = f.read(SNIFF_BYTES)
+
+        self.stats.bytes_read += len(data)
+
+        return data
+
+    def read_text(self, file_path: Path) -> str:
+        """Read a file once as text, recording I/O counters"""
+        return decode_text(self.read_bytes(file_path))
+
+    def read_windows(
+        self,
+        file_path: Path,
+        chunk_bytes: int = CHUNK_BYTES,
+        overlap_bytes: int = OVERLAP_BYTES
+    ) -> Iterator[TextWindow]:
+        """
+        Read a large file through mmap as overlapping decoded windows
+
+        Only one window is held in memory at a time, so memory use is bounded
+        by chunk_bytes + 2 * overlap_bytes regardless of the file size.
+        Concatenating text[report_start:report_end] of every window gives
+        exactly read_text(file_path).
+
+        Yields:
+            TextWindow for each consecutive chunk of the file
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+
+            self.stats.files_read += 1
+            self.stats.files_streamed += 1
+            self.stats.bytes_read += size
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                core_start = 0
+                lines_before = 0  # Newlines before core_start
+                released = 0  # Pages before this offset have been handed back
+
+                while core_start < size:
+                    core_end = _safe_cut(data, core_start + chunk_bytes, core_start)
+
+                    # Back overlap starts on a line boundary when there is one
+                    window_start = core_start
+                    if core_start > 0:
+                        newline = data.find(b"\n", max(0, core_start - overlap_bytes), core_start)
+                        if newline != -1:
+                            window_start = newline + 1
+                    window_end = _safe_cut(data, core_end + overlap_bytes, core_end)
+
+                    before = decode_text(data[window_start:core_start])
+                    core = decode_text(data[core_start:core_end])
+                    after = decode_text(data[core_end:window_end])
+
+                    yield TextWindow(
+                        text=before + core + after,
+                        first_line=lines_before - before.count("\n") + 1,
+                        report_start=len(before),
+                        report_end=len(before) + len(core)
+                    )
+
+                    lines_before += core.count("\n")
+                    core_start = core_end
+
+                    # Drop pages no later window needs, so the mapping does not pin the file in RSS
+                    release_to = (core_start - overlap_bytes) // mmap.PAGESIZE * mmap.PAGESIZE
+                    if hasattr(data, "madvise") and release_to > released:
+                        data.madvise(mmap.MADV_DONTNEED, released, release_to - released)
+                        released = release_to
+
+    def _should_skip_path(self, rel_path: str) -> bool:
+        """Determine if a repo-relative path should be skipped"""
+        return any(pattern in rel_path for pattern in self.skip_patterns)
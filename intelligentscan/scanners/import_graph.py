@@ -0,0 +1,501 @@
+"""
+Import Graph for IntelligentScan
+Builds the module import graph of a repository from the syntax trees the
+scanners already parse, and finds circular imports as the strongly connected
+components of that graph (Tarjan's algorithm, linear in modules + imports).
+
+Each file's raw import statements are persisted together with its stat
+signature, so the next scan only re-extracts the imports of files that
+changed. Resolving imports to repository modules is redone on every build
+(it is a handful of dict lookups per import), because adding or removing a
+module can change what an unchanged file's imports refer to.
+"""
+
+import ast
+import json
+import os
+import sqlite3
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from intelligentscan.scanners.file_walker import name_skip_reason
+from intelligentscan.scanners.parsed_files import ParsedFile
+from intelligentscan.utils.config_loader import get_settings
+from intelligentscan.utils.scan_cache import DEFAULT_CACHE_DIR
+
+
+GRAPH_FILE_NAME = "import_graph.sqlite3"
+
+# Bumped whenever extract_imports changes what it records
+IMPORT_GRAPH_VERSION = "import_graph/1"
+
+# Raw import statement: (line, level, module, names); names is None for "import module"
+RawImport = Tuple[int, int, str, Optional[List[str]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS import_files (
+    repo TEXT NOT NULL,
+    path TEXT NOT NULL,
+    version TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    imports TEXT NOT NULL,
+    PRIMARY KEY (repo, path)
+);
+"""
+
+
+def _is_type_checking_guard(node: ast.AST) -> bool:
+    """True for `if TYPE_CHECKING:` / `if typing.TYPE_CHECKING:`"""
+    test = node.test
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or \
+        (isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING")
+
+
+def extract_imports(tree: ast.AST) -> List[RawImport]:
+    """
+    Collect the import statements a module executes when it is imported
+
+    Imports inside function bodies and `if TYPE_CHECKING:` blocks are left out:
+    they do not run at import time, and moving an import there is the usual
+    way to break a cycle.
+
+    Args:
+        tree: Parsed module
+
+    Returns:
+        Raw imports ordered by line
+    """
+    imports: List[RawImport] = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append((node.lineno, 0, alias.name, None))
+        elif isinstance(node, ast.ImportFrom):
+            names = [alias.name for alias in node.names if alias.name != "*"]
+            imports.append((node.lineno, node.level, node.module or "", names))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        elif isinstance(node, ast.If) and _is_type_checking_guard(node):
+            stack.extend(node.orelse)
+        else:
+            # Statements nest through blocks, except handlers and match cases
+            stack.extend(
+                child for child in ast.iter_child_nodes(node)
+                if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case))
+            )
+
+    imports.sort(key=lambda entry: entry[0])
+    return imports
+
+
+def module_name(rel_path: str) -> Tuple[str, bool]:
+    """
+    Get the dotted module name of a file relative to the repository root
+
+    Returns:
+        (name, is_package); "pkg/__init__.py" is ("pkg", True)
+    """
+    parts = rel_path[:-3].split("/") if rel_path.endswith(".py") else rel_path.split("/")
+    if parts[-1] == "__init__" and len(parts) > 1:
+        return ".".join(parts[:-1]), True
+    return ".".join(parts), False
+
+
+def strongly_connected_components(adjacency: Sequence[Iterable[int]]) -> List[List[int]]:
+    """
+    Tarjan's strongly connected components, iterative (no recursion limit)
+
+    Args:
+        adjacency: Successor node ids of each node id 0..n-1
+
+    Returns:
+        Components as lists of node ids, in reverse topological order
+    """
+    count = len(adjacency)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(adjacency[root]))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if index[successor] == -1:
+                    index[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = True
+                    work.append((successor, iter(adjacency[successor])))
+                    break
+                if on_stack[successor] and index[successor] < low[node]:
+                    low[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+class ImportCycle:
+    """One strongly connected component of two or more modules"""
+
+    __slots__ = ("members", "example")
+
+    def __init__(self, members: List[int], example: List[int]):
+        self.members = members
+        # A shortest cycle through the component's first member, closed (first == last)
+        self.example = example
+
+
+class ImportGraph:
+    """
+    Module import graph of one repository
+
+    Modules are numbered in path order; edges are kept as
+    adjacency[source][target] = line of the first import of target in source.
+    """
+
+    def __init__(self, repo_path: str, store_path: Optional[Path] = None):
+        """
+        Args:
+            repo_path: Repository root
+            store_path: SQLite file the raw imports are persisted to, or None
+                        to keep them in memory only
+        """
+        self.repo_path = Path(repo_path)
+        self.store_path = store_path
+        # rel_path -> (size, mtime_ns, raw imports)
+        self.files: Dict[str, Tuple[int, int, List[RawImport]]] = {}
+        self._dirty: Dict[str, Tuple[int, int, List[RawImport]]] = {}
+        self._removed: List[str] = []
+        self.stats = {"files_loaded": 0, "files_updated": 0, "files_removed": 0}
+
+        self.modules: List[str] = []
+        self.paths: List[str] = []
+        self.adjacency: List[Dict[int, int]] = []
+        self._cycles: Optional[List[ImportCycle]] = None
+
+    @classmethod
+    def from_settings(cls, repo_path: str, enabled: Optional[bool] = None) -> "ImportGraph":
+        """
+        Create the graph, loading the persisted imports if settings.enable_caching is on
+
+        Args:
+            repo_path: Repository root
+            enabled: Override settings.enable_caching
+
+        Returns:
+            ImportGraph
+        """
+        settings = get_settings()
+        if enabled is None:
+            enabled = settings.get("enable_caching", False)
+        if not enabled:
+            return cls(repo_path)
+
+        cache_dir = Path(settings.get("cache_dir") or os.environ.get("INTELLIGENTSCAN_CACHE_DIR", DEFAULT_CACHE_DIR))
+        graph = cls(repo_path, cache_dir / GRAPH_FILE_NAME)
+        graph.load()
+        return graph
+
+    @property
+    def repo_key(self) -> str:
+        return str(self.repo_path.resolve())
+
+    def _connect(self) -> sqlite3.Connection:
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.store_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def load(self):
+        """Load the persisted raw imports of this repository"""
+        if self.store_path is None or not self.store_path.exists():
+            return
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, imports FROM import_files WHERE repo = ? AND version = ?",
+                (self.repo_key, IMPORT_GRAPH_VERSION)
+            )
+            for path, size, mtime_ns, imports in rows:
+                self.files[path] = (size, mtime_ns, [tuple(entry) for entry in json.loads(imports)])
+        finally:
+            conn.close()
+
+        self.stats["files_loaded"] = len(self.files)
+
+    def save(self):
+        """Persist the imports of files updated or removed since load()"""
+        if self.store_path is None or not (self._dirty or self._removed):
+            return
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO import_files VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (self.repo_key, path, IMPORT_GRAPH_VERSION, size, mtime_ns,
+                         json.dumps(imports, separators=(",", ":")))
+                        for path, (size, mtime_ns, imports) in self._dirty.items()
+                    ]
+                )
+                conn.executemany(
+                    "DELETE FROM import_files WHERE repo = ? AND path = ?",
+                    [(self.repo_key, path) for path in self._removed]
+                )
+        finally:
+            conn.close()
+
+        self._dirty = {}
+        self._removed = []
+
+    def is_current(self, rel_path: str, size: int, mtime_ns: int) -> bool:
+        """True if the recorded imports of rel_path match its current size and mtime"""
+        entry = self.files.get(rel_path)
+        return entry is not None and entry[0] == size and entry[1] == mtime_ns
+
+    def set_imports(self, rel_path: str, size: int, mtime_ns: int, imports: List[RawImport]):
+        """Record the raw imports of a file as of the given stat signature"""
+        if self.is_current(rel_path, size, mtime_ns) and self.files[rel_path][2] == imports:
+            return
+        entry = (size, mtime_ns, imports)
+        self.files[rel_path] = entry
+        self._dirty[rel_path] = entry
+        self.stats["files_updated"] += 1
+
+    def retain(self, rel_paths: Set[str]):
+        """Forget the files not in rel_paths (deleted since they were recorded)"""
+        for rel_path in [path for path in self.files if path not in rel_paths]:
+            del self.files[rel_path]
+            self._dirty.pop(rel_path, None)
+            self._removed.append(rel_path)
+            self.stats["files_removed"] += 1
+
+    def sync(self, listing: Iterable[Tuple[Path, str]], max_file_bytes: int):
+        """
+        Bring the recorded imports in line with the repository's Python files
+
+        Files no longer listed are dropped; listed files whose size or mtime
+        changed since they were recorded (or that were never recorded) are
+        parsed again. Files that are too large or do not parse are recorded as
+        modules without imports.
+
+        Args:
+            listing: (path, relative path) of every Python file in the repository
+            max_file_bytes: Files above this size are not parsed
+        """
+        seen = set()
+        for file_path, rel_path in listing:
+            seen.add(rel_path)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            if self.is_current(rel_path, stat.st_size, stat.st_mtime_ns):
+                continue
+
+            imports: List[RawImport] = []
+            if name_skip_reason(file_path.name) is None and stat.st_size <= max_file_bytes:
+                try:
+                    imports = extract_imports(ParsedFile(file_path, rel_path).tree)
+                except (SyntaxError, ValueError, OSError):
+                    pass
+            self.set_imports(rel_path, stat.st_size, stat.st_mtime_ns, imports)
+
+        self.retain(seen)
+
+    def build(self):
+        """Resolve every recorded import to a repository module and number the edges"""
+        self.paths = sorted(self.files)
+        self.modules = []
+        packages = []
+        for rel_path in self.paths:
+            name, is_package = module_name(rel_path)
+            self.modules.append(name)
+            packages.append(is_package)
+
+        names = self._name_index(packages)
+        self.adjacency = [{} for _ in self.paths]
+        self._cycles = None
+
+        for source, rel_path in enumerate(self.paths):
+            edges = self.adjacency[source]
+            # Scripts outside a regular package can import their siblings by name
+            script_dir = None
+            directory = rel_path.rpartition("/")[0]
+            if directory and directory + "/__init__.py" not in self.files:
+                script_dir = directory.replace("/", ".")
+
+            for line, level, module, imported in self.files[rel_path][2]:
+                if level:
+                    base = self._relative_base(self.modules[source], packages[source], level)
+                    if base is None:
+                        continue
+                    module = f"{base}.{module}" if module and base else (module or base)
+                    candidates = [module]
+                else:
+                    candidates = [module]
+                    if script_dir and f"{script_dir}.{module.split('.', 1)[0]}" in names:
+                        candidates.insert(0, f"{script_dir}.{module}")
+
+                for candidate in candidates:
+                    targets = self._resolve(names, candidate, imported)
+                    if targets:
+                        for target in targets:
+                            if target != source and target not in edges:
+                                edges[target] = line
+                        break
+
+    def _name_index(self, packages: List[bool]) -> Dict[str, int]:
+        """
+        Map every importable dotted name to a module id
+
+        Each module is importable by its path from the repository root, and by
+        its path from every source root above it: a directory that is not a
+        regular package itself but contains one (e.g. "src" in src/pkg/...).
+        """
+        names: Dict[str, int] = {}
+        package_dirs = {self.modules[i].replace(".", "/") for i, is_package in enumerate(packages) if is_package}
+
+        for module_id, name in enumerate(self.modules):
+            names.setdefault(name, module_id)
+            parts = name.split(".")
+            # Strip leading directories up to the topmost regular package
+            for depth in range(1, len(parts)):
+                prefix = "/".join(parts[:depth])
+                if prefix in package_dirs:
+                    break
+                if "/".join(parts[:depth + 1]) in package_dirs:
+                    names.setdefault(".".join(parts[depth:]), module_id)
+                    break
+
+        return names
+
+    @staticmethod
+    def _relative_base(name: str, is_package: bool, level: int) -> Optional[str]:
+        """Package a relative import of the given level starts from, or None if it escapes the root"""
+        parts = name.split(".") if is_package else name.split(".")[:-1]
+        if level - 1 > len(parts):
+            return None
+        return ".".join(parts[:len(parts) - (level - 1)])
+
+    @staticmethod
+    def _resolve(names: Dict[str, int], module: str, imported: Optional[List[str]]) -> List[int]:
+        """
+        Resolve one import statement to module ids
+
+        `from a import b` depends on the submodule a.b if there is one,
+        otherwise on a itself; `import a.b.c` on the longest prefix that is
+        a repository module.
+        """
+        if not module:
+            return []
+
+        targets = []
+        if imported:
+            for item in imported:
+                target = names.get(f"{module}.{item}")
+                if target is not None:
+                    targets.append(target)
+            if len(targets) == len(imported):
+                return targets
+
+        parts = module.split(".")
+        for end in range(len(parts), 0, -1):
+            target = names.get(".".join(parts[:end]))
+            if target is not None:
+                targets.append(target)
+                break
+
+        return targets
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(edges) for edges in self.adjacency)
+
+    def cycles(self) -> List[ImportCycle]:
+        """
+        Find circular imports
+
+        Returns:
+            One ImportCycle per strongly connected component of two or more
+            modules, ordered by their first member's path
+        """
+        if self._cycles is not None:
+            return self._cycles
+
+        cycles = []
+        for component in strongly_connected_components(self.adjacency):
+            if len(component) < 2:
+                continue
+            component.sort()
+            cycles.append(ImportCycle(component, self._shortest_cycle(component)))
+
+        cycles.sort(key=lambda cycle: cycle.members[0])
+        self._cycles = cycles
+        return cycles
+
+    def _shortest_cycle(self, component: List[int]) -> List[int]:
+        """Breadth-first search for the shortest cycle through the component's first member"""
+        start = component[0]
+        members = set(component)
+        previous = {start: None}
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            for target in self.adjacency[node]:
+                if target == start:
+                    path = [start]
+                    while node is not None:
+                        path.append(node)
+                        node = previous[node]
+                    path.reverse()
+                    return path
+                if target in members and target not in previous:
+                    previous[target] = node
+                    queue.append(target)
+
+        return [start, start]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary of the graph for scan results"""
+        return {
+            "modules": len(self.modules),
+            "edges": self.edge_count,
+            "cycles": len(self.cycles()),
+            **self.stats,
+        }
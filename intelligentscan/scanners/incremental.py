@@ -0,0 +1,141 @@
+"""
+Incremental Scanning Helpers for IntelligentScan
+Uses git to find files changed since a baseline so only those are rescanned,
+and carries findings for every other file over from the previous scan.
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import git
+
+
+def current_commit(repo_path: str) -> Optional[str]:
+    """
+    Get the HEAD commit of the git repository containing repo_path
+
+    Returns:
+        Commit SHA, or None if repo_path is not inside a git repository
+    """
+    try:
+        repo = git.Repo(repo_path, search_parent_directories=True)
+        return repo.head.commit.hexsha
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+        return None
+
+
+def work_tree_state(repo_path: str) -> Tuple[Optional[str], bool]:
+    """
+    Get the HEAD commit and whether repo_path has uncommitted changes
+
+    A scan of a dirty tree holds findings for content no commit has, so it
+    cannot serve as a baseline for a git diff. Untracked files count as
+    changes: one deleted before the next scan would appear in no diff.
+
+    Returns:
+        (commit SHA, dirty), or (None, False) if repo_path is not inside a
+        git repository
+    """
+    try:
+        repo = git.Repo(repo_path, search_parent_directories=True)
+        commit = repo.head.commit.hexsha
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+        return None, False
+
+    prefix = _work_tree_prefix(repo, repo_path)
+    return commit, repo.is_dirty(untracked_files=True, path=prefix or None)
+
+
+def resolve_commit(repo_path: str, ref: str) -> Optional[str]:
+    """
+    Resolve a commit, tag or branch of the repository containing repo_path
+
+    Returns:
+        Commit SHA, or None if the ref (or the repository) does not exist
+    """
+    try:
+        return git.Repo(repo_path, search_parent_directories=True).commit(ref).hexsha
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, git.BadName, git.GitCommandError, ValueError):
+        return None
+
+
+def _work_tree_prefix(repo: git.Repo, repo_path: str) -> str:
+    """repo_path relative to the work tree root with a trailing "/", or "" for the root"""
+    prefix = os.path.relpath(os.path.realpath(repo_path), os.path.realpath(repo.working_tree_dir))
+    return "" if prefix == "." else prefix.replace(os.sep, "/") + "/"
+
+
+def changed_files(repo_path: str, since_ref: str) -> Set[str]:
+    """
+    List files changed, added or deleted since a git ref
+
+    Combines `git diff --name-only --no-renames <since_ref>` (committed and
+    uncommitted changes) with untracked and git-ignored files. Rename
+    detection is off, so a renamed file is listed under both its old and its
+    new path. Ignored files (.env, local settings) appear in no diff but are
+    still scanned, so they are always listed; see missing_files for ignored
+    files deleted since the baseline.
+
+    Args:
+        repo_path: Directory being scanned (may be a subdirectory of the work tree)
+        since_ref: Commit, tag or branch to diff against
+
+    Returns:
+        Paths relative to repo_path, using "/" separators
+    """
+    repo = git.Repo(repo_path, search_parent_directories=True)
+
+    # git reports paths relative to the work tree root
+    prefix = _work_tree_prefix(repo, repo_path)
+
+    # core.quotepath=off keeps non-ASCII paths unescaped
+    diff_output = repo.git(c="core.quotepath=off").diff("--name-only", "--no-renames", since_ref, "--")
+    paths = [line for line in diff_output.splitlines() if line]
+    paths.extend(repo.untracked_files)
+    ignored_output = repo.git(c="core.quotepath=off").ls_files(
+        "--others", "--ignored", "--exclude-standard", "--", prefix or "."
+    )
+    paths.extend(line for line in ignored_output.splitlines() if line)
+
+    return {path[len(prefix):] for path in paths if path.startswith(prefix)}
+
+
+def missing_files(repo_path: str, rel_paths: Iterable[str]) -> Set[str]:
+    """
+    Get the paths that no longer exist under repo_path
+
+    Git reports no deletion of a file it does not track, so the files a
+    baseline has findings for are checked directly before carrying them over.
+
+    Args:
+        repo_path: Directory being scanned
+        rel_paths: Paths relative to repo_path
+
+    Returns:
+        The paths that are gone
+    """
+    return {path for path in rel_paths if path and not os.path.exists(os.path.join(repo_path, path))}
+
+
+def carry_over(
+    previous: Iterable[Dict[str, Any]],
+    fresh: Iterable[Dict[str, Any]],
+    changed: Set[str],
+    file_key: str = "file"
+) -> List[Dict[str, Any]]:
+    """
+    Merge findings from a previous scan with findings for rescanned files
+
+    Args:
+        previous: Findings from the baseline scan
+        fresh: Findings from scanning only the changed files
+        changed: Relative paths that were changed, added or deleted
+        file_key: Field holding the finding's relative path
+
+    Returns:
+        Findings for unchanged files plus fresh findings, ordered by file
+    """
+    merged = [finding for finding in previous if finding.get(file_key) not in changed]
+    merged.extend(fresh)
+    merged.sort(key=lambda finding: finding.get(file_key, ""))
+    return merged
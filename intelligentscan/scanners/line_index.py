@@ -0,0 +1,65 @@
+"""
+Line Index for IntelligentScan
+Maps character offsets to line numbers and slices line ranges out of file
+content without re-splitting it for every finding.
+"""
+
+import re
+from bisect import bisect_right
+from typing import List
+
+
+_NEWLINE = re.compile('\n')
+
+
+class LineIndex:
+    """
+    Line-start offset table for one file's content
+
+    Built once per file in a single pass; each lookup is a binary search.
+    """
+
+    __slots__ = ("content", "starts")
+
+    def __init__(self, content: str):
+        self.content = content
+        self.starts: List[int] = [0]
+        self.starts.extend(match.end() for match in _NEWLINE.finditer(content))
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines (same as len(content.split('\\n')))"""
+        return len(self.starts)
+
+    def line_number(self, offset: int) -> int:
+        """Get the 1-based line number containing a character offset"""
+        return bisect_right(self.starts, offset)
+
+    def line(self, line_number: int) -> str:
+        """Get the text of a 1-based line, without its newline"""
+        if line_number < 1 or line_number > len(self.starts):
+            return ""
+        return self.content[self.starts[line_number - 1]:self._line_end(line_number)]
+
+    def snippet(self, line_number: int, context_lines: int = 2) -> str:
+        """
+        Get a code snippet around a line
+
+        Args:
+            line_number: 1-based line at the centre of the snippet
+            context_lines: Lines to include before and after
+
+        Returns:
+            The lines joined with newlines
+        """
+        first = max(1, line_number - context_lines)
+        last = min(len(self.starts), line_number + context_lines)
+        if first > last:
+            return ""
+        return self.content[self.starts[first - 1]:self._line_end(last)]
+
+    def _line_end(self, line_number: int) -> int:
+        """Offset just past the last character of a 1-based line (excluding newline)"""
+        if line_number < len(self.starts):
+            return self.starts[line_number] - 1
+        return len(self.content)
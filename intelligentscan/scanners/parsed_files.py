@@ -0,0 +1,226 @@
+"""
+Parsed File Store for IntelligentScan
+Reads and parses each file once per scan and shares the result between every
+analysis that looks at it (regex rules, AST analyzers, ...).
+
+A file's bytes, text, lines, line index and syntax tree are each computed the
+first time an analysis asks for them. The store drops a file as soon as every
+registered consumer has released it, so memory is bounded by the files in
+flight rather than by the size of the repository.
+"""
+
+import ast
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from intelligentscan.scanners.file_walker import RepositoryWalker, decode_text
+from intelligentscan.scanners.line_index import LineIndex
+from intelligentscan.utils.scan_cache import hash_bytes
+
+
+class ParsedFile:
+    """One file's content and derived structures, each built on first use"""
+
+    __slots__ = (
+        "path", "rel_path", "_walker", "_data", "_content_hash",
+        "_text", "_lines", "_line_index", "_tree", "_syntax_error"
+    )
+
+    def __init__(self, path: Path, rel_path: Optional[str] = None, walker: Optional[RepositoryWalker] = None):
+        """
+        Args:
+            path: Absolute path to the file
+            rel_path: Path relative to the repository, if known
+            walker: Walker whose I/O counters should record the read
+        """
+        self.path = Path(path)
+        self.rel_path = rel_path
+        self._walker = walker
+        self._data = None
+        self._content_hash = None
+        self._text = None
+        self._lines = None
+        self._line_index = None
+        self._tree = None
+        self._syntax_error = None
+
+    @property
+    def data(self) -> bytes:
+        """Raw file bytes (read once)"""
+        if self._data is None:
+            if self._walker is not None:
+                self._data = self._walker.read_bytes(self.path)
+            else:
+                with open(self.path, 'rb') as f:
+                    self._data = f.read()
+        return self._data
+
+    @property
+    def content_hash(self) -> str:
+        """Content hash used as the result cache key"""
+        if self._content_hash is None:
+            self._content_hash = hash_bytes(self.data)
+        return self._content_hash
+
+    @property
+    def text(self) -> str:
+        """Decoded text with universal newlines"""
+        if self._text is None:
+            self._text = decode_text(self.data)
+        return self._text
+
+    @property
+    def lines(self) -> List[str]:
+        """Text split into lines"""
+        if self._lines is None:
+            self._lines = self.text.split('\n')
+        return self._lines
+
+    @property
+    def line_index(self) -> LineIndex:
+        """Offset-to-line table over the text"""
+        if self._line_index is None:
+            self._line_index = LineIndex(self.text)
+        return self._line_index
+
+    @property
+    def tree(self) -> ast.AST:
+        """
+        Python syntax tree (parsed once)
+
+        Raises:
+            SyntaxError: If the file does not parse (raised again on every access)
+        """
+        if self._tree is None:
+            if self._syntax_error is not None:
+                raise self._syntax_error
+            try:
+                self._tree = ast.parse(self.text)
+            except SyntaxError as e:
+                self._syntax_error = e
+                raise
+        return self._tree
+
+
+class ParsedFileStore:
+    """
+    Per-scan store of ParsedFile objects shared between consumers
+
+    Each file stays in the store until every consumer has released it. As a
+    safety bound, at most max_files are held; beyond that the least recently
+    used file is dropped early (and re-read if a consumer asks for it again).
+    """
+
+    def __init__(
+        self,
+        consumers: Iterable[str],
+        walker: Optional[RepositoryWalker] = None,
+        max_files: int = 64
+    ):
+        """
+        Args:
+            consumers: Names of the analyses that will release each file
+            walker: Walker whose I/O counters should record reads
+            max_files: Most files held at once
+        """
+        self.consumers = frozenset(consumers)
+        self.walker = walker
+        self.max_files = max_files
+        self._files: "OrderedDict[str, ParsedFile]" = OrderedDict()
+        self._pending: Dict[str, Set[str]] = {}
+        self.stats = {"files_opened": 0, "reuses": 0, "evictions": 0, "early_evictions": 0}
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def get(
+        self,
+        path: Path,
+        rel_path: Optional[str] = None,
+        consumers: Optional[Iterable[str]] = None
+    ) -> ParsedFile:
+        """
+        Get the shared ParsedFile for a path, creating it on first request
+
+        Args:
+            path: Absolute path to the file
+            rel_path: Path relative to the repository
+            consumers: Consumers that will release this file, if not all of the
+                       store's consumers look at it
+
+        Returns:
+            ParsedFile shared with the other consumers
+        """
+        key = str(path)
+
+        parsed = self._files.get(key)
+        if parsed is not None:
+            self._files.move_to_end(key)
+            self.stats["reuses"] += 1
+            return parsed
+
+        parsed = ParsedFile(path, rel_path, self.walker)
+        self._files[key] = parsed
+        self._pending[key] = set(self.consumers if consumers is None else consumers)
+        self.stats["files_opened"] += 1
+
+        if len(self._files) > self.max_files:
+            oldest, _ = self._files.popitem(last=False)
+            del self._pending[oldest]
+            self.stats["early_evictions"] += 1
+
+        return parsed
+
+    def release(self, path: Path, consumer: str):
+        """Mark a consumer as finished with a file, dropping it once all are"""
+        key = str(path)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            return
+
+        pending.discard(consumer)
+        if not pending:
+            del self._pending[key]
+            del self._files[key]
+            self.stats["evictions"] += 1
+
+
+class SourceLines:
+    """
+    Shared per-file line table for rendering code snippets on demand
+
+    Every violation in a file points at the same SourceLines instead of
+    carrying its own snippet. After unload() the table is rebuilt from the
+    file on disk the next time a snippet is rendered.
+    """
+
+    __slots__ = ("path", "_line_index")
+
+    def __init__(self, path: str, line_index: Optional[LineIndex] = None):
+        """
+        Args:
+            path: Path of the file the lines belong to
+            line_index: Line table already built for the file, if any
+        """
+        self.path = path
+        self._line_index = line_index
+
+    @property
+    def line_index(self) -> LineIndex:
+        """The file's line table, loading it from disk if it was unloaded"""
+        if self._line_index is None:
+            try:
+                self._line_index = ParsedFile(Path(self.path)).line_index
+            except OSError:
+                self._line_index = LineIndex("")
+        return self._line_index
+
+    def snippet(self, line_number: int, context_lines: int = 2) -> str:
+        """Get the code snippet around a 1-based line"""
+        return self.line_index.snippet(line_number, context_lines)
+
+    def unload(self):
+        """Drop the line table; it is reloaded if another snippet is needed"""
+        self._line_index = None
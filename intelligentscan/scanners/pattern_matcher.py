@@ -0,0 +1,176 @@
+"""
+Compiled Rule Matcher for IntelligentScan
+Precompiles vulnerability patterns once per process and groups them by the
+set of rules that apply to a file, so the per-file loop does no regex cache
+lookups and skips positions where a pattern cannot possibly start.
+"""
+
+import re
+from typing import Dict, List, Any, Iterator, Tuple
+
+
+MATCH_FLAGS = re.MULTILINE | re.IGNORECASE
+
+# Shortest literal prefix worth using as a search anchor
+MIN_ANCHOR_LENGTH = 3
+
+_REGEX_METACHARS = set(".^$*+?{}[]|()")
+_QUANTIFIERS = set("*?{+")
+
+
+def literal_prefix(pattern: str) -> str:
+    """
+    Extract the literal text every match of a pattern must start with
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        Lower-cased literal prefix, or "" if the pattern has no usable one
+    """
+    # A top-level alternation means matches can start with different text
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return ""
+
+    prefix = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if index + 1 >= len(pattern) or pattern[index + 1].isalnum():
+                break  # Character classes such as \s or \d
+            literal, width = pattern[index + 1], 2
+        elif char in _REGEX_METACHARS:
+            break
+        else:
+            literal, width = char, 1
+
+        # An optional or repeated character is not a fixed prefix
+        if index + width < len(pattern) and pattern[index + width] in _QUANTIFIERS:
+            break
+
+        prefix.append(literal)
+        index += width
+
+    anchor = "".join(prefix).lower()
+    return anchor if len(anchor) >= MIN_ANCHOR_LENGTH else ""
+
+
+class GroupMatcher:
+    """
+    Matches every pattern of a fixed set of rules against file content
+
+    Patterns are compiled once. When content is ASCII, each pattern that has
+    a literal prefix is only tried at offsets where that prefix occurs in the
+    lower-cased content (found with str.find, which is far faster than the
+    regex engine's case-insensitive scan). The results are identical to
+    calling re.finditer for every pattern, in the same order.
+    """
+
+    def __init__(self, entries: List[Tuple[str, str]]):
+        """
+        Args:
+            entries: (rule type, pattern) pairs in reporting order
+        """
+        self.entries = entries
+        self.compiled = [re.compile(pattern, MATCH_FLAGS) for _, pattern in entries]
+        self.anchors = [literal_prefix(pattern) for _, pattern in entries]
+
+    def iter_matches(self, content: str) -> Iterator[Tuple[str, str, int, str]]:
+        """
+        Find all pattern matches in content
+
+        Yields:
+            (rule type, pattern, match start offset, matched text)
+        """
+        # Case-insensitive matching only agrees with str.lower() for ASCII text
+        lowered = content.lower() if content.isascii() else None
+
+        for (rule_type, pattern), regex, anchor in zip(self.entries, self.compiled, self.anchors):
+            if lowered is None or not anchor:
+                for match in regex.finditer(content):
+                    yield rule_type, pattern, match.start(), match.group(0)
+                continue
+
+            find = lowered.find
+            match_at = regex.match
+            pos = find(anchor)
+            while pos != -1:
+                match = match_at(content, pos)
+                if match is None:
+                    pos = find(anchor, pos + 1)
+                    continue
+
+                yield rule_type, pattern, pos, match.group(0)
+                pos = find(anchor, max(match.end(), pos + 1))
+
+
+class RuleMatcher:
+    """
+    Builds and caches one GroupMatcher per set of applicable rules
+
+    Files with the same extension always see the same rules, so in practice
+    there is one compiled group per file-extension group.
+    """
+
+    def __init__(self, rules: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            rules: Mapping of rule type to config with a "patterns" list
+        """
+        self.rules = rules
+        self._groups: Dict[Tuple[str, ...], GroupMatcher] = {}
+
+    def for_rules(self, rule_types: Tuple[str, ...]) -> GroupMatcher:
+        """Get the compiled matcher for a tuple of rule types"""
+        matcher = self._groups.get(rule_types)
+        if matcher is None:
+            entries = [
+                (rule_type, pattern)
+                for rule_type in rule_types
+                for pattern in self.rules[rule_type]["patterns"]
+            ]
+            matcher = GroupMatcher(entries)
+            self._groups[rule_types] = matcher
+
+        return matcher
+
+
+# Process-wide cache so each ruleset is compiled once per scanner process
+_MATCHER_CACHE: Dict[Tuple, RuleMatcher] = {}
+
+
+def get_rule_matcher(rules: Dict[str, Dict[str, Any]]) -> RuleMatcher:
+    """
+    Get the process-wide RuleMatcher for a ruleset
+
+    Args:
+        rules: Mapping of rule type to config with a "patterns" list
+
+    Returns:
+        Shared RuleMatcher instance
+    """
+    signature = tuple((rule_type, tuple(config["patterns"])) for rule_type, config in rules.items())
+
+    matcher = _MATCHER_CACHE.get(signature)
+    if matcher is None:
+        matcher = RuleMatcher(rules)
+        _MATCHER_CACHE[signature] = matcher
+
+    return matcher
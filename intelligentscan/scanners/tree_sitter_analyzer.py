@@ -0,0 +1,664 @@
+"""
+Tree-sitter AST Analyzers for IntelligentScan
+Java and JavaScript/TypeScript analysis emitting the same ASTViolation types
+as the Python analyzer.
+
+Files are parsed straight from their bytes (never decoded to str) with
+parsers taken from a per-process pool, and each tree is analyzed in a single
+cursor walk.
+"""
+
+import importlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from tree_sitter import Language, Node, Parser, Tree
+
+from intelligentscan.scanners.ast_analyzer import (
+    ASTViolation, BaseASTAnalyzer, _is_poor_name
+)
+from intelligentscan.scanners.parsed_files import SourceLines
+
+
+# language -> (grammar module, function returning the language pointer)
+GRAMMARS = {
+    "java": ("tree_sitter_java", "language"),
+    "javascript": ("tree_sitter_javascript", "language"),
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+}
+
+EXTENSION_LANGUAGES = {
+    ".java": "java",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+}
+
+# Same keywords the Python analyzer looks for in assigned variable names
+CREDENTIAL_KEYWORDS = ['password', 'secret', 'api_key', 'token']
+
+# A (parent node type, field name) pair, identifying a child's role
+FieldKey = Tuple[Optional[str], Optional[str]]
+
+
+class ParserPool:
+    """
+    Reusable tree-sitter parsers, kept per language
+
+    Creating a parser (and loading its grammar) costs far more than parsing
+    a typical file, so parsers are handed out and returned instead of being
+    built per file. The pool belongs to one process: a forked worker starts
+    with an empty pool of its own.
+    """
+
+    def __init__(self):
+        self._pid = os.getpid()
+        self._languages: Dict[str, Optional[Language]] = {}
+        self._idle: Dict[str, List[Parser]] = {}
+        self.stats = {"parsers_created": 0, "parsers_reused": 0}
+
+    def language(self, name: str) -> Optional[Language]:
+        """
+        Load a grammar on first use
+
+        Returns:
+            Language, or None if its grammar package is not installed
+        """
+        self._check_process()
+        if name not in self._languages:
+            module_name, function_name = GRAMMARS[name]
+            try:
+                module = importlib.import_module(module_name)
+                self._languages[name] = Language(getattr(module, function_name)())
+            except ImportError:
+                self._languages[name] = None
+        return self._languages[name]
+
+    @contextmanager
+    def parser(self, name: str) -> Iterator[Parser]:
+        """Borrow a parser for a language, returning it to the pool afterwards"""
+        self._check_process()
+        idle = self._idle.setdefault(name, [])
+
+        if idle:
+            parser = idle.pop()
+            self.stats["parsers_reused"] += 1
+        else:
+            parser = Parser(self.language(name))
+            self.stats["parsers_created"] += 1
+
+        try:
+            yield parser
+        finally:
+            idle.append(parser)
+
+    def _check_process(self):
+        """Drop parsers inherited from a parent process"""
+        if os.getpid() != self._pid:
+            self.__init__()
+
+
+# One pool per process (worker processes each get their own after fork)
+PARSER_POOL = ParserPool()
+
+
+class _Frame:
+    """What entering one node changed, so leaving it can undo it"""
+
+    __slots__ = ("type", "binding", "loop", "scope", "function", "is_class", "previous_class", "complexity_slot")
+
+    def __init__(self, node_type: str, binding: bool, loop: bool):
+        self.type = node_type
+        self.binding = binding
+        self.loop = loop
+        self.scope = False
+        self.function = None
+        self.is_class = False
+        self.previous_class = None
+        self.complexity_slot = None
+
+
+class TreeSitterAnalyzer(BaseASTAnalyzer):
+    """
+    Single-pass analyzer over a tree-sitter syntax tree
+
+    Subclasses describe their grammar through the node-type tables below and
+    implement the name lookups and call checks that differ per language.
+    """
+
+    # Nodes that open a naming scope
+    SCOPE_NODES: FrozenSet[str] = frozenset()
+    # Nodes that may be named functions (docstring and complexity checks)
+    FUNCTION_NODES: FrozenSet[str] = frozenset()
+    CLASS_NODES: FrozenSet[str] = frozenset()
+    # Nodes that each add one path through a function
+    BRANCH_NODES: FrozenSet[str] = frozenset()
+    BOOLEAN_OPERATORS: FrozenSet[str] = frozenset()
+    CALL_NODES: FrozenSet[str] = frozenset()
+    IDENTIFIER_NODES: FrozenSet[str] = frozenset(["identifier"])
+    STRING_NODES: FrozenSet[str] = frozenset()
+    DOC_COMMENT_NODES: FrozenSet[str] = frozenset()
+    # Subtrees with nothing to check (imports, package names)
+    SKIP_NODES: FrozenSet[str] = frozenset()
+    # Children whose identifiers are bindings (declared names, parameters)
+    BINDING_FIELDS: FrozenSet[FieldKey] = frozenset()
+    # Children whose bindings are loop variables -> whether the child itself binds
+    LOOP_FIELDS: Dict[FieldKey, bool] = {}
+    # Children that are expressions again inside a binding (default values)
+    EXPRESSION_FIELDS: FrozenSet[FieldKey] = frozenset()
+    # Identifiers that name members or declarations rather than variables
+    NON_REFERENCE_FIELDS: FrozenSet[FieldKey] = frozenset()
+    # Method names that run SQL
+    SQL_METHODS: FrozenSet[str] = frozenset()
+
+    def __init__(self, file_path: str, source_code: Union[bytes, str], language: str):
+        """
+        Args:
+            file_path: Path to the source file
+            source_code: Raw file bytes (str is encoded as UTF-8)
+            language: Grammar to parse with (a key of GRAMMARS)
+        """
+        # Snippets are rendered from the file on disk only if asked for
+        super().__init__(file_path, SourceLines(file_path))
+        self.source_code = source_code.encode("utf-8") if isinstance(source_code, str) else source_code
+        self.language = language
+
+    def analyze(self) -> List[ASTViolation]:
+        """
+        Parse the file and analyze its tree
+
+        Returns:
+            List of violations found
+        """
+        with PARSER_POOL.parser(self.language) as parser:
+            tree = parser.parse(self.source_code)
+
+        if tree.root_node.has_error:
+            self._report_syntax_error(tree.root_node)
+
+        self._walk(tree)
+        return self.violations
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+
+    def _walk(self, tree: Tree):
+        """Visit every named node once with a tree cursor, in source order"""
+        cursor = tree.walk()
+        frames: List[_Frame] = []
+
+        while True:
+            node = cursor.node
+            # Punctuation and keywords are leaves with nothing to check
+            if node.is_named:
+                frame = self._enter(node, cursor.field_name, frames[-1] if frames else None)
+                frames.append(frame)
+                if frame.type not in self.SKIP_NODES and cursor.goto_first_child():
+                    continue
+                self._leave(frames.pop())
+
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
+                self._leave(frames.pop())
+
+    def _enter(self, node: Node, field_name: Optional[str], parent: Optional[_Frame]) -> _Frame:
+        """Handle a node on the way down"""
+        node_type = node.type
+        key = (parent.type if parent else None, field_name)
+
+        binding = parent.binding if parent else False
+        loop = parent.loop if parent else False
+        if key in self.BINDING_FIELDS:
+            binding = True
+        if key in self.LOOP_FIELDS:
+            loop = True
+            binding = binding or self.LOOP_FIELDS[key]
+        if key in self.EXPRESSION_FIELDS:
+            binding = loop = False
+
+        frame = _Frame(node_type, binding, loop)
+
+        if node_type in self.IDENTIFIER_NODES:
+            # Single-byte identifiers only; decoding longer ones is never needed
+            if node.end_byte - node.start_byte == 1 and key not in self.NON_REFERENCE_FIELDS:
+                name = chr(self.source_code[node.start_byte])
+                if _is_poor_name(name):
+                    if binding and loop:
+                        self._scopes[-1].loop_targets.add(name)
+                    self._record_name(name, node.start_point[0] + 1, bound=binding)
+            return frame
+
+        if self._complexity:
+            self._complexity[-1] += self._branch_points(node, node_type)
+
+        if node_type in self.FUNCTION_NODES:
+            self._enter_function(node, frame)
+        elif node_type in self.CLASS_NODES:
+            self._enter_class(node, frame)
+
+        if node_type in self.SCOPE_NODES or parent is None:
+            self._open_scope("module" if parent is None else node_type)
+            frame.scope = True
+
+        if node_type in self.CALL_NODES:
+            self._check_call(node)
+        elif node_type == "variable_declarator":
+            self._check_credential(node, node.child_by_field_name("name"), node.child_by_field_name("value"))
+        elif node_type == "assignment_expression":
+            self._check_credential(node, node.child_by_field_name("left"), node.child_by_field_name("right"))
+
+        return frame
+
+    def _leave(self, frame: _Frame):
+        """Undo what entering a node changed"""
+        if frame.scope:
+            self._close_scope()
+
+        if frame.function is not None:
+            name, line_number, old_function = frame.function
+            self._report_complexity(name, line_number, frame.complexity_slot)
+            self.current_function = old_function
+        elif frame.is_class:
+            self.current_class = frame.previous_class
+
+    def _enter_function(self, node: Node, frame: _Frame):
+        """Start tracking a named function (anonymous ones count toward their parent)"""
+        name = self._function_name(node)
+        if name is None:
+            return
+
+        line_number = node.start_point[0] + 1
+        frame.function = (name, line_number, self.current_function)
+        self.current_function = name
+
+        # Check for missing doc comments (AI-readiness issue)
+        if not self._has_doc_comment(self._doc_anchor(node)):
+            self.violations.append(ASTViolation(
+                file_path=self.file_path,
+                line_number=line_number,
+                violation_type="missing_docstring",
+                description=f"Function '{name}' lacks docstring - reduces AI understanding",
+                severity="low",
+                source=self.source,
+                function_name=name,
+                class_name=self.current_class
+            ))
+
+        frame.complexity_slot = len(self.violations)
+        self._complexity.append(1)
+
+    def _enter_class(self, node: Node, frame: _Frame):
+        """Start tracking a class declaration"""
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return
+
+        name = name_node.text.decode("utf-8", errors="replace")
+        frame.is_class = True
+        frame.previous_class = self.current_class
+        self.current_class = name
+
+        if not self._has_doc_comment(self._doc_anchor(node)):
+            self.violations.append(ASTViolation(
+                file_path=self.file_path,
+                line_number=node.start_point[0] + 1,
+                violation_type="missing_docstring",
+                description=f"Class '{name}' lacks docstring",
+                severity="low",
+                source=self.source,
+                class_name=name
+            ))
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+
+    def _branch_points(self, node: Node, node_type: str) -> int:
+        """Count the decision points a single node adds to its function's complexity"""
+        if node_type in self.BRANCH_NODES:
+            return 1
+        if node_type == "binary_expression":
+            operator = node.child_by_field_name("operator")
+            if operator is not None and operator.type in self.BOOLEAN_OPERATORS:
+                return 1
+        return 0
+
+    def _check_credential(self, node: Node, target: Optional[Node], value: Optional[Node]):
+        """Check for a string literal assigned to a credential-like name (more precise than regex)"""
+        if target is None or value is None or target.type != "identifier":
+            return
+        if not self._is_string_literal(value):
+            return
+
+        name = target.text.decode("utf-8", errors="replace")
+        if any(keyword in name.lower() for keyword in CREDENTIAL_KEYWORDS):
+            self.violations.append(ASTViolation(
+                file_path=self.file_path,
+                line_number=node.start_point[0] + 1,
+                violation_type="hardcoded_credential",
+                description=f"Hardcoded credential in variable '{name}'",
+                severity="critical",
+                source=self.source,
+                function_name=self.current_function,
+                class_name=self.current_class
+            ))
+
+    def _report_dangerous_call(self, node: Node, func_name: str):
+        """Report a call to a code-executing function"""
+        self.violations.append(ASTViolation(
+            file_path=self.file_path,
+            line_number=node.start_point[0] + 1,
+            violation_type="dangerous_function",
+            description=f"Use of dangerous function '{func_name}' - code injection risk",
+            severity="high",
+            source=self.source,
+            function_name=self.current_function,
+            class_name=self.current_class
+        ))
+
+    def _check_sql_call(self, node: Node, method_name: str, arguments: Optional[Node]):
+        """Report SQL methods whose query argument is built by concatenation"""
+        if method_name not in self.SQL_METHODS or arguments is None or arguments.named_child_count == 0:
+            return
+
+        if self._contains_string_concat(arguments.named_children[0]):
+            self.violations.append(ASTViolation(
+                file_path=self.file_path,
+                line_number=node.start_point[0] + 1,
+                violation_type="sql_injection",
+                description="SQL query uses string concatenation - injection risk",
+                severity="high",
+                source=self.source,
+                function_name=self.current_function,
+                class_name=self.current_class
+            ))
+
+    def _contains_string_concat(self, node: Node) -> bool:
+        """Check if node contains string concatenation (or interpolation)"""
+        pending = [node]
+        while pending:
+            current = pending.pop()
+            if current.type == "binary_expression":
+                operator = current.child_by_field_name("operator")
+                if operator is not None and operator.type == "+":
+                    return True
+            if current.type == "template_substitution":
+                return True
+            pending.extend(current.children)
+        return False
+
+    def _has_doc_comment(self, anchor: Node) -> bool:
+        """Check if a declaration is directly preceded by a /** ... */ comment"""
+        previous = anchor.prev_sibling
+        return (
+            previous is not None
+            and previous.type in self.DOC_COMMENT_NODES
+            and self.source_code.startswith(b"/**", previous.start_byte)
+        )
+
+    def _report_syntax_error(self, root: Node):
+        """Report the first unparsable region (the rest of the tree is still analyzed)"""
+        node = root
+        while not (node.is_error or node.is_missing):
+            node = next((child for child in node.children if child.has_error), None)
+            if node is None:
+                return
+
+        self.violations.append(ASTViolation(
+            file_path=self.file_path,
+            line_number=node.start_point[0] + 1,
+            violation_type="syntax_error",
+            description=f"Syntax error: unexpected input at line {node.start_point[0] + 1}",
+            severity="high"
+        ))
+
+    def _is_string_literal(self, node: Node) -> bool:
+        """Check if node is a plain string literal"""
+        return node.type in self.STRING_NODES
+
+    # ------------------------------------------------------------------
+    # Language hooks
+    # ------------------------------------------------------------------
+
+    def _function_name(self, node: Node) -> Optional[str]:
+        """Name of a function node, or None if it is anonymous"""
+        name_node = node.child_by_field_name("name")
+        return name_node.text.decode("utf-8", errors="replace") if name_node is not None else None
+
+    def _doc_anchor(self, node: Node) -> Node:
+        """The node a doc comment for this declaration would precede"""
+        return node
+
+    def _check_call(self, node: Node):
+        """Check a call for dangerous functions and SQL injection"""
+        raise NotImplementedError
+
+
+class JavaASTAnalyzer(TreeSitterAnalyzer):
+    """
+    AST analyzer for Java code
+    Detects the same violations as PythonASTAnalyzer using tree-sitter-java
+    """
+
+    SCOPE_NODES = frozenset([
+        "class_body", "interface_body", "enum_body",
+        "method_declaration", "constructor_declaration", "compact_constructor_declaration", "lambda_expression"
+    ])
+    FUNCTION_NODES = frozenset(["method_declaration", "constructor_declaration"])
+    CLASS_NODES = frozenset(["class_declaration", "interface_declaration", "enum_declaration", "record_declaration"])
+    BRANCH_NODES = frozenset([
+        "if_statement", "while_statement", "do_statement", "for_statement", "enhanced_for_statement",
+        "catch_clause", "ternary_expression"
+    ])
+    BOOLEAN_OPERATORS = frozenset(["&&", "||"])
+    CALL_NODES = frozenset(["method_invocation"])
+    STRING_NODES = frozenset(["string_literal"])
+    DOC_COMMENT_NODES = frozenset(["block_comment"])
+    SKIP_NODES = frozenset(["package_declaration", "import_declaration", "block_comment", "line_comment"])
+    BINDING_FIELDS = frozenset([
+        ("variable_declarator", "name"),
+        ("formal_parameter", "name"),
+        ("catch_formal_parameter", "name"),
+        ("resource", "name"),
+        ("lambda_expression", "parameters"),
+        ("inferred_parameters", None),
+    ])
+    LOOP_FIELDS = {
+        ("enhanced_for_statement", "name"): True,
+        ("for_statement", "init"): False,
+    }
+    EXPRESSION_FIELDS = frozenset([("variable_declarator", "value")])
+    NON_REFERENCE_FIELDS = frozenset([
+        ("method_invocation", "name"),
+        ("method_declaration", "name"),
+        ("constructor_declaration", "name"),
+        ("class_declaration", "name"),
+        ("interface_declaration", "name"),
+        ("enum_declaration", "name"),
+        ("record_declaration", "name"),
+        ("field_access", "field"),
+        ("marker_annotation", "name"),
+        ("annotation", "name"),
+        ("labeled_statement", None),
+        ("break_statement", None),
+        ("continue_statement", None),
+    ])
+    SQL_METHODS = frozenset(["execute", "executeQuery", "executeUpdate", "addBatch", "prepareStatement"])
+
+    # Runtime.exec runs commands, ScriptEngine.eval runs code
+    DANGEROUS_METHODS = frozenset(["exec", "eval"])
+
+    def __init__(self, file_path: str, source_code: Union[bytes, str], language: str = "java"):
+        super().__init__(file_path, source_code, language)
+
+    def _branch_points(self, node: Node, node_type: str) -> int:
+        """Also count each non-default switch label"""
+        if node_type == "switch_label":
+            return 0 if node.child_count and node.children[0].type == "default" else 1
+        return super()._branch_points(node, node_type)
+
+    def _check_call(self, node: Node):
+        """Check a method invocation"""
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return
+
+        method_name = name_node.text.decode("utf-8", errors="replace")
+        if method_name in self.DANGEROUS_METHODS:
+            self._report_dangerous_call(node, method_name)
+        self._check_sql_call(node, method_name, node.child_by_field_name("arguments"))
+
+
+class JavaScriptASTAnalyzer(TreeSitterAnalyzer):
+    """
+    AST analyzer for JavaScript and TypeScript code
+    Detects the same violations as PythonASTAnalyzer using tree-sitter-javascript
+    (or tree-sitter-typescript for .ts/.tsx files)
+    """
+
+    SCOPE_NODES = frozenset([
+        "function_declaration", "generator_function_declaration", "function_expression", "function",
+        "generator_function", "arrow_function", "method_definition"
+    ])
+    FUNCTION_NODES = SCOPE_NODES
+    CLASS_NODES = frozenset(["class_declaration", "abstract_class_declaration"])
+    BRANCH_NODES = frozenset([
+        "if_statement", "while_statement", "do_statement", "for_statement", "for_in_statement",
+        "catch_clause", "ternary_expression", "switch_case"
+    ])
+    BOOLEAN_OPERATORS = frozenset(["&&", "||", "??"])
+    CALL_NODES = frozenset(["call_expression", "new_expression"])
+    IDENTIFIER_NODES = frozenset(["identifier", "shorthand_property_identifier", "shorthand_property_identifier_pattern"])
+    STRING_NODES = frozenset(["string"])
+    DOC_COMMENT_NODES = frozenset(["comment"])
+    SKIP_NODES = frozenset(["comment", "string", "regex"])
+    BINDING_FIELDS = frozenset([
+        ("variable_declarator", "name"),
+        ("formal_parameters", None),
+        ("arrow_function", "parameter"),
+        ("catch_clause", "parameter"),
+        ("required_parameter", "pattern"),
+        ("optional_parameter", "pattern"),
+        ("import_clause", None),
+        ("namespace_import", None),
+        ("import_specifier", "name"),
+        ("import_specifier", "alias"),
+    ])
+    LOOP_FIELDS = {
+        ("for_in_statement", "left"): True,
+        ("for_statement", "initializer"): False,
+    }
+    EXPRESSION_FIELDS = frozenset([
+        ("variable_declarator", "value"),
+        ("assignment_pattern", "right"),
+        ("object_assignment_pattern", "right"),
+        ("required_parameter", "value"),
+        ("optional_parameter", "value"),
+        ("required_parameter", "type"),
+        ("optional_parameter", "type"),
+    ])
+    NON_REFERENCE_FIELDS = frozenset([
+        ("function_declaration", "name"),
+        ("generator_function_declaration", "name"),
+        ("function_expression", "name"),
+        ("class_declaration", "name"),
+        ("labeled_statement", "label"),
+        # JSX tag names (<a>, <p>) are elements, not variables
+        ("jsx_opening_element", "name"),
+        ("jsx_closing_element", "name"),
+        ("jsx_self_closing_element", "name"),
+    ])
+    SQL_METHODS = frozenset(["execute", "query", "raw"])
+
+    # Functions that evaluate strings as code
+    DANGEROUS_FUNCTIONS = frozenset(["eval", "Function"])
+
+    def __init__(self, file_path: str, source_code: Union[bytes, str], language: str = "javascript"):
+        super().__init__(file_path, source_code, language)
+
+    def _function_name(self, node: Node) -> Optional[str]:
+        """Declared name, or the variable an anonymous function is assigned to"""
+        name = super()._function_name(node)
+        if name is not None:
+            return name
+
+        parent = node.parent
+        if parent is not None and parent.type == "variable_declarator":
+            target = parent.child_by_field_name("name")
+            if target is not None and target.type == "identifier":
+                return target.text.decode("utf-8", errors="replace")
+        return None
+
+    def _doc_anchor(self, node: Node) -> Node:
+        """Doc comments sit before the declaration statement, outside any export"""
+        anchor = node
+        if anchor.type in ("function_expression", "function", "arrow_function", "generator_function"):
+            # const name = () => ...: the comment precedes the whole declaration
+            anchor = anchor.parent.parent if anchor.parent is not None and anchor.parent.parent is not None else anchor
+        if anchor.parent is not None and anchor.parent.type == "export_statement":
+            anchor = anchor.parent
+        return anchor
+
+    def _is_string_literal(self, node: Node) -> bool:
+        """Plain strings, or template strings without substitutions"""
+        if node.type == "template_string":
+            return not any(child.type == "template_substitution" for child in node.children)
+        return super()._is_string_literal(node)
+
+    def _check_call(self, node: Node):
+        """Check a call or new expression"""
+        if node.type == "new_expression":
+            constructor = node.child_by_field_name("constructor")
+            if constructor is not None and constructor.type == "identifier" and constructor.text == b"Function":
+                self._report_dangerous_call(node, "Function")
+            return
+
+        function = node.child_by_field_name("function")
+        if function is None:
+            return
+
+        if function.type == "identifier":
+            func_name = function.text.decode("utf-8", errors="replace")
+            if func_name in self.DANGEROUS_FUNCTIONS:
+                self._report_dangerous_call(node, func_name)
+        elif function.type == "member_expression":
+            method = function.child_by_field_name("property")
+            if method is not None:
+                self._check_sql_call(
+                    node, method.text.decode("utf-8", errors="replace"), node.child_by_field_name("arguments")
+                )
+
+
+# language -> analyzer class
+ANALYZERS = {
+    "java": JavaASTAnalyzer,
+    "javascript": JavaScriptASTAnalyzer,
+    "typescript": JavaScriptASTAnalyzer,
+    "tsx": JavaScriptASTAnalyzer,
+}
+
+
+def create_tree_sitter_analyzer(file_path: str, source_code: Union[bytes, str]) -> Optional[TreeSitterAnalyzer]:
+    """
+    Create the tree-sitter analyzer for a file's extension
+
+    Args:
+        file_path: Path to the source file
+        source_code: Raw file bytes
+
+    Returns:
+        Analyzer instance, or None if the language is unknown or its grammar
+        is not installed
+    """
+    language = EXTENSION_LANGUAGES.get(Path(file_path).suffix.lower())
+    if language is None or PARSER_POOL.language(language) is None:
+        return None
+    return ANALYZERS[language](file_path, source_code, language)
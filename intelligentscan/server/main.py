@@ -5,10 +5,14 @@ AI-powered code intelligence platform for vulnerability scanning, ARB compliance
 
 import os
 import json
+import time
+import asyncio
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from fastmcp import FastMCP
+from typing import Optional, List, Dict, Any, Set, Tuple
+from fastmcp import FastMCP, Context
 from loguru import logger
 
 # Configure logging
@@ -21,8 +25,19 @@ mcp = FastMCP("IntelligentScan", version="0.1.0")
 from intelligentscan.scanners.vulnerability_scanner import VulnerabilityScanner
 from intelligentscan.scanners.arb_scanner import ARBScanner
 from intelligentscan.scanners.ai_readiness_scanner import AIReadinessScanner
-from intelligentscan.utils.knowledge_graph import KnowledgeGraphBuilder
-from intelligentscan.utils.report_generator import ReportGenerator
+from intelligentscan.scanners.incremental import changed_files, missing_files, resolve_commit, work_tree_state
+from intelligentscan.scanners.parallel import ProgressCallback
+from intelligentscan.utils.knowledge_graph import KnowledgeGraphBuilder, SCAN_LAYERS
+from intelligentscan.utils.graph_hierarchy import (
+    DEFAULT_CHILD_LIMIT, DEFAULT_TOP_FILES, HierarchyGraph, build_hierarchy
+)
+from intelligentscan.utils.config_loader import get_settings
+from intelligentscan.utils.report_generator import ReportGenerator, resolve_report_path
+from intelligentscan.utils.pagination import (
+    DEFAULT_PAGE_SIZE, FINDING_LISTS, decode_cursor, encode_cursor, first_page, paginate
+)
+from intelligentscan.utils.session_store import SessionStore
+from intelligentscan.utils.streaming import BINARY_FORMATS, dumps_json
 
 
 class ScanSession:
@@ -34,6 +49,13 @@ class ScanSession:
         self.start_time = datetime.now()
         self.results = {}
         self.knowledge_graph = None
+        self.status = "running"
+        self.response = None  # Tool response, served by get_scan_status
+        self.task = None  # Background task for scans started with start_scan
+        self.git_commit = None  # HEAD commit when the scan started, if in a git repo
+        self.git_dirty = None  # Whether the scanned tree had uncommitted changes then
+        self.progress = None  # (files done, total files or None) while running
+        self.hierarchy = None  # Directory graph of the findings, built on first query (not stored)
 
     def add_result(self, scan_type: str, result: Dict[str, Any]):
         """Add scan results"""
@@ -44,37 +66,375 @@ class ScanSession:
         return {
             "scan_id": self.scan_id,
             "repo_path": self.repo_path,
+            "status": self.status,
             "start_time": self.start_time.isoformat(),
             "duration_seconds": (datetime.now() - self.start_time).total_seconds(),
             "results": self.results,
             "knowledge_graph": self.knowledge_graph
         }
 
+    def to_record(self) -> Dict[str, Any]:
+        """State kept by the session store (the background task and progress are not)"""
+        return {
+            "scan_id": self.scan_id,
+            "repo_path": self.repo_path,
+            "status": self.status,
+            "start_time": self.start_time.isoformat(),
+            "git_commit": self.git_commit,
+            "git_dirty": self.git_dirty,
+            "results": self.results,
+            "knowledge_graph": self.knowledge_graph,
+            "response": self.response,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "ScanSession":
+        """Rebuild a session the session store spilled to disk"""
+        session = cls(record["repo_path"], record["scan_id"])
+        session.start_time = datetime.fromisoformat(record["start_time"])
+        session.status = record["status"]
+        session.git_commit = record["git_commit"]
+        # Unknown for sessions stored before it was recorded; never trusted as a baseline
+        session.git_dirty = record.get("git_dirty", True)
+        session.results = record["results"]
+        session.knowledge_graph = record["knowledge_graph"]
+        session.response = record["response"]
+        return session
+
+
+class RepositoryGraph:
+    """
+    Knowledge graph merging the latest completed scan of each type of one repository
+
+    Reads go through the directory tree of the merged findings, one level of
+    detail at a time; the whole graph is only written out by export().
+    """
+
+    def __init__(self, repo_label: str):
+        self.repo_label = repo_label
+        self.builder = KnowledgeGraphBuilder()
+        self.scans: Dict[str, Tuple[datetime, str]] = {}  # scan type -> (start time, scan ID) merged
+        self.hierarchies: Dict[str, HierarchyGraph] = {}  # scan type -> directory tree of its findings
+        self.memory_bytes = 0  # approximate size of the merged graph and trees
+        self.lock = threading.Lock()
+        self._hierarchy: Optional[HierarchyGraph] = None
+
+    def merge(self, session: ScanSession, scan_type: str) -> bool:
+        """Merge a completed session unless a newer scan of its type is already in (blocking)"""
+        with self.lock:
+            merged = self.scans.get(scan_type)
+            if merged is not None and merged[0] >= session.start_time:
+                return False
+            results = session.results[scan_type]
+            self.builder.merge_scan_results(scan_type, results, session.scan_id)
+            self.hierarchies[scan_type] = build_hierarchy(
+                [results.get(FINDING_LISTS[scan_type]) or []], self.repo_label
+            )
+            self._hierarchy = None
+            self.scans[scan_type] = (session.start_time, session.scan_id)
+            self.memory_bytes = self.builder.graph.memory_bytes() + sum(
+                hierarchy.memory_bytes() for hierarchy in self.hierarchies.values()
+            )
+            return True
+
+    def scan_ids(self) -> Dict[str, str]:
+        """Scan ID merged per scan type"""
+        with self.lock:
+            return {scan_type: scan_id for scan_type, (_, scan_id) in self.scans.items()}
+
+    def hierarchy(self) -> HierarchyGraph:
+        """Directory tree of the findings of all merged scans, built once per merge (blocking)"""
+        with self.lock:
+            if self._hierarchy is None:
+                hierarchy = HierarchyGraph(self.repo_label)
+                for scan_type in SCAN_LAYERS:
+                    if scan_type in self.hierarchies:
+                        hierarchy.add_hierarchy(self.hierarchies[scan_type])
+                self._hierarchy = hierarchy
+            return self._hierarchy
+
+    def export(self, output_path: str, output_format: str, overwrite: bool = False):
+        """Write the whole merged graph to a file, created exclusively unless overwrite (blocking)"""
+        with self.lock:
+            self.builder.export_to_file(output_path, output_format, overwrite)
+
+
+# Session storage: recent sessions in memory within settings.session_memory_mb,
+# the rest spilled to SQLite in the cache directory and reloaded on demand
+session_store = SessionStore.from_settings(ScanSession.from_record)
+
+# Merged knowledge graphs of the most recently scanned or queried repositories,
+# keyed by real path, least recently used first; they are kept within
+# settings.repository_graph_memory_mb and rebuilt from stored sessions when needed
+repository_graphs: "OrderedDict[str, RepositoryGraph]" = OrderedDict()
+REPOSITORY_GRAPH_MEMORY_BYTES = get_settings().get("repository_graph_memory_mb", 256) * 1024 * 1024
+
+# Seconds between MCP progress notifications of one scan
+PROGRESS_INTERVAL = 0.5
+
+# Scan ID prefix per scan type
+SCAN_ID_PREFIXES = {
+    "vulnerability": "vuln",
+    "arb_compliance": "arb",
+    "ai_readiness": "ai_readiness",
+}
+
+
+# Microsecond timestamp of the last scan ID handed out; IDs strictly increase
+_last_scan_id_us = 0
+_scan_id_lock = threading.Lock()
+
+
+def _new_scan_id(scan_type: str) -> str:
+    """
+    Create a scan ID for a scan type
+
+    IDs are the scan type prefix plus the local time to the microsecond,
+    bumped past the previous ID if the clock has not moved, so they are
+    unique within the process and sort in creation order.
+    """
+    global _last_scan_id_us
+    with _scan_id_lock:
+        _last_scan_id_us = max(time.time_ns() // 1000, _last_scan_id_us + 1)
+        stamp = _last_scan_id_us
+
+    seconds, micros = divmod(stamp, 1_000_000)
+    return f"{SCAN_ID_PREFIXES[scan_type]}_{datetime.fromtimestamp(seconds):%Y%m%d_%H%M%S}_{micros:06d}"
+
+
+def _create_session(repo_path: str, scan_type: str) -> ScanSession:
+    """Create a session under a fresh scan ID and register it"""
+    while True:
+        # A stored session of an earlier server run may already hold the ID
+        session = ScanSession(repo_path, _new_scan_id(scan_type))
+        if session_store.register(session):
+            return session
 
-# Global session storage (in production, use Redis)
-active_sessions: Dict[str, ScanSession] = {}
+
+async def _send_progress(session: ScanSession, ctx: Context):
+    """
+    Send MCP progress notifications for a running scan until cancelled
+
+    Runs as a task of the tool call (progress notifications need its request
+    context) and forwards session.progress whenever it has moved on.
+    """
+    sent = None
+    while True:
+        await asyncio.sleep(PROGRESS_INTERVAL)
+        progress = session.progress
+        if progress is None or progress == sent:
+            continue
+
+        sent = progress
+        done, total = progress
+        message = f"{done}/{total} files" if total else f"{done} files"
+        try:
+            await ctx.report_progress(done, total, message)
+        except Exception as e:
+            logger.warning(f"Could not send progress for {session.scan_id}: {str(e)}")
+            return
+
+
+async def _execute_scan(
+    session: ScanSession,
+    scan_type: str,
+    options: Dict[str, Any],
+    ctx: Optional[Context] = None
+) -> Dict[str, Any]:
+    """
+    Run a scan for a session, recording its status and tool response
+
+    Scanners do their file I/O and matching on an executor, so awaiting this
+    never blocks other MCP requests.
+
+    Args:
+        session: Session to scan
+        scan_type: Key of SCAN_RUNNERS
+        options: Keyword arguments for the scan runner
+        ctx: Context of the tool call waiting for the scan, used to send
+             progress notifications (None for background scans)
+    """
+    def progress(done: int, total: Optional[int]):
+        # Called from the scanner's executor thread
+        session.progress = (done, total)
+
+    reporter = asyncio.create_task(_send_progress(session, ctx)) if ctx is not None else None
+
+    try:
+        loop = asyncio.get_running_loop()
+        session.git_commit, session.git_dirty = await loop.run_in_executor(None, work_tree_state, session.repo_path)
+
+        response = await SCAN_RUNNERS[scan_type](session, progress=progress, **options)
+        session.status = "completed"
+
+    except Exception as e:
+        logger.error(f"Error during {scan_type} scan {session.scan_id}: {str(e)}")
+        response = {
+            "scan_id": session.scan_id,
+            "error": str(e),
+            "status": "failed"
+        }
+        session.status = "failed"
+
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+
+    session.response = response
+
+    # Write the finished session through to the store so it can be evicted from memory
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, session_store.save, session)
+    except Exception as e:
+        logger.error(f"Could not store session {session.scan_id}, keeping it in memory: {str(e)}")
+
+    if session.status == "completed":
+        try:
+            graph = await _repository_graph(session.repo_path)
+            await asyncio.get_running_loop().run_in_executor(None, graph.merge, session, scan_type)
+            _trim_repository_graphs()
+        except Exception as e:
+            logger.error(f"Could not merge {session.scan_id} into the repository graph: {str(e)}")
+
+    return response
+
+
+async def _load_session(scan_id: str) -> Optional[ScanSession]:
+    """Look up a session, reloading it off the event loop if it was evicted from memory"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, session_store.get, scan_id)
+
+
+async def _repository_graph(repo_path: str) -> RepositoryGraph:
+    """
+    Merged knowledge graph of a repository
+
+    A repository seen for the first time (or again after being dropped from
+    repository_graphs) is seeded with the latest stored scan of each type;
+    after that, finished scans are merged in one at a time.
+    """
+    key = os.path.realpath(repo_path)
+    graph = repository_graphs.get(key)
+    if graph is not None:
+        repository_graphs.move_to_end(key)
+        return graph
+
+    graph = repository_graphs[key] = RepositoryGraph(os.path.basename(key.rstrip("/\\")))
+    loop = asyncio.get_running_loop()
+    for scan_type in SCAN_LAYERS:
+        latest = await loop.run_in_executor(None, session_store.latest, repo_path, scan_type)
+        if latest is not None:
+            await loop.run_in_executor(None, graph.merge, latest, scan_type)
+    _trim_repository_graphs()
+    return graph
+
+
+def _trim_repository_graphs():
+    """Drop least recently used repository graphs beyond the memory bound, keeping the newest"""
+    total = sum(graph.memory_bytes for graph in repository_graphs.values())
+    while total > REPOSITORY_GRAPH_MEMORY_BYTES and len(repository_graphs) > 1:
+        _, graph = repository_graphs.popitem(last=False)
+        total -= graph.memory_bytes
+
+
+async def _find_baseline(
+    session: ScanSession,
+    scan_type: str,
+    git_commit: Optional[str] = None
+) -> Optional[ScanSession]:
+    """Find the most recent completed session of the same repository and scan type (that scanned git_commit cleanly)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, session_store.latest, session.repo_path, scan_type, session.scan_id, git_commit
+    )
+
+
+async def _plan_incremental(
+    session: ScanSession,
+    scan_type: str,
+    since_ref: Optional[str],
+    is_compatible
+) -> Optional[Tuple[ScanSession, Set[str]]]:
+    """
+    Decide whether a scan can run incrementally
+
+    Args:
+        session: Session about to be scanned
+        scan_type: Scan type, used to find the baseline session
+        since_ref: Git ref whose scan to start from, or "baseline" for the
+                   most recent scan; the ref picks the baseline session
+                   that scanned it
+        is_compatible: Called with the baseline session's results; False if
+                       they were produced with different options
+
+    Returns:
+        (baseline session, changed paths), or None to run a full scan
+    """
+    if not since_ref:
+        return None
+
+    loop = asyncio.get_running_loop()
+    git_commit = None
+    if since_ref != "baseline":
+        git_commit = await loop.run_in_executor(None, resolve_commit, session.repo_path, since_ref)
+        if git_commit is None:
+            logger.info(f"Cannot resolve {since_ref} for {session.scan_id}, running a full {scan_type} scan")
+            return None
+
+    baseline = await _find_baseline(session, scan_type, git_commit)
+    if baseline is None or not is_compatible(baseline.results[scan_type]):
+        logger.info(f"No compatible baseline for {session.scan_id}, running a full {scan_type} scan")
+        return None
+
+    # The carried-over findings are only valid for the exact commit the baseline scanned
+    if baseline.git_commit is None or baseline.git_dirty:
+        logger.info(
+            f"Baseline {baseline.scan_id} has no git commit or scanned uncommitted changes, "
+            f"running a full {scan_type} scan"
+        )
+        return None
+
+    changed = await loop.run_in_executor(None, changed_files, session.repo_path, baseline.git_commit)
+    # Deleted ignored files are in no git listing; drop the findings of any file that is gone
+    baseline_files = {
+        finding.get("file") for finding in baseline.results[scan_type].get(FINDING_LISTS[scan_type]) or []
+    }
+    changed |= await loop.run_in_executor(None, missing_files, session.repo_path, baseline_files - changed)
+
+    logger.info(f"Incremental {scan_type} scan against {baseline.scan_id}: {len(changed)} changed files")
+    return baseline, changed
 
 
 @mcp.tool()
 async def scan_vulnerabilities(
     repo_path: str,
-    vulnerability_types: Optional[List[str]] = None
+    vulnerability_types: Optional[List[str]] = None,
+    since_ref: Optional[str] = None,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Scan repository for security vulnerabilities
 
+    Progress notifications are sent while the scan runs if the client asked
+    for them. The response holds the first page of findings; fetch the rest
+    with get_findings.
+
     Args:
         repo_path: Absolute path to the repository to scan
         vulnerability_types: Optional list of specific vulnerabilities to check
                            (e.g., ["log4j", "hardcoded_secrets", "sql_injection"])
                            If None, checks all vulnerability types
+        since_ref: Optional git ref (or "baseline" for the previous scan of this
+                  repo). Findings are carried over from the latest scan of that
+                  commit and only files changed since it are rescanned
 
     Returns:
         Dictionary containing:
-        - vulnerabilities_found: List of vulnerability details
-        - severity_breakdown: Count by severity (critical, high, medium, low)
-        - files_affected: Number of files with vulnerabilities
-        - scan_metadata: Scan timing and configuration info
+        - scan_id: ID to pass to get_findings and generate_report
+        - summary: Total findings, count by severity and files affected
+        - vulnerabilities: First page of vulnerability details
+        - next_cursor: Cursor for the next page (None if every finding is on this page)
+        - scan_time_seconds: Scan duration
 
     Example:
         scan_vulnerabilities("/path/to/repo", ["log4j", "hardcoded_secrets"])
@@ -87,35 +447,12 @@ async def scan_vulnerabilities(
             return {"error": f"Repository path does not exist: {repo_path}"}
 
         # Create scan session
-        scan_id = f"vuln_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        session = ScanSession(repo_path, scan_id)
-        active_sessions[scan_id] = session
-
-        # Initialize scanner
-        scanner = VulnerabilityScanner(repo_path)
-
-        # Perform scan
-        results = await scanner.scan(vulnerability_types=vulnerability_types)
-
-        # Store results
-        session.add_result("vulnerability", results)
+        session = _create_session(repo_path, "vulnerability")
 
-        logger.info(f"Vulnerability scan completed. Found {len(results.get('vulnerabilities_found', []))} issues")
-
-        return {
-            "scan_id": scan_id,
-            "status": "completed",
-            "summary": {
-                "total_vulnerabilities": len(results.get("vulnerabilities_found", [])),
-                "critical": results.get("severity_breakdown", {}).get("critical", 0),
-                "high": results.get("severity_breakdown", {}).get("high", 0),
-                "medium": results.get("severity_breakdown", {}).get("medium", 0),
-                "low": results.get("severity_breakdown", {}).get("low", 0),
-                "files_affected": results.get("files_affected", 0),
-            },
-            "vulnerabilities": results.get("vulnerabilities_found", []),
-            "scan_time_seconds": results.get("scan_metadata", {}).get("duration_seconds", 0)
-        }
+        return await _execute_scan(session, "vulnerability", {
+            "vulnerability_types": vulnerability_types,
+            "since_ref": since_ref
+        }, ctx)
 
     except Exception as e:
         logger.error(f"Error during vulnerability scan: {str(e)}")
@@ -125,26 +462,89 @@ async def scan_vulnerabilities(
         }
 
 
+async def _run_vulnerability_scan(
+    session: ScanSession,
+    vulnerability_types: Optional[List[str]] = None,
+    since_ref: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """Run a vulnerability scan for a session and build the tool response"""
+    # Initialize scanner
+    scanner = VulnerabilityScanner(session.repo_path)
+    types_to_scan = [
+        vtype for vtype in scanner.VULNERABILITY_PATTERNS
+        if not vulnerability_types or vtype in vulnerability_types
+    ]
+
+    # Carried-over findings are only valid if the baseline checked the same types
+    plan = await _plan_incremental(
+        session, "vulnerability", since_ref,
+        lambda previous: previous.get("scan_metadata", {}).get("vulnerability_types_checked") == types_to_scan
+    )
+
+    # Perform scan
+    if plan is None:
+        results = await scanner.scan(vulnerability_types=vulnerability_types, progress=progress)
+    else:
+        baseline, changed = plan
+        results = await scanner.scan(vulnerability_types=vulnerability_types, only_files=changed, progress=progress)
+        results = scanner.merge_baseline(baseline.results["vulnerability"], results, changed)
+        results["scan_metadata"]["incremental"].update(baseline_scan_id=baseline.scan_id, since_ref=since_ref)
+
+    # Store results
+    session.add_result("vulnerability", results)
+
+    logger.info(f"Vulnerability scan completed. Found {len(results.get('vulnerabilities_found', []))} issues")
+
+    page, next_cursor = first_page("vulnerability", results.get("vulnerabilities_found", []))
+    return {
+        "scan_id": session.scan_id,
+        "status": "completed",
+        "summary": {
+            "total_vulnerabilities": len(results.get("vulnerabilities_found", [])),
+            "critical": results.get("severity_breakdown", {}).get("critical", 0),
+            "high": results.get("severity_breakdown", {}).get("high", 0),
+            "medium": results.get("severity_breakdown", {}).get("medium", 0),
+            "low": results.get("severity_breakdown", {}).get("low", 0),
+            "files_affected": results.get("files_affected", 0),
+        },
+        "vulnerabilities": page,
+        "next_cursor": next_cursor,
+        "scan_time_seconds": results.get("scan_metadata", {}).get("duration_seconds", 0)
+    }
+
+
 @mcp.tool()
 async def check_arb_compliance(
     repo_path: str,
-    arb_rules: Optional[List[str]] = None
+    arb_rules: Optional[List[str]] = None,
+    since_ref: Optional[str] = None,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Check repository against Architectural Review Board (ARB) guidelines
 
+    Progress notifications are sent while the check runs if the client asked
+    for them. The response holds the first page of violations; fetch the rest
+    with get_findings.
+
     Args:
         repo_path: Absolute path to the repository to scan
         arb_rules: Optional list of specific ARB rule IDs to check
                   (e.g., ["ARB-SEC-001", "ARB-PERF-005"])
                   If None, checks all ARB rules
+        since_ref: Optional git ref (or "baseline" for the previous check of this
+                  repo). Violations are carried over from the latest check of
+                  that commit and only files changed since it are rechecked
 
     Returns:
         Dictionary containing:
-        - violations_found: List of ARB rule violations
         - compliance_score: Overall compliance percentage (0-100)
-        - violations_by_category: Grouped by security, performance, architecture, etc.
-        - files_with_violations: Number of non-compliant files
+        - summary: Total and critical violations, files checked and non-compliant files
+        - violations: First page of ARB rule violations
+        - next_cursor: Cursor for the next page (None if every violation is on this page)
+        - violations_by_category: Violation count per category (security, performance, ...)
+        - rules_not_evaluated: Rules that could not be checked, with the reason
 
     Example:
         check_arb_compliance("/path/to/repo", ["ARB-SEC-001"])
@@ -156,35 +556,9 @@ async def check_arb_compliance(
             return {"error": f"Repository path does not exist: {repo_path}"}
 
         # Create scan session
-        scan_id = f"arb_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        session = ScanSession(repo_path, scan_id)
-        active_sessions[scan_id] = session
-
-        # Initialize scanner
-        scanner = ARBScanner(repo_path)
-
-        # Perform scan
-        results = await scanner.scan(rule_ids=arb_rules)
+        session = _create_session(repo_path, "arb_compliance")
 
-        # Store results
-        session.add_result("arb_compliance", results)
-
-        logger.info(f"ARB compliance check completed. Compliance score: {results.get('compliance_score', 0)}%")
-
-        return {
-            "scan_id": scan_id,
-            "status": "completed",
-            "compliance_score": results.get("compliance_score", 0),
-            "summary": {
-                "total_violations": len(results.get("violations_found", [])),
-                "critical_violations": len([v for v in results.get("violations_found", [])
-                                          if v.get("severity") == "critical"]),
-                "files_checked": results.get("files_checked", 0),
-                "files_with_violations": results.get("files_with_violations", 0)
-            },
-            "violations": results.get("violations_found", []),
-            "violations_by_category": results.get("violations_by_category", {}),
-        }
+        return await _execute_scan(session, "arb_compliance", {"arb_rules": arb_rules, "since_ref": since_ref}, ctx)
 
     except Exception as e:
         logger.error(f"Error during ARB compliance check: {str(e)}")
@@ -194,14 +568,70 @@ async def check_arb_compliance(
         }
 
 
+async def _run_arb_compliance_check(
+    session: ScanSession,
+    arb_rules: Optional[List[str]] = None,
+    since_ref: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """Run an ARB compliance check for a session and build the tool response"""
+    # Initialize scanner
+    scanner = ARBScanner(session.repo_path)
+
+    # Carried-over violations are only valid if the baseline checked the same rules
+    plan = await _plan_incremental(
+        session, "arb_compliance", since_ref,
+        lambda previous: previous.get("rules_checked") == arb_rules
+    )
+
+    # Perform scan
+    if plan is None:
+        results = await scanner.scan(rule_ids=arb_rules, progress=progress)
+    else:
+        baseline, changed = plan
+        results = await scanner.scan(rule_ids=arb_rules, only_files=changed, progress=progress)
+        results = scanner.merge_baseline(baseline.results["arb_compliance"], results, changed)
+        results["incremental"].update(baseline_scan_id=baseline.scan_id, since_ref=since_ref)
+
+    # Store results
+    session.add_result("arb_compliance", results)
+
+    logger.info(f"ARB compliance check completed. Compliance score: {results.get('compliance_score', 0)}%")
+
+    page, next_cursor = first_page("arb_compliance", results.get("violations_found", []))
+    return {
+        "scan_id": session.scan_id,
+        "status": "completed",
+        "compliance_score": results.get("compliance_score", 0),
+        "summary": {
+            "total_violations": len(results.get("violations_found", [])),
+            "critical_violations": len([v for v in results.get("violations_found", [])
+                                      if v.get("severity") == "critical"]),
+            "files_checked": results.get("files_checked", 0),
+            "files_with_violations": results.get("files_with_violations", 0)
+        },
+        "violations": page,
+        "next_cursor": next_cursor,
+        "violations_by_category": {
+            category: len(violations)
+            for category, violations in results.get("violations_by_category", {}).items()
+        },
+        "rules_not_evaluated": results.get("rules_not_evaluated", {}),
+    }
+
+
 @mcp.tool()
 async def scan_ai_readiness(
     repo_path: str,
-    include_suggestions: bool = True
+    include_suggestions: bool = True,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Scan repository to determine AI-readiness (how well AI tools can understand the code)
 
+    Progress notifications are sent while the scan runs if the client asked
+    for them.
+
     Args:
         repo_path: Absolute path to the repository to scan
         include_suggestions: If True, includes specific improvement suggestions
@@ -223,79 +653,264 @@ async def scan_ai_readiness(
             return {"error": f"Repository path does not exist: {repo_path}"}
 
         # Create scan session
-        scan_id = f"ai_readiness_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        session = ScanSession(repo_path, scan_id)
-        active_sessions[scan_id] = session
+        session = _create_session(repo_path, "ai_readiness")
 
-        # Initialize scanner
-        scanner = AIReadinessScanner(repo_path)
+        return await _execute_scan(session, "ai_readiness", {"include_suggestions": include_suggestions}, ctx)
 
-        # Perform scan
-        results = await scanner.scan(include_suggestions=include_suggestions)
+    except Exception as e:
+        logger.error(f"Error during AI-readiness scan: {str(e)}")
+        return {
+            "error": str(e),
+            "status": "failed"
+        }
+
+
+async def _run_ai_readiness_scan(
+    session: ScanSession,
+    include_suggestions: bool = True,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """Run an AI-readiness scan for a session and build the tool response"""
+    # Initialize scanner
+    scanner = AIReadinessScanner(session.repo_path)
+
+    # Perform scan
+    results = await scanner.scan(include_suggestions=include_suggestions, progress=progress)
+
+    # Build knowledge graph (CPU-bound for large results, so keep it off the loop)
+    graph_builder = KnowledgeGraphBuilder()
+    loop = asyncio.get_running_loop()
+    knowledge_graph = await loop.run_in_executor(None, graph_builder.build_from_scan_results, results)
+    session.knowledge_graph = knowledge_graph
+
+    # Store results
+    session.add_result("ai_readiness", results)
+
+    logger.info(f"AI-readiness scan completed. Score: {results.get('ai_readiness_score', 0)}")
+
+    return {
+        "scan_id": session.scan_id,
+        "status": "completed",
+        "ai_readiness_score": results.get("ai_readiness_score", 0),
+        "summary": {
+            "total_files_analyzed": results.get("total_files_analyzed", 0),
+            "files_reanalyzed": results.get("files_reanalyzed", 0),
+            "low_confidence_files": len(results.get("low_confidence_areas", [])),
+            "suggestions_count": len(results.get("suggestions", [])) if include_suggestions else 0
+        },
+        "low_confidence_areas": results.get("low_confidence_areas", []),
+        "suggestions": results.get("suggestions", []) if include_suggestions else [],
+        "knowledge_graph": knowledge_graph
+    }
 
-        # Build knowledge graph
-        graph_builder = KnowledgeGraphBuilder()
-        knowledge_graph = graph_builder.build_from_scan_results(results)
-        session.knowledge_graph = knowledge_graph
 
-        # Store results
-        session.add_result("ai_readiness", results)
+# Scan runners by scan type, shared by the blocking tools and start_scan
+SCAN_RUNNERS = {
+    "vulnerability": _run_vulnerability_scan,
+    "arb_compliance": _run_arb_compliance_check,
+    "ai_readiness": _run_ai_readiness_scan,
+}
 
-        logger.info(f"AI-readiness scan completed. Score: {results.get('ai_readiness_score', 0)}")
 
-        return {
+@mcp.tool()
+async def start_scan(
+    repo_path: str,
+    scan_type: str = "vulnerability",
+    vulnerability_types: Optional[List[str]] = None,
+    arb_rules: Optional[List[str]] = None,
+    include_suggestions: bool = True,
+    since_ref: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Start a scan in the background and return immediately
+
+    Args:
+        repo_path: Absolute path to the repository to scan
+        scan_type: "vulnerability", "arb_compliance" or "ai_readiness"
+        vulnerability_types: For vulnerability scans, specific vulnerabilities to check
+        arb_rules: For ARB compliance checks, specific ARB rule IDs to check
+        include_suggestions: For AI-readiness scans, whether to include suggestions
+        since_ref: For vulnerability and ARB scans, rescan only files changed since
+                  this git ref (see scan_vulnerabilities)
+
+    Returns:
+        Dictionary with the scan_id to poll with get_scan_status
+
+    Example:
+        start_scan("/path/to/repo", scan_type="vulnerability")
+    """
+    logger.info(f"Starting background {scan_type} scan for: {repo_path}")
+
+    if scan_type not in SCAN_RUNNERS:
+        return {"error": f"Unknown scan type: {scan_type}. Expected one of {list(SCAN_RUNNERS)}"}
+
+    if not os.path.exists(repo_path):
+        return {"error": f"Repository path does not exist: {repo_path}"}
+
+    options = {
+        "vulnerability": {"vulnerability_types": vulnerability_types, "since_ref": since_ref},
+        "arb_compliance": {"arb_rules": arb_rules, "since_ref": since_ref},
+        "ai_readiness": {"include_suggestions": include_suggestions},
+    }[scan_type]
+
+    session = _create_session(repo_path, scan_type)
+
+    # Keep a reference so the task is not garbage collected while running
+    session.task = asyncio.create_task(_execute_scan(session, scan_type, options))
+
+    return {
+        "scan_id": session.scan_id,
+        "scan_type": scan_type,
+        "status": "running"
+    }
+
+
+@mcp.tool()
+async def get_scan_status(scan_id: str) -> Dict[str, Any]:
+    """
+    Get the status of a scan, including its results once completed
+
+    Args:
+        scan_id: ID returned by start_scan (or any other scan tool)
+
+    Returns:
+        Dictionary with status "running", "completed" or "failed"; running
+        scans include the files scanned so far, completed and failed scans
+        include the same fields the blocking tool returns
+
+    Example:
+        get_scan_status("vuln_20250110_143022_512093")
+    """
+    session = await _load_session(scan_id)
+    if session is None:
+        return {"error": f"Scan session not found: {scan_id}"}
+
+    if session.status == "running":
+        response = {
             "scan_id": scan_id,
-            "status": "completed",
-            "ai_readiness_score": results.get("ai_readiness_score", 0),
-            "summary": {
-                "total_files_analyzed": results.get("total_files_analyzed", 0),
-                "low_confidence_files": len(results.get("low_confidence_areas", [])),
-                "suggestions_count": len(results.get("suggestions", [])) if include_suggestions else 0
-            },
-            "low_confidence_areas": results.get("low_confidence_areas", []),
-            "suggestions": results.get("suggestions", []) if include_suggestions else [],
-            "knowledge_graph": knowledge_graph
+            "status": "running",
+            "elapsed_seconds": (datetime.now() - session.start_time).total_seconds()
         }
+        if session.progress is not None:
+            files_done, files_total = session.progress
+            response["progress"] = {"files_done": files_done, "files_total": files_total}
+        return response
 
-    except Exception as e:
-        logger.error(f"Error during AI-readiness scan: {str(e)}")
-        return {
-            "error": str(e),
-            "status": "failed"
-        }
+    return session.response
+
+
+@mcp.tool()
+async def get_findings(
+    scan_id: str,
+    cursor: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    include_snippets: bool = True
+) -> Dict[str, Any]:
+    """
+    Page through the findings of a completed scan
+
+    Args:
+        scan_id: ID of the scan session
+        cursor: next_cursor from a scan tool or a previous get_findings call,
+               or None for the first page
+        filters: Optional filters; a list of values matches any of them:
+                - severity: e.g. "critical" or ["critical", "high"]
+                - file: path prefix (e.g. "src/auth/") or glob (e.g. "*.java")
+                - type: vulnerability type, ARB rule ID or AI-readiness rule
+                - category: ARB rule category
+                A cursor is only valid with the filters it was issued for
+        page_size: Findings per page (at most 1000; pages also stop at about
+                  192 KB of findings, so follow next_cursor rather than counting)
+        include_snippets: If False, code_snippet and matched_text are left out
+
+    Returns:
+        Dictionary containing:
+        - findings: One page of vulnerabilities, ARB violations or AI-readiness
+          low-confidence areas, depending on the scan type
+        - next_cursor: Cursor for the next page (None on the last page)
+        - total_findings: Findings of the scan before filtering
+
+    Example:
+        get_findings("vuln_20250110_143022_512093", filters={"severity": ["critical", "high"]})
+    """
+    session = await _load_session(scan_id)
+    if session is None:
+        return {"error": f"Scan session not found: {scan_id}"}
+
+    if session.status != "completed":
+        return {"error": f"Scan {scan_id} is {session.status}", "status": session.status}
+
+    scan_type = next(iter(session.results))
+    findings = session.results[scan_type].get(FINDING_LISTS[scan_type]) or []
+
+    try:
+        position = decode_cursor(cursor, scan_type, filters) if cursor else 0
+        page, next_position = paginate(findings, position, page_size, filters, include_snippets)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    return {
+        "scan_id": scan_id,
+        "scan_type": scan_type,
+        "findings": page,
+        "next_cursor": None if next_position is None else encode_cursor(scan_type, next_position, filters),
+        "total_findings": len(findings),
+    }
 
 
 @mcp.tool()
 async def generate_report(
     scan_id: str,
-    format: str = "json"
+    format: str = "json",
+    output_path: Optional[str] = None,
+    overwrite: bool = False
 ) -> Dict[str, Any]:
     """
     Generate a comprehensive report from a completed scan
 
     Args:
         scan_id: ID of the scan session to generate report for
-        format: Output format ("json", "html", "markdown")
+        format: Output format ("json", "html", "markdown", or "msgpack" with output_path)
+        output_path: Optional file to stream the report to instead of returning it,
+            relative to the server's reports directory (paths outside it are
+            refused); recommended for large scans
+        overwrite: Replace output_path if it already exists
 
     Returns:
-        Formatted report with all scan results, knowledge graph, and recommendations
+        Formatted report with all scan results, knowledge graph, and recommendations,
+        or the path and size of the written file when output_path is given
 
     Example:
-        generate_report("vuln_20250110_143022", format="html")
+        generate_report("vuln_20250110_143022_512093", format="html")
+        generate_report("vuln_20250110_143022_512093", format="msgpack", output_path="vuln_scan.msgpack")
     """
     logger.info(f"Generating report for scan: {scan_id}")
 
     try:
-        if scan_id not in active_sessions:
+        session = await _load_session(scan_id)
+        if session is None:
             return {"error": f"Scan session not found: {scan_id}"}
 
-        session = active_sessions[scan_id]
         report_generator = ReportGenerator()
+        loop = asyncio.get_running_loop()
 
-        report = report_generator.generate(
-            session=session,
-            output_format=format
-        )
+        if output_path:
+            path, bytes_written = await loop.run_in_executor(
+                None, report_generator.write, session, format, output_path, overwrite
+            )
+            return {
+                "scan_id": scan_id,
+                "status": "completed",
+                "format": format,
+                "output_path": str(path),
+                "bytes_written": bytes_written
+            }
+
+        if format in BINARY_FORMATS:
+            return {"error": f"The {format} format needs an output_path"}
+
+        report = await loop.run_in_executor(None, report_generator.generate, session, format)
 
         return {
             "scan_id": scan_id,
@@ -312,6 +927,63 @@ async def generate_report(
         }
 
 
+@mcp.tool()
+async def export_knowledge_graph(
+    scan_id: str,
+    output_path: str,
+    format: str = "json",
+    overwrite: bool = False
+) -> Dict[str, Any]:
+    """
+    Write the unified knowledge graph of a scan's repository to a file
+
+    The graph merges the repository's latest vulnerability, ARB and
+    AI-readiness scans with a single node per file; it can be too large to
+    return, so it is only written out.
+
+    Args:
+        scan_id: ID of any scan session of the repository
+        output_path: File to write, relative to the server's reports directory
+            (paths outside it are refused)
+        format: Output format ("json" for graph_json_v1, "graphml" or "gexf")
+        overwrite: Replace output_path if it already exists
+
+    Returns:
+        Path and size of the written file, and the scan ID merged per scan type
+
+    Example:
+        export_knowledge_graph("vuln_20250110_143022_512093", "graphs/repo.graphml", format="graphml")
+    """
+    logger.info(f"Exporting knowledge graph for scan: {scan_id}")
+
+    try:
+        session = await _load_session(scan_id)
+        if session is None:
+            return {"error": f"Scan session not found: {scan_id}"}
+        if format not in ("json", "graphml", "gexf"):
+            return {"error": f"Unsupported format: {format}. Use json, graphml or gexf"}
+
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(None, resolve_report_path, output_path, overwrite)
+        graph = await _repository_graph(session.repo_path)
+        await loop.run_in_executor(None, graph.export, str(path), format, overwrite)
+        return {
+            "scan_id": scan_id,
+            "status": "completed",
+            "format": format,
+            "output_path": str(path),
+            "bytes_written": path.stat().st_size,
+            "scans": graph.scan_ids()
+        }
+
+    except Exception as e:
+        logger.error(f"Error exporting knowledge graph: {str(e)}")
+        return {
+            "error": str(e),
+            "status": "failed"
+        }
+
+
 @mcp.tool()
 async def scan_by_prompt(prompt: str) -> Dict[str, Any]:
     """
@@ -389,39 +1061,109 @@ async def scan_by_prompt(prompt: str) -> Dict[str, Any]:
 
 @mcp.resource("scan://sessions")
 async def get_active_sessions() -> str:
-    """Get list of all active scan sessions"""
-    sessions_info = {
-        scan_id: {
-            "repo_path": session.repo_path,
-            "start_time": session.start_time.isoformat(),
-            "scan_types": list(session.results.keys())
-        }
-        for scan_id, session in active_sessions.items()
-    }
-    return json.dumps(sessions_info, indent=2)
+    """Get list of all scan sessions, including those spilled to disk"""
+    loop = asyncio.get_running_loop()
+    sessions_info = await loop.run_in_executor(None, session_store.summaries)
+    return dumps_json(sessions_info)
 
 
 @mcp.resource("report://latest")
 async def get_latest_report() -> str:
     """Get the most recent scan report"""
-    if not active_sessions:
+    loop = asyncio.get_running_loop()
+    latest_session = await loop.run_in_executor(None, session_store.newest)
+    if latest_session is None:
         return json.dumps({"message": "No scans have been performed yet"})
 
-    latest_session = list(active_sessions.values())[-1]
-    return json.dumps(latest_session.to_dict(), indent=2)
+    return await loop.run_in_executor(None, dumps_json, latest_session.to_dict())
+
+
+async def _session_hierarchy(session: ScanSession) -> HierarchyGraph:
+    """Directory graph of a session's findings, built once per loaded session"""
+    if session.hierarchy is None:
+        finding_lists = [
+            results.get(FINDING_LISTS[scan_type], [])
+            for scan_type, results in session.results.items() if scan_type in FINDING_LISTS
+        ]
+        loop = asyncio.get_running_loop()
+        session.hierarchy = await loop.run_in_executor(
+            None, build_hierarchy, finding_lists, os.path.basename(session.repo_path.rstrip("/\\"))
+        )
+    return session.hierarchy
 
 
-@mcp.resource("graph://knowledge-graph/{scan_id}")
-async def get_knowledge_graph(scan_id: str) -> str:
-    """Get knowledge graph for a specific scan"""
-    if scan_id not in active_sessions:
+@mcp.resource("graph://knowledge-graph/{scan_id}{?view,path,depth,limit,top}")
+async def get_knowledge_graph(
+    scan_id: str,
+    view: str = "tree",
+    path: str = "",
+    depth: int = 1,
+    limit: int = DEFAULT_CHILD_LIMIT,
+    top: int = DEFAULT_TOP_FILES
+) -> str:
+    """
+    Get knowledge graph for a specific scan, one level of detail at a time
+
+    Views (query parameters, e.g. graph://knowledge-graph/<scan_id>?view=tree&path=src/api&depth=2):
+    - tree: the directory at path with its hottest children down to depth
+      levels (at most limit per directory); every node carries a severity
+      histogram of the findings below it
+    - hotspots: the top files with the worst findings below path
+    - full: the complete graph_json_v1 knowledge graph (AI-readiness scans only)
+    - unified: the tree at path (to depth, limit per directory) and the top
+      hottest files below it, over the findings of the scan's repository
+      merged from its latest vulnerability, ARB and AI-readiness scans; the
+      whole merged graph is written to a file by export_knowledge_graph
+    """
+    session = await _load_session(scan_id)
+    if session is None:
         return json.dumps({"error": f"Scan not found: {scan_id}"})
 
-    session = active_sessions[scan_id]
-    if not session.knowledge_graph:
-        return json.dumps({"message": "Knowledge graph not available for this scan"})
+    loop = asyncio.get_running_loop()
+    if view == "unified":
+        graph = await _repository_graph(session.repo_path)
+        hierarchy = await loop.run_in_executor(None, graph.hierarchy)
+        response = {
+            "scan_id": scan_id,
+            "view": view,
+            "format": "graph_hierarchy_v1",
+            "total_findings": hierarchy.finding_count,
+            "scans": graph.scan_ids(),
+        }
+        try:
+            response["root"] = hierarchy.expand(path, depth, limit)
+            response["files"] = hierarchy.hottest_files(top, path)
+        except ValueError as e:
+            return json.dumps({"error": str(e)})
+        return dumps_json(response)
+
+    if view == "full":
+        if not session.knowledge_graph:
+            return json.dumps({"message": "Knowledge graph not available for this scan"})
+        return await loop.run_in_executor(None, dumps_json, session.knowledge_graph)
+
+    if view not in ("tree", "hotspots"):
+        return json.dumps({"error": f"Unknown view: {view}. Use tree, hotspots, full or unified"})
+    if session.status == "running":
+        return json.dumps({"message": "Scan still running", "status": "running"})
+
+    hierarchy = await _session_hierarchy(session)
+    response = {
+        "scan_id": scan_id,
+        "view": view,
+        "format": "graph_hierarchy_v1",
+        "total_findings": hierarchy.finding_count,
+    }
+    try:
+        if view == "tree":
+            response["root"] = hierarchy.expand(path, depth, limit)
+        else:
+            response["path"] = path
+            response["files"] = hierarchy.hottest_files(top, path)
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
 
-    return json.dumps(session.knowledge_graph, indent=2)
+    return dumps_json(response)
 
 
 # Main entry point
@@ -0,0 +1,255 @@
+"""
+Compact Graph Storage for IntelligentScan
+Stores knowledge graph nodes and edges in integer-indexed columns instead of
+a networkx graph of per-node attribute dicts.
+
+Node i is "node_{i}" in graph_json_v1 output. Labels, types and colors are
+interned into string tables and referenced by index from arrays; metadata is
+kept as a tuple of values plus the index of its key tuple (its "schema"),
+since nodes of one type share the same keys. Color counts are updated as
+nodes are added, so statistics never need a pass over the nodes.
+
+Every node belongs to a layer (a small integer, SHARED_LAYER by default), so
+the nodes one scan contributed to a merged graph can be removed again.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate, compress
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import networkx as nx
+
+from intelligentscan.utils.streaming import StreamedList
+
+
+# Colors reported in graph_json_v1 statistics
+STATISTIC_COLORS = ("red", "green", "yellow")
+
+# Layer of nodes that no single scan owns (roots, shared file nodes)
+SHARED_LAYER = 0
+
+
+class StringTable:
+    """Interns strings to dense integer ids"""
+
+    __slots__ = ("values", "ids")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        """Get the id of value, adding it if new"""
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class CompactGraph:
+    """
+    Directed graph with integer node ids and column-oriented storage
+
+    Node ids are assigned densely from 0 in insertion order. Edges are stored
+    in insertion order and emitted grouped by source node, matching the order
+    of the networkx-backed graph this replaces.
+    """
+
+    def __init__(self):
+        self.strings = StringTable()  # labels, types and colors share one table
+        self.node_labels = array("I")
+        self.node_types = array("I")
+        self.node_colors = array("I")
+        self.node_schemas = array("I")
+        self.node_layers = array("B")
+        self.node_values: List[Tuple[Any, ...]] = []
+        self.schemas: List[Tuple[str, ...]] = []
+        self._schema_ids: Dict[Tuple[str, ...], int] = {}
+
+        self.edge_sources = array("I")
+        self.edge_targets = array("I")
+        self.edge_types = array("I")
+        self.edge_labels = array("I")
+
+        self.color_counts: Counter = Counter()
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_types)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_sources)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the graph: columns, metadata tuples and strings (not nested values)"""
+        columns = (
+            self.node_labels, self.node_types, self.node_colors, self.node_schemas, self.node_layers,
+            self.edge_sources, self.edge_targets, self.edge_types, self.edge_labels,
+        )
+        size = sum(len(column) * column.itemsize for column in columns)
+        size += sys.getsizeof(self.node_values) + sum(map(sys.getsizeof, self.node_values))
+        return size + sum(map(sys.getsizeof, self.strings.values))
+
+    def _schema(self, metadata: Dict[str, Any]) -> int:
+        """Id of the key tuple of a metadata dict"""
+        keys = tuple(metadata)
+        schema_id = self._schema_ids.get(keys)
+        if schema_id is None:
+            schema_id = self._schema_ids[keys] = len(self.schemas)
+            self.schemas.append(keys)
+        return schema_id
+
+    def add_node(
+        self,
+        label: str,
+        node_type: str,
+        color: str,
+        metadata: Dict[str, Any],
+        layer: int = SHARED_LAYER
+    ) -> int:
+        """
+        Add a node
+
+        Args:
+            label: Display label
+            node_type: Node type (root, file, vulnerability, ...)
+            color: Display color
+            metadata: Extra attributes; values are stored as given
+            layer: Layer the node belongs to (0-255)
+
+        Returns:
+            Integer node id
+        """
+        intern = self.strings.intern
+        node_id = len(self.node_types)
+        self.node_labels.append(intern(label))
+        self.node_types.append(intern(node_type))
+        self.node_colors.append(intern(color))
+        self.node_schemas.append(self._schema(metadata))
+        self.node_layers.append(layer)
+        self.node_values.append(tuple(metadata.values()))
+        self.color_counts[color] += 1
+        return node_id
+
+    def set_node(self, node_id: int, color: str, metadata: Dict[str, Any]):
+        """Replace the color and metadata of an existing node"""
+        self.color_counts[self.strings.values[self.node_colors[node_id]]] -= 1
+        self.color_counts[color] += 1
+        self.node_colors[node_id] = self.strings.intern(color)
+        self.node_schemas[node_id] = self._schema(metadata)
+        self.node_values[node_id] = tuple(metadata.values())
+
+    def remove_layer(self, layer: int, also: Iterable[int] = ()) -> array:
+        """
+        Remove every node of a layer, plus the given nodes, and their edges
+
+        Remaining nodes are renumbered densely in their original order.
+
+        Args:
+            layer: Layer to remove
+            also: Ids of other nodes to remove
+
+        Returns:
+            Array mapping each old node id to its new id (-1 if removed)
+        """
+        keep = bytearray(node_layer != layer for node_layer in self.node_layers)
+        for node_id in also:
+            keep[node_id] = 0
+
+        strings = self.strings.values
+        for color, count in Counter(compress(self.node_colors, (not kept for kept in keep))).items():
+            self.color_counts[strings[color]] -= count
+
+        # Kept node i becomes number of kept nodes up to and including i, minus one
+        renumber = array("i", (rank - 1 if kept else -1 for rank, kept in zip(accumulate(keep), keep)))
+        for name in ("node_labels", "node_types", "node_colors", "node_schemas", "node_layers"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, compress(column, keep)))
+        self.node_values = list(compress(self.node_values, keep))
+
+        edges = bytearray(
+            keep[source] and keep[target] for source, target in zip(self.edge_sources, self.edge_targets)
+        )
+        self.edge_sources = array("I", (renumber[source] for source in compress(self.edge_sources, edges)))
+        self.edge_targets = array("I", (renumber[target] for target in compress(self.edge_targets, edges)))
+        self.edge_types = array("I", compress(self.edge_types, edges))
+        self.edge_labels = array("I", compress(self.edge_labels, edges))
+        return renumber
+
+    def add_edge(self, source: int, target: int, edge_type: str, label: str):
+        """Add an edge between two node ids"""
+        self.edge_sources.append(source)
+        self.edge_targets.append(target)
+        self.edge_types.append(self.strings.intern(edge_type))
+        self.edge_labels.append(self.strings.intern(label))
+
+    def node_metadata(self, node_id: int) -> Dict[str, Any]:
+        """Metadata dict of one node"""
+        return dict(zip(self.schemas[self.node_schemas[node_id]], self.node_values[node_id]))
+
+    def statistics(self) -> Dict[str, int]:
+        """graph_json_v1 statistics, from the running counts"""
+        stats = {"node_count": self.node_count, "edge_count": self.edge_count}
+        for color in STATISTIC_COLORS:
+            stats[f"{color}_nodes"] = self.color_counts[color]
+        return stats
+
+    def iter_nodes(self) -> Iterator[Dict[str, Any]]:
+        """Yield graph_json_v1 node dicts in id order"""
+        strings = self.strings.values
+        schemas = self.schemas
+        columns = zip(self.node_labels, self.node_types, self.node_colors, self.node_schemas, self.node_values)
+        for node_id, (label, node_type, color, schema, values) in enumerate(columns):
+            yield {
+                "id": f"node_{node_id}",
+                "label": strings[label],
+                "type": strings[node_type],
+                "color": strings[color],
+                "metadata": dict(zip(schemas[schema], values)),
+            }
+
+    def iter_edges(self) -> Iterator[Dict[str, Any]]:
+        """Yield graph_json_v1 edge dicts grouped by source node, as networkx orders them"""
+        strings = self.strings.values
+        sources, targets, types, labels = self.edge_sources, self.edge_targets, self.edge_types, self.edge_labels
+        for edge in sorted(range(len(sources)), key=sources.__getitem__):
+            yield {
+                "source": f"node_{sources[edge]}",
+                "target": f"node_{targets[edge]}",
+                "type": strings[types[edge]],
+                "label": strings[labels[edge]],
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the graph_json_v1 dictionary"""
+        return {
+            "nodes": list(self.iter_nodes()),
+            "edges": list(self.iter_edges()),
+            "statistics": self.statistics(),
+            "format": "graph_json_v1",
+        }
+
+    def stream_dict(self) -> Dict[str, Any]:
+        """graph_json_v1 with nodes and edges as StreamedLists, for utils.streaming writers"""
+        return {
+            "nodes": StreamedList(self.iter_nodes, self.node_count),
+            "edges": StreamedList(self.iter_edges, self.edge_count),
+            "statistics": self.statistics(),
+            "format": "graph_json_v1",
+        }
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Build an equivalent networkx graph (for graphml / gexf export)"""
+        graph = nx.DiGraph()
+        for node in self.iter_nodes():
+            graph.add_node(node["id"], label=node["label"], type=node["type"], color=node["color"], **node["metadata"])
+        for edge in self.iter_edges():
+            graph.add_edge(edge["source"], edge["target"], type=edge["type"], label=edge["label"])
+        return graph
@@ -0,0 +1,39 @@
+"""
+Configuration Loader for IntelligentScan
+Reads config/rules.yaml once per process and exposes its sections
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import yaml
+
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent / "config" / "rules.yaml"
+
+
+@lru_cache(maxsize=None)
+def load_rules_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load the rules configuration
+
+    Args:
+        path: Path to a rules file; defaults to $INTELLIGENTSCAN_RULES or config/rules.yaml
+
+    Returns:
+        Parsed configuration (empty dict if the file is missing)
+    """
+    rules_path = Path(path or os.environ.get("INTELLIGENTSCAN_RULES", DEFAULT_RULES_PATH))
+
+    if not rules_path.exists():
+        return {}
+
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
+def get_settings() -> Dict[str, Any]:
+    """Get the general settings section of the rules configuration"""
+    return load_rules_config().get("settings", {})
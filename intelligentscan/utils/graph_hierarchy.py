@@ -0,0 +1,252 @@
+"""
+Hierarchical Knowledge Graph for IntelligentScan
+Aggregates scan findings into a directory tree whose nodes carry severity
+histograms, so a client can start from the repository root and expand only
+the directories it is interested in instead of rendering one node per
+finding.
+
+Nodes are integer ids (0 is the repository root); histograms live in one
+flat array with a row of len(SEVERITY_LEVELS) counters per node. Queries
+serialize only the nodes they return.
+"""
+
+import heapq
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Severity levels, worst first; histogram rows use this order
+SEVERITY_LEVELS = ("critical", "high", "medium", "low", "info")
+
+SEVERITY_COLORS = {
+    "critical": "red",
+    "high": "orange",
+    "medium": "yellow",
+    "low": "lightblue",
+    "info": "lightblue",
+}
+
+DEFAULT_CHILD_LIMIT = 50
+MAX_CHILD_LIMIT = 1000
+MAX_DEPTH = 5
+DEFAULT_TOP_FILES = 10
+MAX_TOP_FILES = 500
+
+
+def finding_severity(finding: Dict[str, Any]) -> str:
+    """
+    Severity level of a finding
+
+    AI-readiness areas have a confidence instead of a severity; they are
+    bucketed with the knowledge graph's red/yellow/green thresholds.
+    """
+    severity = finding.get("severity")
+    if severity is None and "confidence" in finding:
+        confidence = finding.get("confidence") or 0.0
+        return "high" if confidence < 0.5 else "medium" if confidence < 0.8 else "low"
+
+    severity = str(severity or "low").lower()
+    return severity if severity in SEVERITY_COLORS else "low"
+
+
+def normalize_path(path: str) -> str:
+    """Finding file path as a '/'-separated path relative to the tree root"""
+    return path.replace("\\", "/").strip("/")
+
+
+class HierarchyGraph:
+    """
+    Directory tree of a scan's findings with per-node severity histograms
+
+    Args:
+        repo_label: Label of the root node
+    """
+
+    def __init__(self, repo_label: str = "Repository"):
+        self.repo_label = repo_label
+        self.paths: List[str] = [""]
+        self.parents = array("i", [-1])
+        self.is_file = bytearray(1)
+        self.children: List[List[int]] = [[]]
+        self.histograms = array("I", bytes(4 * len(SEVERITY_LEVELS)))
+        self.ids: Dict[str, int] = {"": 0}
+        self.finding_count = 0
+
+    def _node(self, path: str, is_file: bool) -> int:
+        """Id of the node at path, creating it and its missing ancestors"""
+        node_id = self.ids.get(path)
+        if node_id is not None:
+            return node_id
+
+        parent_path, _, _ = path.rpartition("/")
+        parent = self._node(parent_path, False)
+
+        node_id = self.ids[path] = len(self.paths)
+        self.paths.append(path)
+        self.parents.append(parent)
+        self.is_file.append(is_file)
+        self.children.append([])
+        self.children[parent].append(node_id)
+        self.histograms.extend(bytes(4 * len(SEVERITY_LEVELS)))
+        return node_id
+
+    def add_findings(self, findings: Iterable[Dict[str, Any]]):
+        """
+        Count findings into the tree
+
+        Args:
+            findings: Findings with a "file" and a "severity" (or "confidence")
+        """
+        levels = {level: index for index, level in enumerate(SEVERITY_LEVELS)}
+        width = len(SEVERITY_LEVELS)
+        histograms, parents = self.histograms, self.parents
+        file_ids: Dict[str, int] = {}
+
+        for finding in findings:
+            file_path = finding.get("file") or "unknown"
+            node_id = file_ids.get(file_path)
+            if node_id is None:
+                node_id = file_ids[file_path] = self._node(normalize_path(file_path) or "unknown", True)
+
+            level = levels[finding_severity(finding)]
+            while node_id >= 0:
+                histograms[node_id * width + level] += 1
+                node_id = parents[node_id]
+            self.finding_count += 1
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the tree"""
+        size = sum(map(sys.getsizeof, self.paths)) + sys.getsizeof(self.ids) + sys.getsizeof(self.paths)
+        size += sum(map(sys.getsizeof, self.children))
+        return size + len(self.histograms) * self.histograms.itemsize + len(self.parents) * self.parents.itemsize
+
+    def add_hierarchy(self, other: "HierarchyGraph"):
+        """
+        Count the findings of another tree into this one
+
+        Used to combine the trees of several scans of one repository without
+        going back to their findings.
+        """
+        width = len(SEVERITY_LEVELS)
+        histograms, parents = self.histograms, self.parents
+        for other_id, path in enumerate(other.paths):
+            if not other.is_file[other_id]:
+                continue
+            row = other.histograms[other_id * width:(other_id + 1) * width]
+            node_id = self._node(path, True)
+            while node_id >= 0:
+                for level, count in enumerate(row):
+                    histograms[node_id * width + level] += count
+                node_id = parents[node_id]
+        self.finding_count += other.finding_count
+
+    def histogram(self, node_id: int) -> Tuple[int, ...]:
+        """Finding counts of a node by severity level, worst first"""
+        width = len(SEVERITY_LEVELS)
+        return tuple(self.histograms[node_id * width:(node_id + 1) * width])
+
+    def _hottest(self, node_ids: Iterable[int], limit: int) -> List[int]:
+        """The limit nodes with the most critical findings, then high, ...; ties by path"""
+        ordered = sorted(node_ids, key=self.paths.__getitem__)
+        return heapq.nlargest(limit, ordered, key=self.histogram)
+
+    def _summary(self, node_id: int) -> Dict[str, Any]:
+        """Serializable summary of one node (without children)"""
+        histogram = self.histogram(node_id)
+        worst = next((level for level, count in zip(SEVERITY_LEVELS, histogram) if count), None)
+        summary = {
+            "path": self.paths[node_id],
+            "label": self.paths[node_id].rpartition("/")[2] or self.repo_label,
+            "type": "file" if self.is_file[node_id] else "directory",
+            "color": SEVERITY_COLORS[worst] if worst else "green",
+            "findings": sum(histogram),
+            "severity": dict(zip(SEVERITY_LEVELS, histogram)),
+        }
+        if not self.is_file[node_id]:
+            summary["child_count"] = len(self.children[node_id])
+        return summary
+
+    def _subtree(self, node_id: int, depth: int, limit: int) -> Dict[str, Any]:
+        """Summary of a node with its hottest children, depth levels down"""
+        summary = self._summary(node_id)
+        children = self.children[node_id]
+        if depth > 0 and children:
+            shown = self._hottest(children, limit)
+            summary["children"] = [self._subtree(child, depth - 1, limit) for child in shown]
+            summary["truncated"] = len(children) - len(shown)
+        return summary
+
+    def expand(self, path: str = "", depth: int = 1, limit: int = DEFAULT_CHILD_LIMIT) -> Dict[str, Any]:
+        """
+        A node and its descendants down to depth levels, hottest children first
+
+        Args:
+            path: Directory or file path ("" for the repository root)
+            depth: Levels of children to include (0 for the node alone)
+            limit: Maximum children listed per node; the rest are counted in
+                   "truncated"
+
+        Returns:
+            Nested node summaries
+
+        Raises:
+            ValueError: If path is not in the tree
+        """
+        node_id = self.ids.get(normalize_path(path))
+        if node_id is None:
+            raise ValueError(f"Path has no findings in this scan: {path}")
+        depth = max(0, min(depth, MAX_DEPTH))
+        limit = max(1, min(limit, MAX_CHILD_LIMIT))
+        return self._subtree(node_id, depth, limit)
+
+    def hottest_files(self, top: int = DEFAULT_TOP_FILES, under: str = "") -> List[Dict[str, Any]]:
+        """
+        Files with the worst findings
+
+        Args:
+            top: Number of files
+            under: Only consider files below this directory
+
+        Returns:
+            File summaries, hottest first
+
+        Raises:
+            ValueError: If under is not in the tree
+        """
+        under = normalize_path(under)
+        if under not in self.ids:
+            raise ValueError(f"Path has no findings in this scan: {under}")
+        prefix = under + "/" if under else ""
+        top = max(1, min(top, MAX_TOP_FILES))
+
+        files = (
+            node_id for node_id in range(len(self.paths))
+            if self.is_file[node_id] and (self.paths[node_id] == under or self.paths[node_id].startswith(prefix))
+        )
+        return [self._summary(node_id) for node_id in self._hottest(files, top)]
+
+    @property
+    def node_count(self) -> int:
+        return len(self.paths)
+
+    @property
+    def file_count(self) -> int:
+        return sum(self.is_file)
+
+
+def build_hierarchy(finding_lists: Iterable[List[Dict[str, Any]]], repo_label: Optional[str] = None) -> HierarchyGraph:
+    """
+    Build the directory tree of one or more findings lists
+
+    Args:
+        finding_lists: Stored findings lists of a scan session
+        repo_label: Label of the root node
+
+    Returns:
+        HierarchyGraph with every finding counted
+    """
+    graph = HierarchyGraph(repo_label or "Repository")
+    for findings in finding_lists:
+        graph.add_findings(findings)
+    return graph
@@ -5,10 +5,25 @@ Uses red/green color coding for low/high confidence areas
 """
 
 import networkx as nx
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 import json
 
+from intelligentscan.utils.compact_graph import CompactGraph, SHARED_LAYER
+from intelligentscan.utils.streaming import write_json
+
+
+# Graph layer of each scan type's nodes in a merged graph
+SCAN_LAYERS = {
+    "vulnerability": 1,
+    "arb_compliance": 2,
+    "ai_readiness": 3,
+}
+
+# File node colors from least to most severe; a file shared by several scans
+# takes the most severe color any of them gave it
+FILE_COLOR_RANK = {"green": 0, "lightblue": 1, "yellow": 2, "orange": 3, "red": 4}
+
 
 class KnowledgeGraphBuilder:
     """
@@ -16,11 +31,38 @@ class KnowledgeGraphBuilder:
     Nodes: Files, Modules, Functions, Classes, Rules, Violations
     Edges: Dependencies, Violations, Relationships
     Colors: Red (issues), Green (clean), Yellow (warnings)
+
+    Nodes and edges live in a CompactGraph (integer ids, array columns);
+    graph_json_v1 output still names them "node_{id}".
+
+    build_from_scan_results builds the graph of one scan. merge_scan_results
+    adds scans of different types to one graph instead: each scan's nodes go
+    in its own layer under a shared repository root, and a file gets one node
+    however many scans report it.
     """
 
     def __init__(self):
-        self.graph = nx.DiGraph()  # Directed graph
-        self.node_counter = 0
+        self._reset()
+
+    def _reset(self):
+        """Start an empty graph"""
+        self.graph = CompactGraph()
+        self.layer = SHARED_LAYER  # layer of the scan being added
+        self.repository_root: Optional[int] = None  # set once a scan is merged
+        self.merged_scans: Dict[str, str] = {}  # scan type -> label of the merged scan
+        self.file_nodes: Dict[str, int] = {}
+        self.file_layers: Dict[int, Dict[int, Tuple[str, Dict[str, Any]]]] = {}
+
+    @staticmethod
+    def detect_scan_type(scan_results: Dict[str, Any]) -> Optional[str]:
+        """Scan type of a results dict, from the keys present"""
+        if "ai_readiness_score" in scan_results:
+            return "ai_readiness"
+        elif "vulnerabilities_found" in scan_results:
+            return "vulnerability"
+        elif "violations_found" in scan_results:
+            return "arb_compliance"
+        return None
 
     def build_from_scan_results(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,20 +74,80 @@ class KnowledgeGraphBuilder:
         Returns:
             Graph representation as JSON-serializable dict
         """
-        self.graph.clear()
-        self.node_counter = 0
+        self._reset()
 
         # Detect scan type and build accordingly
-        if "ai_readiness_score" in scan_results:
-            return self._build_ai_readiness_graph(scan_results)
-        elif "vulnerabilities_found" in scan_results:
-            return self._build_vulnerability_graph(scan_results)
-        elif "violations_found" in scan_results:
-            return self._build_arb_graph(scan_results)
-        else:
+        scan_type = self.detect_scan_type(scan_results)
+        if scan_type is None:
             return {"error": "Unknown scan result type"}
 
-    def _build_ai_readiness_graph(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
+        self._build_scan(scan_type, scan_results)
+        return self._graph_to_dict()
+
+    def merge_scan_results(self, scan_type: str, scan_results: Dict[str, Any], label: str = ""):
+        """
+        Add one scan to the merged graph, replacing an earlier scan of the same type
+
+        Only the new scan's nodes are built; file nodes already in the graph
+        are reused. Replacing a scan type removes its previous layer first.
+
+        Args:
+            scan_type: "vulnerability", "arb_compliance" or "ai_readiness"
+            scan_results: Results of that scan
+            label: Label of the edge from the repository root, e.g. the scan ID
+
+        Raises:
+            ValueError: If scan_type is unknown
+        """
+        if scan_type not in SCAN_LAYERS:
+            raise ValueError(f"Unknown scan type: {scan_type}")
+
+        if self.repository_root is None:
+            self._reset()
+            self.repository_root = self.graph.add_node("Repository", "repository", "blue", {})
+        elif scan_type in self.merged_scans:
+            self._remove_scan(scan_type)
+
+        scan_root = self._build_scan(scan_type, scan_results)
+        self.layer = SHARED_LAYER
+        self._add_edge(self.repository_root, scan_root, edge_type="contains", label=label)
+        self.merged_scans[scan_type] = label
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The current graph as graph_json_v1"""
+        return self._graph_to_dict()
+
+    def _build_scan(self, scan_type: str, scan_results: Dict[str, Any]) -> int:
+        """Add one scan's nodes in its layer and return its root node"""
+        self.layer = SCAN_LAYERS[scan_type]
+        builder = {
+            "ai_readiness": self._build_ai_readiness_graph,
+            "vulnerability": self._build_vulnerability_graph,
+            "arb_compliance": self._build_arb_graph,
+        }[scan_type]
+        return builder(scan_results)
+
+    def _remove_scan(self, scan_type: str):
+        """Remove the layer of a merged scan, and file nodes only it used"""
+        layer = SCAN_LAYERS[scan_type]
+        orphans = []
+        for node_id, layers in self.file_layers.items():
+            if layers.pop(layer, None) is None:
+                continue
+            if layers:
+                self._update_file_node(node_id)
+            else:
+                orphans.append(node_id)
+
+        renumber = self.graph.remove_layer(layer, orphans)
+        self.file_nodes = {
+            path: renumber[node_id] for path, node_id in self.file_nodes.items() if renumber[node_id] >= 0
+        }
+        self.file_layers = {renumber[node_id]: layers for node_id, layers in self.file_layers.items() if layers}
+        self.repository_root = renumber[self.repository_root]
+        del self.merged_scans[scan_type]
+
+    def _build_ai_readiness_graph(self, scan_results: Dict[str, Any]) -> int:
         """Build graph for AI-readiness scan"""
 
         # Add root node
@@ -72,16 +174,10 @@ class KnowledgeGraphBuilder:
                 color = "red"
 
             # Add file node
-            file_id = self._add_node(
-                label=self._shorten_path(file_path),
-                node_type="file",
-                color=color,
-                metadata={
-                    "full_path": file_path,
-                    "confidence": confidence,
-                    "issues": area.get("issues", [])
-                }
-            )
+            file_id = self._file_node(file_path, color, {
+                "confidence": confidence,
+                "issues": area.get("issues", [])
+            })
 
             # Connect to root
             self._add_edge(root_id, file_id, edge_type="contains", label="")
@@ -97,9 +193,9 @@ class KnowledgeGraphBuilder:
 
                 self._add_edge(file_id, issue_id, edge_type="has_issue", label=str(issue.get("line", "")))
 
-        return self._graph_to_dict()
+        return root_id
 
-    def _build_vulnerability_graph(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_vulnerability_graph(self, scan_results: Dict[str, Any]) -> int:
         """Build graph for vulnerability scan"""
 
         # Add root node
@@ -130,15 +226,7 @@ class KnowledgeGraphBuilder:
             else:
                 color = "yellow"
 
-            file_id = self._add_node(
-                label=self._shorten_path(file_path),
-                node_type="file",
-                color=color,
-                metadata={
-                    "full_path": file_path,
-                    "vulnerability_count": len(vulns)
-                }
-            )
+            file_id = self._file_node(file_path, color, {"vulnerability_count": len(vulns)})
 
             self._add_edge(root_id, file_id, edge_type="contains", label=f"{len(vulns)} issues")
 
@@ -163,9 +251,9 @@ class KnowledgeGraphBuilder:
                     label=f"line {vuln.get('line', '?')}"
                 )
 
-        return self._graph_to_dict()
+        return root_id
 
-    def _build_arb_graph(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_arb_graph(self, scan_results: Dict[str, Any]) -> int:
         """Build graph for ARB compliance scan"""
 
         # Add root node
@@ -182,6 +270,13 @@ class KnowledgeGraphBuilder:
         # Group violations by category
         violations_by_category = scan_results.get("violations_by_category", {})
 
+        # A file has one node for all categories, so count its violations across them
+        violations_per_file: Dict[str, int] = {}
+        for violations in violations_by_category.values():
+            for violation in violations:
+                file_path = violation.get("file", "unknown")
+                violations_per_file[file_path] = violations_per_file.get(file_path, 0) + 1
+
         for category, violations in violations_by_category.items():
             if not violations:
                 continue
@@ -206,17 +301,11 @@ class KnowledgeGraphBuilder:
 
             # Add file nodes
             for file_path, file_violations in violations_by_file.items():
-                file_id = self._add_node(
-                    label=self._shorten_path(file_path),
-                    node_type="file",
-                    color="red",
-                    metadata={
-                        "full_path": file_path,
-                        "violation_count": len(file_violations)
-                    }
-                )
+                file_id = self._file_node(file_path, "red", {"violation_count": violations_per_file[file_path]})
 
-                self._add_edge(category_id, file_id, edge_type="violates_in", label="")
+                self._add_edge(
+                    category_id, file_id, edge_type="violates_in", label=f"{len(file_violations)} violations"
+                )
 
                 # Add rule violation nodes
                 for violation in file_violations:
@@ -238,64 +327,57 @@ class KnowledgeGraphBuilder:
                         label=f"line {violation.get('line', '?')}"
                     )
 
-        return self._graph_to_dict()
+        return root_id
 
-    def _add_node(self, label: str, node_type: str, color: str, metadata: Dict[str, Any]) -> str:
-        """Add a node to the graph"""
-        node_id = f"node_{self.node_counter}"
-        self.node_counter += 1
-
-        self.graph.add_node(
-            node_id,
-            label=label,
-            type=node_type,
-            color=color,
-            **metadata
-        )
+    def _add_node(self, label: str, node_type: str, color: str, metadata: Dict[str, Any]) -> int:
+        """Add a node to the graph, in the layer of the scan being added"""
+        return self.graph.add_node(label, node_type, color, metadata, self.layer)
 
-        return node_id
+    def _file_node(self, file_path: str, color: str, metadata: Dict[str, Any]) -> int:
+        """
+        Node of a file, shared by every scan that reports it
 
-    def _add_edge(self, source: str, target: str, edge_type: str, label: str):
-        """Add an edge to the graph"""
-        self.graph.add_edge(source, target, type=edge_type, label=label)
+        Args:
+            file_path: Path of the file
+            color: Color this scan gives the file
+            metadata: This scan's attributes of the file
 
-    def _graph_to_dict(self) -> Dict[str, Any]:
-        """Convert NetworkX graph to JSON-serializable dictionary"""
-
-        nodes = []
-        for node_id, node_data in self.graph.nodes(data=True):
-            nodes.append({
-                "id": node_id,
-                "label": node_data.get("label", ""),
-                "type": node_data.get("type", ""),
-                "color": node_data.get("color", "gray"),
-                "metadata": {k: v for k, v in node_data.items() if k not in ["label", "type", "color"]}
-            })
+        Returns:
+            Node id of the file
+        """
+        node_id = self.file_nodes.get(file_path)
+        if node_id is None:
+            node_id = self.graph.add_node(
+                self._shorten_path(file_path), "file", color, {"full_path": file_path, **metadata}, SHARED_LAYER
+            )
+            self.file_nodes[file_path] = node_id
+            self.file_layers[node_id] = {self.layer: (color, metadata)}
+            return node_id
+
+        layers = self.file_layers[node_id]
+        if self.layer in layers:
+            previous_color, _ = layers[self.layer]
+            color = max(previous_color, color, key=lambda c: FILE_COLOR_RANK.get(c, 0))
+        layers[self.layer] = (color, metadata)
+        self._update_file_node(node_id)
+        return node_id
 
-        edges = []
-        for source, target, edge_data in self.graph.edges(data=True):
-            edges.append({
-                "source": source,
-                "target": target,
-                "type": edge_data.get("type", ""),
-                "label": edge_data.get("label", "")
-            })
+    def _update_file_node(self, node_id: int):
+        """Recompute a shared file node from the scans that report it"""
+        layers = self.file_layers[node_id]
+        colors = [color for color, _ in layers.values()]
+        metadata = {"full_path": self.graph.node_metadata(node_id)["full_path"]}
+        for _, (_, layer_metadata) in sorted(layers.items()):
+            metadata.update(layer_metadata)
+        self.graph.set_node(node_id, max(colors, key=lambda c: FILE_COLOR_RANK.get(c, 0)), metadata)
 
-        # Calculate graph statistics
-        stats = {
-            "node_count": len(nodes),
-            "edge_count": len(edges),
-            "red_nodes": len([n for n in nodes if n["color"] == "red"]),
-            "green_nodes": len([n for n in nodes if n["color"] == "green"]),
-            "yellow_nodes": len([n for n in nodes if n["color"] == "yellow"])
-        }
+    def _add_edge(self, source: int, target: int, edge_type: str, label: str):
+        """Add an edge to the graph"""
+        self.graph.add_edge(source, target, edge_type, label)
 
-        return {
-            "nodes": nodes,
-            "edges": edges,
-            "statistics": stats,
-            "format": "graph_json_v1"
-        }
+    def _graph_to_dict(self) -> Dict[str, Any]:
+        """Convert graph to JSON-serializable dictionary (graph_json_v1)"""
+        return self.graph.to_dict()
 
     def _shorten_path(self, path: str, max_length: int = 30) -> str:
         """Shorten file path for display"""
@@ -324,27 +406,36 @@ class KnowledgeGraphBuilder:
         }
         return color_map.get(severity.lower(), "gray")
 
-    def export_to_file(self, output_path: str, format: str = "json"):
+    def export_to_file(self, output_path: str, format: str = "json", overwrite: bool = True):
         """
         Export graph to file
 
         Args:
             output_path: Path to save file
             format: Format (json, graphml, gexf)
-        """
-        if format == "json":
-            graph_dict = self._graph_to_dict()
-            with open(output_path, 'w') as f:
-                json.dump(graph_dict, f, indent=2)
-
-        elif format == "graphml":
-            nx.write_graphml(self.graph, output_path)
-
-        elif format == "gexf":
-            nx.write_gexf(self.graph, output_path)
+            overwrite: Replace the file if it already exists; if False it is
+                       created exclusively
 
-        else:
+        Raises:
+            ValueError: If the format is not supported
+            FileExistsError: If the file exists and overwrite is False
+        """
+        if format not in ("json", "graphml", "gexf"):
             raise ValueError(f"Unsupported format: {format}")
+        mode = "w" if overwrite else "x"
+
+        if format == "json":
+            # Nodes and edges are encoded as they are written, never held as one dict
+            with open(output_path, mode, encoding='utf-8') as f:
+                write_json(self.graph.stream_dict(), f)
+            return
+
+        graph = self.graph.to_networkx()
+        with open(output_path, mode + "b") as f:
+            if format == "graphml":
+                nx.write_graphml(graph, f)
+            else:
+                nx.write_gexf(graph, f)
 
 
 # Example usage
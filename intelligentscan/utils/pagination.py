@@ -0,0 +1,196 @@
+"""
+Result Pagination for IntelligentScan
+Serves the findings of a stored scan one page at a time, so neither the
+server nor the MCP client has to hold a response with every finding.
+
+A cursor is opaque to clients: it encodes the scan type, the position in the
+stored findings list where the next page starts and a hash of the filters it
+was issued for, so a cursor cannot be replayed with different filters.
+"""
+
+import base64
+import fnmatch
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Stored findings list per scan type
+FINDING_LISTS = {
+    "vulnerability": "vulnerabilities_found",
+    "arb_compliance": "violations_found",
+    "ai_readiness": "low_confidence_areas",
+}
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# A page ends early once its findings would encode to more than this (JSON),
+# keeping every response within a 256 KB budget however large findings are
+MAX_PAGE_BYTES = 192 * 1024
+
+# Finding fields that hold source text, dropped when snippets are not wanted
+SNIPPET_FIELDS = ("code_snippet", "matched_text")
+
+# Supported filters and the finding fields each one matches
+FILTER_FIELDS = {
+    "severity": ("severity",),
+    "file": ("file",),
+    "type": ("type", "rule_id", "violation_type"),
+    "category": ("category",),
+}
+
+
+def filters_hash(filters: Optional[Dict[str, Any]]) -> str:
+    """Short stable hash of a filters dict"""
+    payload = json.dumps(filters or {}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(scan_type: str, position: int, filters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build an opaque cursor for the page starting at position
+
+    Args:
+        scan_type: Scan type the cursor pages through
+        position: Index in the stored findings list where the next page starts
+        filters: Filters the cursor was issued for
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{scan_type}:{position}:{filters_hash(filters)}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, scan_type: str, filters: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Read the position out of a cursor issued by encode_cursor
+
+    Args:
+        cursor: Cursor string
+        scan_type: Scan type being paged through
+        filters: Filters of this request, which must match the cursor's
+
+    Returns:
+        Index in the stored findings list where the page starts
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another
+                     scan type or other filters
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        cursor_type, position, cursor_filters = raw.rsplit(":", 2)
+        position = int(position)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    if cursor_type != scan_type or position < 0:
+        raise ValueError(f"Cursor does not belong to a {scan_type} scan")
+    if cursor_filters != filters_hash(filters):
+        raise ValueError("Cursor was issued for different filters")
+    return position
+
+
+def _matches(finding: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Check one finding against every filter (values within a filter are alternatives)"""
+    for key, wanted in filters.items():
+        values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+        fields = [finding.get(field) for field in FILTER_FIELDS[key] if finding.get(field) is not None]
+
+        if key == "file":
+            # Glob patterns match the whole path; plain values match a path prefix
+            if not any(
+                fnmatch.fnmatchcase(path, value) if any(c in value for c in "*?[") else path.startswith(value)
+                for path in fields for value in map(str, values)
+            ):
+                return False
+        elif not any(str(field).lower() == str(value).lower() for field in fields for value in values):
+            return False
+
+    return True
+
+
+def validate_filters(filters: Optional[Dict[str, Any]]):
+    """
+    Reject filters this module does not support
+
+    Raises:
+        ValueError: If a filter key is unknown
+    """
+    unknown = sorted(set(filters or {}) - set(FILTER_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown filters: {unknown}. Supported filters: {list(FILTER_FIELDS)}")
+
+
+def paginate(
+    findings: List[Dict[str, Any]],
+    position: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    filters: Optional[Dict[str, Any]] = None,
+    include_snippets: bool = True
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Take one page of findings
+
+    Args:
+        findings: Stored findings of a scan
+        position: Index where the page starts
+        page_size: Maximum findings on the page (capped at MAX_PAGE_SIZE); the
+                   page also ends before MAX_PAGE_BYTES of encoded findings,
+                   but always holds at least one
+        filters: Only return findings matching these filters, e.g.
+                 {"severity": ["critical", "high"], "file": "src/"}
+        include_snippets: Keep code_snippet / matched_text in each finding
+
+    Returns:
+        (page of findings, position of the next page or None on the last page)
+    """
+    validate_filters(filters)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    page = []
+    page_bytes = 0
+    index = position
+    while index < len(findings) and len(page) < page_size:
+        finding = findings[index]
+        if filters and not _matches(finding, filters):
+            index += 1
+            continue
+        if not include_snippets:
+            finding = {key: value for key, value in finding.items() if key not in SNIPPET_FIELDS}
+
+        size = len(json.dumps(finding, default=str))
+        if page and page_bytes + size > MAX_PAGE_BYTES:
+            break
+        page_bytes += size
+        page.append(finding)
+        index += 1
+
+    # Skip trailing non-matches so the last page does not hand out an empty cursor
+    if filters:
+        while index < len(findings) and not _matches(findings[index], filters):
+            index += 1
+
+    return page, (index if index < len(findings) else None)
+
+
+def first_page(
+    scan_type: str,
+    findings: List[Dict[str, Any]],
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    First page of a scan's findings, for a scan tool response
+
+    Args:
+        scan_type: Scan type, encoded in the cursor
+        findings: Stored findings of the scan
+        page_size: Findings on the first page
+
+    Returns:
+        (page of findings, cursor for get_findings or None if every finding fits)
+    """
+    page, next_position = paginate(findings, 0, page_size)
+    return page, (None if next_position is None else encode_cursor(scan_type, next_position))
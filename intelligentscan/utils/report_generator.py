@@ -1,10 +1,65 @@
 """
 Report Generator for IntelligentScan
 Generates comprehensive reports in various formats
+
+Markdown and HTML reports are produced piece by piece from the templates in
+report_templates, so write() streams them to a file in bounded chunks. The
+HTML report embeds the findings as compact JSON rows and shows one page of
+them at a time, so browsers open reports with hundreds of thousands of
+findings.
+
+Reports written to files go to the reports directory (settings.reports_dir,
+by default "reports" in the cache directory); paths resolving outside it are
+refused, so MCP clients cannot write anywhere else on the server.
 """
 
-from typing import Dict, Any
-import json
+import os
+from html import escape
+from itertools import compress, islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from intelligentscan.utils import report_templates as templates
+from intelligentscan.utils.config_loader import get_settings
+from intelligentscan.utils.graph_hierarchy import (
+    SEVERITY_LEVELS, HierarchyGraph, build_hierarchy, finding_severity
+)
+from intelligentscan.utils.pagination import FINDING_LISTS
+from intelligentscan.utils.scan_cache import DEFAULT_CACHE_DIR
+from intelligentscan.utils.streaming import (
+    BINARY_FORMATS, chunked, dumps_json, iter_json, write_binary, write_json
+)
+
+
+# Directory in the cache directory that reports are written to by default
+REPORTS_DIR_NAME = "reports"
+
+# Findings per page of an HTML findings table (also rendered without JavaScript)
+HTML_PAGE_SIZE = 100
+
+# Directory tree shown in reports: levels below the root, children per directory
+HTML_TREE_DEPTH = 3
+HTML_TREE_CHILD_LIMIT = 20
+MARKDOWN_TREE_DEPTH = 2
+MARKDOWN_TREE_CHILD_LIMIT = 10
+
+HOTSPOT_COUNT = 10
+
+# Section title and summary metrics (label, result key) per scan type
+SCAN_SECTIONS = {
+    "vulnerability": ("Vulnerabilities", ()),
+    "arb_compliance": ("ARB Compliance", (
+        ("Compliance score", "compliance_score"),
+        ("Files with violations", "files_with_violations"),
+    )),
+    "ai_readiness": ("AI Readiness", (
+        ("AI-readiness score", "ai_readiness_score"),
+        ("Files analyzed", "total_files_analyzed"),
+    )),
+}
+
+# Byte translation tables turning a ranks bytearray into a 0/1 mask of one rank
+_RANK_MASKS = [bytes(int(rank == level) for rank in range(256)) for level in range(len(SEVERITY_LEVELS))]
 
 
 class ReportGenerator:
@@ -22,7 +77,7 @@ class ReportGenerator:
             Formatted report string
         """
         if output_format == "json":
-            return json.dumps(session.to_dict(), indent=2)
+            return dumps_json(session.to_dict())
 
         elif output_format == "markdown":
             return self._generate_markdown(session)
@@ -33,12 +88,277 @@ class ReportGenerator:
         else:
             return f"Unsupported format: {output_format}"
 
+    def write(self, session: Any, output_format: str, output_path: str, overwrite: bool = False) -> Tuple[Path, int]:
+        """
+        Stream a report to a file in the reports directory, without holding the
+        whole report in memory
+
+        Args:
+            session: Scan session object
+            output_format: Output format (json, msgpack, html, markdown)
+            output_path: File to write, relative to the reports directory (or
+                         an absolute path inside it)
+            overwrite: Replace the file if it already exists
+
+        Returns:
+            (resolved path of the written file, its size in bytes)
+
+        Raises:
+            ValueError: If the format is unsupported, msgpack is not installed,
+                        the path is outside the reports directory, or the file
+                        exists and overwrite is False
+        """
+        if output_format not in BINARY_FORMATS and output_format not in ("json", "markdown", "html"):
+            raise ValueError(f"Unsupported format: {output_format}")
+        path = resolve_report_path(output_path, overwrite)
+
+        # "x" creates the file exclusively, so an existing file (or symlink) is never followed
+        mode = "w" if overwrite else "x"
+        if output_format in BINARY_FORMATS:
+            with open(path, mode + "b") as f:
+                write_binary(session.to_dict(), f, output_format)
+
+        elif output_format == "json":
+            with open(path, mode, encoding="utf-8") as f:
+                write_json(session.to_dict(), f)
+
+        else:
+            pieces = self._markdown_pieces(session) if output_format == "markdown" else self._html_pieces(session)
+            with open(path, mode, encoding="utf-8") as f:
+                for chunk in chunked(pieces):
+                    f.write(chunk)
+
+        return path, os.path.getsize(path)
+
     def _generate_markdown(self, session: Any) -> str:
         """Generate Markdown report"""
-        # TODO: Implement full markdown report
-        return f"# IntelligentScan Report\n\nScan ID: {session.scan_id}\n"
+        return "".join(self._markdown_pieces(session))
 
     def _generate_html(self, session: Any) -> str:
-        """Generate HTML report"""
-        # TODO: Implement full HTML report with interactive graph
-        return f"<html><body><h1>IntelligentScan Report</h1><p>Scan ID: {session.scan_id}</p></body></html>"
+        """Generate HTML report with paged findings tables and an expandable directory graph"""
+        return "".join(self._html_pieces(session))
+
+    def _prepare(self, session: Any) -> Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any], list, bytearray]], HierarchyGraph]:
+        """
+        Collect what both report formats render
+
+        Returns:
+            The session dict; (scan type, results, findings, severity rank of
+            each finding) per scan with a findings list; the directory tree of
+            all findings
+        """
+        data = session.to_dict()
+        levels = {level: rank for rank, level in enumerate(SEVERITY_LEVELS)}
+        scans = []
+        for scan_type, results in (data.get("results") or {}).items():
+            if scan_type not in FINDING_LISTS or not isinstance(results, dict):
+                continue
+            findings = results.get(FINDING_LISTS[scan_type]) or []
+            ranks = bytearray(levels[finding_severity(finding)] for finding in findings)
+            scans.append((scan_type, results, findings, ranks))
+
+        repo_label = os.path.basename(str(data.get("repo_path", "")).rstrip("/\\"))
+        hierarchy = build_hierarchy((findings for _, _, findings, _ in scans), repo_label)
+        return data, scans, hierarchy
+
+    def _markdown_pieces(self, session: Any) -> Iterator[str]:
+        """Markdown report, piece by piece"""
+        data, scans, hierarchy = self._prepare(session)
+        yield templates.MARKDOWN_HEADER.substitute(_header_fields(data, _markdown_cell))
+
+        yield templates.MARKDOWN_BREAKDOWN_HEADER
+        total = hierarchy.finding_count
+        for level, count in zip(SEVERITY_LEVELS, hierarchy.histogram(0)):
+            yield templates.MARKDOWN_BREAKDOWN_ROW(level, count, 100.0 * count / total if total else 0.0)
+        yield f"| **Total** | **{total}** | |\n\n"
+
+        hotspots = hierarchy.hottest_files(HOTSPOT_COUNT)
+        if hotspots:
+            yield templates.MARKDOWN_HOTSPOTS_HEADER
+            for hotspot in hotspots:
+                yield templates.MARKDOWN_HOTSPOT_ROW(
+                    _markdown_cell(hotspot["path"]), hotspot["findings"], *hotspot["severity"].values()
+                )
+            yield "\n"
+
+        for scan_type, results, findings, ranks in scans:
+            title, metrics = SCAN_SECTIONS[scan_type]
+            yield f"## {title}\n\n"
+            yield f"- **Findings:** {len(findings)}{_severity_counts(ranks)}\n"
+            for label, key in metrics:
+                if results.get(key) is not None:
+                    yield f"- **{label}:** {results[key]}\n"
+            yield "\n"
+            if findings:
+                yield templates.MARKDOWN_FINDINGS_HEADER
+                row = templates.MARKDOWN_FINDING_ROW
+                for severity, finding in _by_severity(findings, ranks):
+                    yield row(severity, *map(_markdown_cell, _finding_columns(finding)))
+                yield "\n"
+
+        yield "## Findings by Directory\n\n"
+        yield from _markdown_tree(hierarchy.expand("", MARKDOWN_TREE_DEPTH, MARKDOWN_TREE_CHILD_LIMIT), 0)
+
+    def _html_pieces(self, session: Any) -> Iterator[str]:
+        """HTML report, piece by piece"""
+        data, scans, hierarchy = self._prepare(session)
+        yield templates.HTML_HEADER.substitute(_header_fields(data, escape))
+
+        yield templates.HTML_BREAKDOWN_HEADER
+        total = hierarchy.finding_count
+        for level, count in zip(SEVERITY_LEVELS, hierarchy.histogram(0)):
+            share = 100.0 * count / total if total else 0.0
+            yield templates.HTML_BREAKDOWN_ROW(level, count, share, 2 * share)
+        yield "</table>\n"
+
+        for scan_type, results, findings, ranks in scans:
+            title, metrics = SCAN_SECTIONS[scan_type]
+            summary = f"<p><strong>Findings:</strong> {len(findings)}{_severity_counts(ranks)}" + "".join(
+                f"<br><strong>{label}:</strong> {escape(str(results[key]))}"
+                for label, key in metrics if results.get(key) is not None
+            ) + "</p>"
+            options = "".join(
+                f'<option value="{level}">{level} ({ranks.count(rank)})</option>'
+                for rank, level in enumerate(SEVERITY_LEVELS) if rank in ranks
+            )
+            yield templates.HTML_SCAN_HEADER.substitute(title=title, metrics=summary, severity_options=options)
+
+            # First page as HTML for readers without JavaScript, then every row as JSON for the pager
+            row = templates.HTML_FINDING_ROW
+            for severity, finding in islice(_by_severity(findings, ranks), HTML_PAGE_SIZE):
+                yield row(severity, *map(escape, _finding_columns(finding)))
+            shown = min(len(findings), HTML_PAGE_SIZE)
+            note = f"Showing the first {shown} of {len(findings)} findings; enable JavaScript to page through all of them."
+            yield templates.HTML_SCAN_NOTE.substitute(note=note if shown < len(findings) else "")
+
+            rows = ([severity, *_finding_columns(finding)] for severity, finding in _by_severity(findings, ranks))
+            for chunk in iter_json(rows, indent=None):
+                # "<" only occurs inside JSON strings, where \u003c is equivalent and cannot end the script
+                yield chunk.replace("<", "\\u003c")
+            yield templates.HTML_SCAN_FOOTER
+
+        yield templates.HTML_TREE_HEADER
+        yield from _html_tree(hierarchy.expand("", HTML_TREE_DEPTH, HTML_TREE_CHILD_LIMIT), is_root=True)
+        yield templates.HTML_FOOTER.substitute(page_size=HTML_PAGE_SIZE)
+
+
+def reports_dir() -> Path:
+    """Directory reports are written to: settings.reports_dir, else "reports" in the cache directory"""
+    settings = get_settings()
+    if settings.get("reports_dir"):
+        return Path(settings["reports_dir"]).expanduser()
+    cache_dir = Path(settings.get("cache_dir") or os.environ.get("INTELLIGENTSCAN_CACHE_DIR", DEFAULT_CACHE_DIR))
+    return cache_dir / REPORTS_DIR_NAME
+
+
+def resolve_report_path(output_path: str, overwrite: bool = False) -> Path:
+    """
+    Resolve a report file path, confined to the reports directory
+
+    Args:
+        output_path: Path relative to the reports directory, or absolute
+        overwrite: Whether an existing file may be replaced
+
+    Returns:
+        Absolute path with symlinks resolved; its parent directory exists
+
+    Raises:
+        ValueError: If the path resolves outside the reports directory, or
+                    the file exists and overwrite is False
+    """
+    root = reports_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    root = root.resolve()
+
+    # Resolving follows ".." and symlinks, so neither can lead out of root
+    path = (root / output_path).resolve()
+    if root not in path.parents:
+        raise ValueError(f"output_path must be a file inside the reports directory {root}: {output_path}")
+    if path.exists() and not overwrite:
+        raise ValueError(f"Report file already exists (pass overwrite to replace it): {path}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _header_fields(data: Dict[str, Any], escape_text: Callable[[str], str]) -> Dict[str, str]:
+    """Report header values, escaped for the output format"""
+    fields = {key: escape_text(str(data.get(key, ""))) for key in ("scan_id", "repo_path", "status", "start_time")}
+    fields["duration"] = f"{data.get('duration_seconds') or 0:.1f}"
+    return fields
+
+
+def _by_severity(findings: list, ranks: bytearray) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(severity, finding) pairs, worst severity first, in scan order within a severity"""
+    for level, mask in zip(SEVERITY_LEVELS, _RANK_MASKS):
+        for finding in compress(findings, ranks.translate(mask)):
+            yield level, finding
+
+
+def _severity_counts(ranks: bytearray) -> str:
+    """' (3 critical, 10 high)' for the severities present, or ''"""
+    counts = ", ".join(
+        f"{ranks.count(rank)} {level}" for rank, level in enumerate(SEVERITY_LEVELS) if rank in ranks
+    )
+    return f" ({counts})" if counts else ""
+
+
+def _finding_columns(finding: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Type, file, line and description of a vulnerability, ARB violation or AI-readiness area"""
+    finding_type = finding.get("type") or finding.get("rule_id") or ""
+    description = finding.get("description") or finding.get("rule_title") or ""
+    if not finding_type and "confidence" in finding:
+        # AI-readiness low-confidence area
+        finding_type = "low_confidence"
+        issue_types = sorted({str(issue.get("type", "")) for issue in finding.get("issues") or []})
+        description = f"Confidence {finding.get('confidence') or 0.0:.2f}"
+        if issue_types:
+            description += ": " + ", ".join(issue_types)
+
+    line = finding.get("line")
+    return str(finding_type), str(finding.get("file") or ""), "" if line is None else str(line), str(description)
+
+
+def _markdown_cell(value: str) -> str:
+    """Text safe inside a Markdown table cell"""
+    return value.replace("|", "\\|").replace("\r", " ").replace("\n", " ").replace("<", "&lt;")
+
+
+def _tree_counts(node: Dict[str, Any]) -> Tuple[str, str]:
+    """Worst severity present ("none" without findings) and the counts text of a tree node"""
+    present = [(level, count) for level, count in node["severity"].items() if count]
+    counts = ", ".join(f"{count} {level}" for level, count in present)
+    return (present[0][0] if present else "none"), counts or "none"
+
+
+def _markdown_tree(node: Dict[str, Any], level: int) -> Iterator[str]:
+    """Nested list of a HierarchyGraph.expand() subtree"""
+    _, counts = _tree_counts(node)
+    indent = "  " * level
+    yield templates.MARKDOWN_TREE_ITEM(indent, _markdown_cell(node["label"]), node["findings"], counts)
+    for child in node.get("children", []):
+        yield from _markdown_tree(child, level + 1)
+    if node.get("truncated"):
+        yield f"{indent}  - *{node['truncated']} more*\n"
+
+
+def _html_tree(node: Dict[str, Any], is_root: bool = False) -> Iterator[str]:
+    """Expandable <details> tree of a HierarchyGraph.expand() subtree"""
+    worst, counts = _tree_counts(node)
+    label = escape(node["label"])
+    if node["type"] == "file":
+        yield templates.HTML_TREE_FILE(worst, label, node["findings"], counts)
+        return
+
+    yield "<details open>\n" if is_root else "<li><details>\n"
+    yield templates.HTML_TREE_SUMMARY(worst, label, node["findings"], counts)
+    yield "<ul>\n"
+    children = node.get("children")
+    if children is None and node.get("child_count"):
+        yield f'<li class="muted">{node["child_count"]} entries below this level</li>\n'
+    for child in children or []:
+        yield from _html_tree(child)
+    if node.get("truncated"):
+        yield f'<li class="muted">{node["truncated"]} more</li>\n'
+    yield "</ul>\n"
+    yield "</details>\n" if is_root else "</details></li>\n"
@@ -0,0 +1,211 @@
+"""
+Report Templates for IntelligentScan
+Page skeletons and row formats of the Markdown and HTML reports.
+
+Templates are built once, when the module is first imported: skeletons are
+string.Template objects and per-row formats are bound str.format methods,
+so rendering a row is a single C-level call.
+"""
+
+from string import Template
+
+
+# Markdown
+
+MARKDOWN_HEADER = Template("""\
+# IntelligentScan Report
+
+| | |
+|---|---|
+| Scan ID | `$scan_id` |
+| Repository | `$repo_path` |
+| Status | $status |
+| Started | $start_time |
+| Duration | $duration s |
+
+""")
+
+MARKDOWN_BREAKDOWN_HEADER = """\
+## Severity Breakdown
+
+| Severity | Findings | Share |
+|---|---:|---:|
+"""
+
+# severity, count, share
+MARKDOWN_BREAKDOWN_ROW = "| {} | {} | {:.1f}% |\n".format
+
+MARKDOWN_HOTSPOTS_HEADER = """\
+## Hotspots
+
+| File | Findings | Critical | High | Medium | Low | Info |
+|---|---:|---:|---:|---:|---:|---:|
+"""
+
+# path, findings, then one count per severity level
+MARKDOWN_HOTSPOT_ROW = "| `{}` | {} | {} | {} | {} | {} | {} |\n".format
+
+MARKDOWN_FINDINGS_HEADER = """\
+### Findings
+
+| Severity | Type | File | Line | Description |
+|---|---|---|---:|---|
+"""
+
+# severity, type, file, line, description
+MARKDOWN_FINDING_ROW = "| {} | {} | `{}` | {} | {} |\n".format
+
+# indent, label, findings, severity counts
+MARKDOWN_TREE_ITEM = "{}- **{}** ({} findings: {})\n".format
+
+
+# HTML
+
+HTML_HEADER = Template("""\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>IntelligentScan Report - $scan_id</title>
+<style>
+body { font-family: system-ui, sans-serif; margin: 2rem; color: #222; }
+table { border-collapse: collapse; margin: 0.5rem 0 1.5rem; }
+th, td { border: 1px solid #ddd; padding: 0.25rem 0.5rem; text-align: left; vertical-align: top; }
+th { background: #f4f4f4; }
+td.num { text-align: right; }
+.bar { display: inline-block; height: 0.8rem; }
+.sev-critical .bar, .dot.sev-critical { background: #c62828; }
+.sev-high .bar, .dot.sev-high { background: #ef6c00; }
+.sev-medium .bar, .dot.sev-medium { background: #f9a825; }
+.sev-low .bar, .dot.sev-low, .sev-info .bar, .dot.sev-info { background: #64b5f6; }
+.dot { display: inline-block; width: 0.7rem; height: 0.7rem; border-radius: 50%; margin-right: 0.3rem; background: #43a047; }
+.controls { margin: 0.5rem 0; }
+.findings table { width: 100%; }
+details { margin-left: 1.2rem; }
+details > ul { list-style: none; margin: 0; padding-left: 1.2rem; }
+summary { cursor: pointer; }
+.muted { color: #777; }
+</style>
+</head>
+<body>
+<h1>IntelligentScan Report</h1>
+<table>
+<tr><th>Scan ID</th><td>$scan_id</td></tr>
+<tr><th>Repository</th><td>$repo_path</td></tr>
+<tr><th>Status</th><td>$status</td></tr>
+<tr><th>Started</th><td>$start_time</td></tr>
+<tr><th>Duration</th><td>$duration s</td></tr>
+</table>
+""")
+
+HTML_BREAKDOWN_HEADER = """\
+<h2>Severity Breakdown</h2>
+<table>
+<tr><th>Severity</th><th>Findings</th><th>Share</th></tr>
+"""
+
+# severity, count, share, bar width
+HTML_BREAKDOWN_ROW = (
+    '<tr class="sev-{0}"><td>{0}</td><td class="num">{1}</td>'
+    '<td><span class="bar" style="width:{3:.0f}px"></span> {2:.1f}%</td></tr>\n'
+).format
+
+HTML_SCAN_HEADER = Template("""\
+<section class="findings">
+<h2>$title</h2>
+$metrics
+<div class="controls" hidden>
+<select aria-label="Severity"><option value="">All severities</option>$severity_options</select>
+<input type="search" placeholder="Filter by file or type" aria-label="Filter">
+<button class="prev" type="button">&lsaquo; Previous</button>
+<span class="page-status"></span>
+<button class="next" type="button">Next &rsaquo;</button>
+</div>
+<table>
+<thead><tr><th>Severity</th><th>Type</th><th>File</th><th>Line</th><th>Description</th></tr></thead>
+<tbody>
+""")
+
+# severity, type, file, line, description (already escaped)
+HTML_FINDING_ROW = '<tr class="sev-{0}"><td>{0}</td><td>{1}</td><td>{2}</td><td class="num">{3}</td><td>{4}</td></tr>\n'.format
+
+HTML_SCAN_NOTE = Template("""\
+</tbody>
+</table>
+<p class="muted noscript-note">$note</p>
+<script type="application/json" class="finding-data">""")
+
+HTML_SCAN_FOOTER = "</script>\n</section>\n"
+
+HTML_TREE_HEADER = """\
+<section>
+<h2>Findings by Directory</h2>
+<p class="muted">Directories and files with the most severe findings first; click to expand.</p>
+"""
+
+# severity class, label, findings, severity counts
+HTML_TREE_SUMMARY = '<summary><span class="dot sev-{}"></span>{} <span class="muted">{} findings: {}</span></summary>\n'.format
+
+# severity class, label, findings, severity counts
+HTML_TREE_FILE = '<li><span class="dot sev-{}"></span>{} <span class="muted">{} findings: {}</span></li>\n'.format
+
+# Pages the embedded finding rows of each findings section; only one page of
+# rows is in the document at a time
+HTML_FOOTER = Template("""\
+</section>
+<script>
+(function () {
+  var pageSize = $page_size;
+  document.querySelectorAll("section.findings").forEach(function (section) {
+    var rows = JSON.parse(section.querySelector("script.finding-data").textContent);
+    var body = section.querySelector("tbody");
+    var controls = section.querySelector(".controls");
+    var severity = controls.querySelector("select");
+    var search = controls.querySelector("input");
+    var status = controls.querySelector(".page-status");
+    var shown = rows;
+    var page = 0;
+
+    function render() {
+      var pages = Math.max(1, Math.ceil(shown.length / pageSize));
+      page = Math.min(Math.max(page, 0), pages - 1);
+      var fragment = document.createDocumentFragment();
+      shown.slice(page * pageSize, (page + 1) * pageSize).forEach(function (row) {
+        var tr = document.createElement("tr");
+        tr.className = "sev-" + row[0];
+        row.forEach(function (value, column) {
+          var td = document.createElement("td");
+          td.textContent = value;
+          if (column === 3) td.className = "num";
+          tr.appendChild(td);
+        });
+        fragment.appendChild(tr);
+      });
+      body.replaceChildren(fragment);
+      status.textContent = "Page " + (page + 1) + " of " + pages + " (" + shown.length + " findings)";
+    }
+
+    function filter() {
+      var level = severity.value;
+      var text = search.value.toLowerCase();
+      shown = rows.filter(function (row) {
+        return (!level || row[0] === level) &&
+          (!text || row[1].toLowerCase().indexOf(text) >= 0 || row[2].toLowerCase().indexOf(text) >= 0);
+      });
+      page = 0;
+      render();
+    }
+
+    severity.addEventListener("change", filter);
+    search.addEventListener("input", filter);
+    controls.querySelector(".prev").addEventListener("click", function () { page -= 1; render(); });
+    controls.querySelector(".next").addEventListener("click", function () { page += 1; render(); });
+    section.querySelector(".noscript-note").hidden = true;
+    controls.hidden = false;
+    render();
+  });
+})();
+</script>
+</body>
+</html>
+""")
@@ -0,0 +1,273 @@
+"""
+Scan Result Cache for IntelligentScan
+Persists per-file scan findings on disk, keyed by (content hash, ruleset hash,
+scanner version), so rescanning an unchanged repository skips the analysis.
+
+A second table remembers each path's (size, mtime) -> content hash, so files
+whose stat signature has not changed are not even read on a rescan. Its rows
+expire and count toward the size bound like the results.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from intelligentscan.utils.config_loader import get_settings
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "intelligentscan"
+CACHE_FILE_NAME = "scan_cache.sqlite3"
+
+# Pending writes are committed in batches of this size
+FLUSH_EVERY = 500
+
+# A remembered hash's last access is refreshed at most this often
+HASH_TOUCH_SECONDS = 3600
+
+# Estimated bytes of a file_hashes row besides its path, for the size bound
+HASH_ROW_BYTES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    content_hash TEXT NOT NULL,
+    ruleset_hash TEXT NOT NULL,
+    scanner_version TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (content_hash, ruleset_hash, scanner_version)
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    last_access REAL NOT NULL DEFAULT 0
+);
+"""
+
+# Created once caches from before file_hashes.last_access have the column
+_HASH_INDEX = "CREATE INDEX IF NOT EXISTS file_hashes_last_access ON file_hashes (last_access)"
+
+
+def hash_bytes(data: bytes) -> str:
+    """Hash file content for use as a cache key"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def hash_ruleset(*parts: Any) -> str:
+    """Hash a ruleset description (any JSON-serializable values)"""
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ScanResultCache:
+    """
+    On-disk per-file findings cache with TTL and size-bounded LRU eviction
+
+    Backed by SQLite in WAL mode, so worker processes can share one cache.
+    Instances are picklable: the connection is opened lazily in each process.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_hours: float = 24,
+        max_size_mb: float = 512
+    ):
+        self.cache_dir = Path(cache_dir or os.environ.get("INTELLIGENTSCAN_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending_results: List[Tuple] = []
+        self._pending_hashes: List[Tuple] = []
+        self._pending_touches: List[Tuple] = []
+        self._pending_hash_touches: List[Tuple] = []
+
+    @classmethod
+    def from_settings(cls, enabled: Optional[bool] = None) -> Optional["ScanResultCache"]:
+        """
+        Create a cache from settings.enable_caching / cache_ttl_hours / cache_max_size_mb
+
+        Args:
+            enabled: Override settings.enable_caching
+
+        Returns:
+            Cache instance, or None if caching is disabled
+        """
+        settings = get_settings()
+        if enabled is None:
+            enabled = settings.get("enable_caching", False)
+        if not enabled:
+            return None
+
+        return cls(
+            cache_dir=settings.get("cache_dir"),
+            ttl_hours=settings.get("cache_ttl_hours", 24),
+            max_size_mb=settings.get("cache_max_size_mb", 512)
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.update(
+            _conn=None, _pending_results=[], _pending_hashes=[], _pending_touches=[], _pending_hash_touches=[],
+            hits=0, misses=0
+        )
+        return state
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the SQLite database on first use"""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.cache_dir / CACHE_FILE_NAME, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(file_hashes)")}
+            if "last_access" not in columns:
+                # Rows remembered before last_access existed expire on the next enforce_limits
+                self._conn.execute("ALTER TABLE file_hashes ADD COLUMN last_access REAL NOT NULL DEFAULT 0")
+            self._conn.execute(_HASH_INDEX)
+        return self._conn
+
+    def known_hash(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """Get the remembered content hash for a path if its size and mtime are unchanged"""
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, content_hash, last_access FROM file_hashes WHERE path = ?", (path,)
+        ).fetchone()
+
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            now = time.time()
+            if now - row[3] > HASH_TOUCH_SECONDS:
+                self._pending_hash_touches.append((now, path))
+                self._maybe_flush()
+            return row[2]
+        return None
+
+    def remember_hash(self, path: str, stat: os.stat_result, content_hash: str):
+        """Remember the content hash for a path's current stat signature"""
+        self._pending_hashes.append((path, stat.st_size, stat.st_mtime_ns, content_hash, time.time()))
+        self._maybe_flush()
+
+    def get(self, content_hash: str, ruleset_hash: str, scanner_version: str) -> Optional[Any]:
+        """
+        Look up cached findings
+
+        Returns:
+            Decoded payload, or None on a miss or expired entry
+        """
+        row = self.conn.execute(
+            "SELECT payload, created FROM results "
+            "WHERE content_hash = ? AND ruleset_hash = ? AND scanner_version = ?",
+            (content_hash, ruleset_hash, scanner_version)
+        ).fetchone()
+
+        now = time.time()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._pending_touches.append((now, content_hash, ruleset_hash, scanner_version))
+        self._maybe_flush()
+        return json.loads(row[0])
+
+    def put(self, content_hash: str, ruleset_hash: str, scanner_version: str, payload: Any):
+        """Store findings for a content hash"""
+        encoded = json.dumps(payload, separators=(",", ":"))
+        now = time.time()
+        self._pending_results.append(
+            (content_hash, ruleset_hash, scanner_version, encoded, len(encoded), now, now)
+        )
+        self._maybe_flush()
+
+    def flush(self):
+        """Commit pending writes"""
+        if not (self._pending_results or self._pending_hashes or self._pending_touches or self._pending_hash_touches):
+            return
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)", self._pending_results
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)", self._pending_hashes
+            )
+            self.conn.executemany(
+                "UPDATE results SET last_access = ? "
+                "WHERE content_hash = ? AND ruleset_hash = ? AND scanner_version = ?",
+                self._pending_touches
+            )
+            self.conn.executemany(
+                "UPDATE file_hashes SET last_access = ? WHERE path = ?", self._pending_hash_touches
+            )
+
+        self._pending_results = []
+        self._pending_hashes = []
+        self._pending_touches = []
+        self._pending_hash_touches = []
+
+    def enforce_limits(self):
+        """
+        Drop expired entries, then least recently used ones until under the size bound
+
+        Remembered file hashes expire when unused for the TTL and count toward
+        the size bound (estimated by path length) alongside the results.
+        """
+        self.flush()
+
+        with self.conn:
+            expired = time.time() - self.ttl_seconds
+            self.conn.execute("DELETE FROM results WHERE created < ?", (expired,))
+            self.conn.execute("DELETE FROM file_hashes WHERE last_access < ?", (expired,))
+
+            total = self.conn.execute(
+                "SELECT (SELECT COALESCE(SUM(size), 0) FROM results)"
+                " + (SELECT COALESCE(SUM(LENGTH(path) + ?), 0) FROM file_hashes)",
+                (HASH_ROW_BYTES,)
+            ).fetchone()[0]
+            if total <= self.max_size_bytes:
+                return
+
+            # Walk entries of both tables oldest-access first and find the cutoff that frees enough space
+            excess = total - self.max_size_bytes
+            freed = 0
+            cutoff = None
+            for last_access, size in self.conn.execute(
+                "SELECT last_access, size FROM results"
+                " UNION ALL SELECT last_access, LENGTH(path) + ? FROM file_hashes"
+                " ORDER BY last_access",
+                (HASH_ROW_BYTES,)
+            ):
+                freed += size
+                cutoff = last_access
+                if freed >= excess:
+                    break
+
+            self.conn.execute("DELETE FROM results WHERE last_access <= ?", (cutoff,))
+            self.conn.execute("DELETE FROM file_hashes WHERE last_access <= ?", (cutoff,))
+
+    def close(self):
+        """Flush and close the database connection"""
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def _maybe_flush(self):
+        """Flush once enough writes are pending"""
+        pending = (
+            len(self._pending_results) + len(self._pending_hashes)
+            + len(self._pending_touches) + len(self._pending_hash_touches)
+        )
+        if pending >= FLUSH_EVERY:
+            self.flush()
@@ -0,0 +1,392 @@
+"""
+Scan Session Store for IntelligentScan
+Keeps recently used scan sessions in memory within a size budget and spills
+the rest to SQLite, so a long-lived server does not grow with every scan.
+
+Finished sessions are written through to the store as soon as they complete;
+evicting one from memory is then just dropping the reference, and any later
+lookup by scan ID reloads it transparently. Running sessions always stay in
+memory.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from intelligentscan.utils.config_loader import get_settings
+from intelligentscan.utils.scan_cache import DEFAULT_CACHE_DIR
+
+
+SESSION_FILE_NAME = "sessions.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    scan_id TEXT PRIMARY KEY,
+    repo_path TEXT NOT NULL,
+    real_path TEXT NOT NULL,
+    scan_types TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    stored REAL NOT NULL,
+    payload BLOB NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS sessions_repo ON sessions (real_path, start_time);
+CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start_time);
+CREATE INDEX IF NOT EXISTS sessions_stored ON sessions (stored);
+"""
+
+# Columns added after the first schema: name -> definition
+_ADDED_COLUMNS = {"git_commit": "TEXT", "git_dirty": "INTEGER NOT NULL DEFAULT 1"}
+
+# Created once stores from before the added columns have them
+_COMMIT_INDEX = "CREATE INDEX IF NOT EXISTS sessions_commit ON sessions (real_path, git_commit, start_time)"
+
+
+class SessionStore:
+    """
+    Scan sessions by scan ID, bounded in memory with LRU and idle-time eviction
+
+    Sessions are any objects with scan_id, repo_path, status, start_time
+    (datetime) and results (scan type -> results) attributes plus a
+    to_record() method returning a JSON-serializable dict; restore turns such
+    a record back into a session. Optional git_commit and git_dirty
+    attributes are stored alongside, so baselines can be looked up by commit
+    without loading sessions. The memory budget is checked against the
+    serialized size of each finished session, a stable proxy for the memory
+    its results hold.
+
+    Methods may be called from executor threads; an internal lock guards the
+    in-memory index and the database connection.
+    """
+
+    def __init__(
+        self,
+        restore: Callable[[Dict[str, Any]], Any],
+        store_path: Optional[Path] = None,
+        memory_budget_mb: float = 256,
+        idle_minutes: float = 30,
+        retention_days: float = 7,
+        max_store_mb: float = 1024
+    ):
+        self.restore = restore
+        self.store_path = store_path
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self.idle_seconds = idle_minutes * 60
+        self.retention_seconds = retention_days * 86400
+        self.max_store_bytes = int(max_store_mb * 1024 * 1024)
+        self.stats = {"evicted": 0, "reloaded": 0, "deleted": 0}
+
+        # scan_id -> session, least recently used first
+        self._live: "OrderedDict[str, Any]" = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+        # Serialized size of live sessions that are safely in the store
+        self._persisted: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_settings(cls, restore: Callable[[Dict[str, Any]], Any]) -> "SessionStore":
+        """
+        Create a store from settings.session_memory_mb / session_idle_minutes /
+        session_retention_days / session_store_max_mb, kept in the cache directory
+
+        Args:
+            restore: Builds a session from the record its to_record() returned
+        """
+        settings = get_settings()
+        cache_dir = Path(settings.get("cache_dir") or os.environ.get("INTELLIGENTSCAN_CACHE_DIR", DEFAULT_CACHE_DIR))
+        return cls(
+            restore,
+            cache_dir / SESSION_FILE_NAME,
+            memory_budget_mb=settings.get("session_memory_mb", 256),
+            idle_minutes=settings.get("session_idle_minutes", 30),
+            retention_days=settings.get("session_retention_days", 7),
+            max_store_mb=settings.get("session_store_max_mb", 1024)
+        )
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the SQLite database on first use (in memory if there is no store path)"""
+        if self._conn is None:
+            if self.store_path is None:
+                target = ":memory:"
+            else:
+                self.store_path.parent.mkdir(parents=True, exist_ok=True)
+                target = str(self.store_path)
+            self._conn = sqlite3.connect(target, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")}
+            for name, definition in _ADDED_COLUMNS.items():
+                if name not in columns:
+                    # Sessions stored before have no commit and never match a commit lookup
+                    self._conn.execute(f"ALTER TABLE sessions ADD COLUMN {name} {definition}")
+            self._conn.execute(_COMMIT_INDEX)
+        return self._conn
+
+    @property
+    def memory_bytes(self) -> int:
+        """Serialized size of the finished sessions held in memory"""
+        return self._memory_bytes
+
+    def register(self, session: Any) -> bool:
+        """
+        Add a new (usually running) session unless its scan ID is taken
+
+        The check and the insert happen under the store lock, so two
+        registrations of the same scan ID can never both succeed.
+
+        Returns:
+            False if a session with this scan ID is in memory or in the store
+        """
+        with self._lock:
+            if session.scan_id in self:
+                return False
+            self._live[session.scan_id] = session
+            self._last_access[session.scan_id] = time.monotonic()
+            return True
+
+    def save(self, session: Any):
+        """
+        Write a finished session to the store, then evict sessions over budget
+
+        Until this succeeds the session is never evicted from memory.
+
+        Raises:
+            sqlite3.Error: If the session could not be stored
+        """
+        payload = json.dumps(session.to_record(), default=str).encode("utf-8")
+        blob = zlib.compress(payload, 6)
+        row = (
+            session.scan_id,
+            session.repo_path,
+            os.path.realpath(session.repo_path),
+            json.dumps(sorted(session.results)),
+            session.status,
+            session.start_time.isoformat(),
+            len(payload),
+            len(blob),
+            time.time(),
+            blob,
+            getattr(session, "git_commit", None),
+            int(getattr(session, "git_dirty", True)),
+        )
+
+        with self._lock:
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+            if self._live.get(session.scan_id) is session:
+                self._memory_bytes += len(payload) - self._persisted.get(session.scan_id, 0)
+                self._persisted[session.scan_id] = len(payload)
+            self._enforce_store_limits()
+            self._evict()
+
+    def get(self, scan_id: str) -> Optional[Any]:
+        """
+        Get a session, reloading it from the store if it was evicted
+
+        Returns:
+            Session, or None if the scan ID is unknown
+        """
+        with self._lock:
+            session = self._live.get(scan_id)
+            if session is not None:
+                self._live.move_to_end(scan_id)
+                self._last_access[scan_id] = time.monotonic()
+                self._evict(keep=scan_id)
+                return session
+
+            row = self.conn.execute("SELECT size, payload FROM sessions WHERE scan_id = ?", (scan_id,)).fetchone()
+            if row is None:
+                return None
+
+            size, blob = row
+            session = self.restore(json.loads(zlib.decompress(blob)))
+            self._live[scan_id] = session
+            self._last_access[scan_id] = time.monotonic()
+            self._persisted[scan_id] = size
+            self._memory_bytes += size
+            self.stats["reloaded"] += 1
+
+            # Keep the reloaded session even if it alone exceeds the budget
+            self._evict(keep=scan_id)
+            return session
+
+    def __contains__(self, scan_id: str) -> bool:
+        with self._lock:
+            if scan_id in self._live:
+                return True
+            return self.conn.execute("SELECT 1 FROM sessions WHERE scan_id = ?", (scan_id,)).fetchone() is not None
+
+    def latest(
+        self,
+        repo_path: str,
+        scan_type: str,
+        exclude: Optional[str] = None,
+        git_commit: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Find the most recently started completed session of a repository and scan type
+
+        Args:
+            repo_path: Repository path (compared after resolving symlinks)
+            scan_type: Scan type the session must have results for
+            exclude: Scan ID to skip, e.g. the session looking for a baseline
+            git_commit: Only consider sessions that scanned this commit with
+                        no uncommitted changes; matched on stored columns,
+                        so only the session returned is loaded
+
+        Returns:
+            Session (reloaded if needed), or None
+        """
+        real_path = os.path.realpath(repo_path)
+        query = "SELECT scan_id, start_time, scan_types FROM sessions WHERE real_path = ? AND status = 'completed'"
+        params: Tuple[Any, ...] = (real_path,)
+        if git_commit is not None:
+            query += " AND git_commit = ? AND git_dirty = 0"
+            params += (git_commit,)
+        best: Optional[Tuple[str, str]] = None
+
+        with self._lock:
+            for scan_id, start_time, scan_types in self.conn.execute(query + " ORDER BY start_time DESC", params):
+                if scan_id != exclude and scan_type in json.loads(scan_types):
+                    best = (start_time, scan_id)
+                    break
+
+            # Completed sessions not (yet) written to the store
+            for scan_id, session in self._live.items():
+                if (
+                    scan_id != exclude
+                    and scan_id not in self._persisted
+                    and session.status == "completed"
+                    and scan_type in session.results
+                    and os.path.realpath(session.repo_path) == real_path
+                    and (git_commit is None or (
+                        getattr(session, "git_commit", None) == git_commit
+                        and not getattr(session, "git_dirty", True)
+                    ))
+                    and (best is None or session.start_time.isoformat() > best[0])
+                ):
+                    best = (session.start_time.isoformat(), scan_id)
+
+            return self.get(best[1]) if best is not None else None
+
+    def newest(self) -> Optional[Any]:
+        """Most recently started session, running or not"""
+        with self._lock:
+            best: Optional[Tuple[str, str]] = None
+            row = self.conn.execute("SELECT start_time, scan_id FROM sessions ORDER BY start_time DESC LIMIT 1").fetchone()
+            if row is not None:
+                best = (row[0], row[1])
+            for scan_id, session in self._live.items():
+                if best is None or session.start_time.isoformat() > best[0]:
+                    best = (session.start_time.isoformat(), scan_id)
+
+            return self.get(best[1]) if best is not None else None
+
+    def summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Status of every known session without loading any results, oldest first"""
+        with self._lock:
+            summaries = {
+                scan_id: {
+                    "repo_path": repo_path,
+                    "status": status,
+                    "start_time": start_time,
+                    "scan_types": json.loads(scan_types),
+                }
+                for scan_id, repo_path, status, start_time, scan_types in self.conn.execute(
+                    "SELECT scan_id, repo_path, status, start_time, scan_types FROM sessions ORDER BY start_time"
+                )
+            }
+            for scan_id, session in self._live.items():
+                if scan_id not in self._persisted:
+                    summaries[scan_id] = {
+                        "repo_path": session.repo_path,
+                        "status": session.status,
+                        "start_time": session.start_time.isoformat(),
+                        "scan_types": list(session.results),
+                    }
+            return summaries
+
+    def memory_stats(self) -> Dict[str, Any]:
+        """Sessions in memory and in the store, for monitoring"""
+        with self._lock:
+            stored, stored_bytes = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(stored_size), 0) FROM sessions"
+            ).fetchone()
+            return {
+                "sessions_in_memory": len(self._live),
+                "memory_bytes": self._memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "sessions_stored": stored,
+                "stored_bytes": stored_bytes,
+                **self.stats,
+            }
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _drop(self, scan_id: str):
+        """Forget a session's in-memory copy"""
+        self._live.pop(scan_id, None)
+        self._last_access.pop(scan_id, None)
+        self._memory_bytes -= self._persisted.pop(scan_id, 0)
+
+    def _evict(self, keep: Optional[str] = None):
+        """Drop stored sessions from memory that are idle too long or over the budget, LRU first"""
+        now = time.monotonic()
+        for scan_id in list(self._live):
+            if self._memory_bytes <= self.memory_budget_bytes and now - self._last_access[scan_id] < self.idle_seconds:
+                # Everything after this one was used more recently
+                break
+            if scan_id == keep or scan_id not in self._persisted:
+                continue
+            self._drop(scan_id)
+            self.stats["evicted"] += 1
+
+    def _enforce_store_limits(self):
+        """Delete stored sessions past retention, then the oldest ones until under the size bound"""
+        deleted: List[str] = []
+        with self.conn:
+            cutoff = time.time() - self.retention_seconds
+            deleted.extend(row[0] for row in self.conn.execute("SELECT scan_id FROM sessions WHERE stored < ?", (cutoff,)))
+
+            # Size of what remains once the expired rows above are gone
+            total = self.conn.execute(
+                "SELECT COALESCE(SUM(stored_size), 0) FROM sessions WHERE stored >= ?", (cutoff,)
+            ).fetchone()[0]
+            if total > self.max_store_bytes:
+                excess = total - self.max_store_bytes
+                for scan_id, stored_size in self.conn.execute(
+                    "SELECT scan_id, stored_size FROM sessions WHERE stored >= ? ORDER BY stored", (cutoff,)
+                ):
+                    if excess <= 0:
+                        break
+                    deleted.append(scan_id)
+                    excess -= stored_size
+
+            self.conn.executemany("DELETE FROM sessions WHERE scan_id = ?", [(scan_id,) for scan_id in deleted])
+
+        for scan_id in deleted:
+            # A live copy can no longer be reloaded once evicted, so let it go now
+            session = self._live.get(scan_id)
+            if session is not None and session.status != "running":
+                self._drop(scan_id)
+        self.stats["deleted"] += len(deleted)
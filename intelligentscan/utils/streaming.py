@@ -0,0 +1,235 @@
+"""
+Streaming Serialization for IntelligentScan
+Writes reports and knowledge graphs in bounded chunks instead of building
+one pretty-printed string of the whole document.
+
+iter_json lays dicts out with indentation and writes every item of a list on
+a line of its own, encoded in one call to the C encoder (orjson when it is
+installed), so a list of 500k findings costs 500k fast calls rather than a
+pure-Python walk of every nested value. Lists can be given as a StreamedList
+so their items are produced while writing and never held all at once.
+
+iter_msgpack is the optional compact binary form; it needs the msgpack
+package.
+"""
+
+import json
+from collections.abc import Iterator as IteratorABC
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Approximate size of each chunk handed to the writer
+CHUNK_SIZE = 64 * 1024
+
+# Binary formats and the package each one needs
+BINARY_FORMATS = {"msgpack": "msgpack"}
+
+
+class StreamedList:
+    """
+    A list whose items are produced while it is being written
+
+    Args:
+        items: Function returning a fresh iterator over the items
+        length: Number of items (msgpack writes it before the items)
+    """
+
+    __slots__ = ("items", "length")
+
+    def __init__(self, items: Callable[[], Iterable[Any]], length: int):
+        self.items = items
+        self.length = length
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items())
+
+    def __len__(self) -> int:
+        return self.length
+
+
+def chunked(pieces: Iterable[Any], chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Join small str (or bytes) pieces into chunks of about chunk_size
+
+    Args:
+        pieces: Pieces of one document, all str or all bytes
+        chunk_size: Approximate size of each chunk
+
+    Returns:
+        Iterator over chunks that join into the same document
+    """
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield buffer[0][:0].join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield buffer[0][:0].join(buffer)
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, (list, tuple, StreamedList, IteratorABC))
+
+
+def _value_encoder(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], str]:
+    """Compact one-call JSON encoder for a single value"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+
+        def encode(value: Any) -> str:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+
+        return encode
+
+    return json.JSONEncoder(default=default).encode
+
+
+def _key(key: Any) -> str:
+    """Dict key as JSON object keys are written (json.dumps converts non-string keys the same way)"""
+    return json.dumps(key if isinstance(key, str) else json.dumps(key))
+
+
+def _json_pieces(value: Any, level: int, indent: Optional[int], encode: Callable[[Any], str]) -> Iterator[str]:
+    """Small pieces of JSON text for value at nesting level"""
+    if isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        inner = "\n" + " " * (indent * (level + 1)) if indent is not None else ""
+        yield "{"
+        separator = inner
+        for key, item in value.items():
+            yield f"{separator}{_key(key)}: "
+            separator = "," + inner
+            if isinstance(item, dict) or _is_list(item):
+                yield from _json_pieces(item, level + 1, indent, encode)
+            else:
+                yield encode(item)
+        yield ("\n" + " " * (indent * level) if indent is not None else "") + "}"
+
+    elif _is_list(value):
+        inner = "\n" + " " * (indent * (level + 1)) if indent is not None else ""
+        separator = "[" + inner
+        for item in value:
+            yield separator + encode(item)
+            separator = "," + inner
+        if separator == "[" + inner:
+            yield "[]"
+        else:
+            yield ("\n" + " " * (indent * level) if indent is not None else "") + "]"
+
+    else:
+        yield encode(value)
+
+
+def iter_json(
+    value: Any,
+    indent: Optional[int] = 2,
+    chunk_size: int = CHUNK_SIZE,
+    default: Optional[Callable[[Any], Any]] = None
+) -> Iterator[str]:
+    """
+    Encode value as JSON text, chunk by chunk
+
+    Args:
+        value: JSON-serializable value; lists may be StreamedLists or iterators
+        indent: Indentation of dict levels (None for a single line)
+        chunk_size: Approximate size of each chunk in characters
+        default: Called for objects JSON cannot encode, as in json.dumps
+
+    Returns:
+        Iterator over chunks of JSON text that join into one document
+    """
+    return chunked(_json_pieces(value, 0, indent, _value_encoder(default)), chunk_size)
+
+
+def write_json(value: Any, fp: TextIO, indent: Optional[int] = 2, default: Optional[Callable[[Any], Any]] = None):
+    """Stream value as JSON to a text file object"""
+    for chunk in iter_json(value, indent, default=default):
+        fp.write(chunk)
+
+
+def dumps_json(value: Any, indent: Optional[int] = 2, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode value as one JSON string with the streaming layout (faster than json.dumps with indent)"""
+    return "".join(iter_json(value, indent, default=default))
+
+
+def _require_msgpack():
+    if msgpack is None:
+        raise ValueError("The msgpack format needs the msgpack package (pip install msgpack)")
+
+
+def iter_msgpack(
+    value: Any,
+    chunk_size: int = CHUNK_SIZE,
+    default: Optional[Callable[[Any], Any]] = None
+) -> Iterator[bytes]:
+    """
+    Encode value as MessagePack, chunk by chunk
+
+    Dicts and lists are written header first, so large lists are packed one
+    item at a time. Iterators of unknown length are collected first.
+
+    Args:
+        value: Value to encode; lists may be StreamedLists or iterators
+        chunk_size: Approximate size of each chunk in bytes
+        default: Called for objects msgpack cannot encode
+
+    Returns:
+        Iterator over chunks of bytes that join into one MessagePack document
+
+    Raises:
+        ValueError: If msgpack is not installed
+    """
+    _require_msgpack()
+    packer = msgpack.Packer(default=default, use_bin_type=True)
+
+    # Same layout as iter_json: dicts are walked, list items are packed whole
+    def pieces(item: Any) -> Iterator[bytes]:
+        if isinstance(item, dict):
+            yield packer.pack_map_header(len(item))
+            for key, child in item.items():
+                yield packer.pack(key)
+                yield from pieces(child)
+        elif _is_list(item):
+            if isinstance(item, IteratorABC):
+                item = list(item)
+            yield packer.pack_array_header(len(item))
+            for child in item:
+                yield packer.pack(child)
+        else:
+            yield packer.pack(item)
+
+    return chunked(pieces(value), chunk_size)
+
+
+def write_binary(
+    value: Any,
+    fp: BinaryIO,
+    output_format: str = "msgpack",
+    default: Optional[Callable[[Any], Any]] = None
+):
+    """
+    Stream value to a binary file object
+
+    Raises:
+        ValueError: If the format is unknown or its package is not installed
+    """
+    if output_format not in BINARY_FORMATS:
+        raise ValueError(f"Unsupported binary format: {output_format}. Expected one of {list(BINARY_FORMATS)}")
+    for chunk in iter_msgpack(value, default=default):
+        fp.write(chunk)